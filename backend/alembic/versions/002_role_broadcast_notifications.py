@@ -0,0 +1,54 @@
+"""Role-broadcast notifications and per-user read cursors
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+userrole_enum = PG_ENUM(
+    "artist", "team_lead", "supervisor", "line_producer",
+    "data_team", "it_team", "admin",
+    name="userrole", create_type=False,
+)
+
+
+def upgrade() -> None:
+    op.add_column("notifications", sa.Column("target_role", userrole_enum, nullable=True))
+    op.alter_column("notifications", "user_id", existing_type=sa.Integer(), nullable=True)
+    op.create_index("ix_notifications_target_role", "notifications", ["target_role"])
+    op.create_check_constraint(
+        "ck_notifications_user_or_role",
+        "notifications",
+        "(user_id IS NULL) <> (target_role IS NULL)",
+    )
+
+    op.create_table(
+        "notification_read_cursors",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("last_read_id", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+    )
+    op.execute(
+        "INSERT INTO notification_read_cursors (user_id, last_read_id, updated_at) "
+        "SELECT id, 0, now() FROM users"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("notification_read_cursors")
+
+    op.execute("DELETE FROM notifications WHERE user_id IS NULL")
+    op.drop_constraint("ck_notifications_user_or_role", "notifications", type_="check")
+    op.drop_index("ix_notifications_target_role", table_name="notifications")
+    op.alter_column("notifications", "user_id", existing_type=sa.Integer(), nullable=False)
+    op.drop_column("notifications", "target_role")
@@ -0,0 +1,34 @@
+"""Composite (created_at, id) indexes for keyset pagination
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = [
+    ("ix_transfers_created_at_id", "transfers", ["created_at", "id"]),
+    ("ix_transfers_artist_created_at_id", "transfers", ["artist_id", "created_at", "id"]),
+    ("ix_transfers_status_created_at_id", "transfers", ["status", "created_at", "id"]),
+    ("ix_transfer_history_created_at_id", "transfer_history", ["created_at", "id"]),
+    ("ix_transfer_history_transfer_created_at_id", "transfer_history", ["transfer_id", "created_at", "id"]),
+    ("ix_notifications_user_created_at_id", "notifications", ["user_id", "created_at", "id"]),
+    ("ix_notifications_role_created_at_id", "notifications", ["target_role", "created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,57 @@
+"""Transfer history status and analytics rollup tables
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+transferstatus_enum = PG_ENUM(
+    "uploaded", "pending_team_lead", "pending_supervisor", "pending_line_producer",
+    "approved", "scanning", "scan_passed", "scan_failed", "copying",
+    "ready_for_transfer", "transferring", "verifying", "transferred",
+    "rejected", "cancelled",
+    name="transferstatus", create_type=False,
+)
+
+
+def upgrade() -> None:
+    op.add_column("transfer_history", sa.Column("status", transferstatus_enum, nullable=True))
+
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("source", sa.String(50), primary_key=True),
+        sa.Column("last_id", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+    )
+    op.create_table(
+        "transfer_daily_rollups",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("status", transferstatus_enum, primary_key=True),
+        sa.Column("entered", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_bytes", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.create_table(
+        "stage_duration_rollups",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("status", transferstatus_enum, primary_key=True),
+        sa.Column("bucket", sa.Integer(), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_seconds", sa.Float(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("stage_duration_rollups")
+    op.drop_table("transfer_daily_rollups")
+    op.drop_table("rollup_watermarks")
+    op.drop_column("transfer_history", "status")
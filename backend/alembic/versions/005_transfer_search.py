@@ -0,0 +1,36 @@
+"""Full-text and trigram search on transfers
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TRGM_COLUMNS = ["reference", "name", "shotgrid_entity_name"]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "ALTER TABLE transfers ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, '') || ' ' || "
+        "coalesce(notes, '') || ' ' || coalesce(shotgrid_entity_name, '') || ' ' || "
+        "coalesce(tags::text, ''))) STORED"
+    )
+    op.execute("CREATE INDEX ix_transfers_search_vector ON transfers USING gin (search_vector)")
+    for column in _TRGM_COLUMNS:
+        op.execute(f"CREATE INDEX ix_transfers_{column}_trgm ON transfers USING gin ({column} gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    for column in reversed(_TRGM_COLUMNS):
+        op.execute(f"DROP INDEX IF EXISTS ix_transfers_{column}_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_transfers_search_vector")
+    op.execute("ALTER TABLE transfers DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,52 @@
+"""Partial indexes for the unread, approval-queue and in-flight query shapes
+
+The single-column indexes they replace are all leading columns of the
+composite keyset indexes from 003.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_PARTIAL_INDEXES = [
+    ("ix_notifications_user_unread", "notifications", ["user_id", "id"], "is_read IS false"),
+    (
+        "ix_transfers_pending_created_at", "transfers", ["created_at"],
+        "status IN ('pending_team_lead', 'pending_supervisor', 'pending_line_producer')",
+    ),
+    (
+        "ix_transfers_in_flight_updated_at", "transfers", ["updated_at"],
+        "status IN ('scanning', 'copying', 'transferring', 'verifying')",
+    ),
+]
+
+_REDUNDANT_INDEXES = [
+    ("ix_transfers_status", "transfers", ["status"]),
+    ("ix_transfers_artist_id", "transfers", ["artist_id"]),
+    ("ix_transfer_history_transfer_id", "transfer_history", ["transfer_id"]),
+    ("ix_notifications_user_id", "notifications", ["user_id"]),
+    ("ix_notifications_target_role", "notifications", ["target_role"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns, where in _PARTIAL_INDEXES:
+        op.create_index(name, table, columns, postgresql_where=sa.text(where))
+    for name, table, _ in _REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, columns in reversed(_REDUNDANT_INDEXES):
+        op.create_index(name, table, columns)
+    for name, table, _, _ in reversed(_PARTIAL_INDEXES):
+        op.drop_index(name, table_name=table)
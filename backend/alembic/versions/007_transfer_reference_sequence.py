@@ -0,0 +1,30 @@
+"""Sequence for transfer references
+
+Starts after the highest existing TRF-xxxxx number so new references don't
+collide with ones handed out by the old max-reference lookup.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE transfer_reference_seq")
+    op.execute(
+        "SELECT setval('transfer_reference_seq', coalesce(("
+        "SELECT max(substring(reference FROM '^TRF-([0-9]+)$')::bigint) FROM transfers"
+        "), 0) + 1, false)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP SEQUENCE IF EXISTS transfer_reference_seq")
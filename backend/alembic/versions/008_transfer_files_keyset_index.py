@@ -0,0 +1,30 @@
+"""Keyset index for paging a transfer's files
+
+Replaces the single-column transfer_id index, which is its leading column.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transfer_files_transfer_uploaded_at_id",
+        "transfer_files",
+        ["transfer_id", "uploaded_at", "id"],
+    )
+    op.drop_index("ix_transfer_files_transfer_id", table_name="transfer_files")
+
+
+def downgrade() -> None:
+    op.create_index("ix_transfer_files_transfer_id", "transfer_files", ["transfer_id"])
+    op.drop_index("ix_transfer_files_transfer_uploaded_at_id", table_name="transfer_files")
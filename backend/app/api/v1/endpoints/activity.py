@@ -2,20 +2,26 @@ from __future__ import annotations
 
 import math
 from datetime import datetime
-from typing import Annotated, List, Optional
+from typing import Annotated, Callable, List, Optional
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.core.database import get_db
-from backend.app.core.dependencies import get_current_user
+from backend.app.core.database import get_read_db, get_stream_session
+from backend.app.core.dependencies import get_current_user, require_role
+from backend.app.core.pagination import CountMode, count_rows, keyset_page, split_page
+from backend.app.core.principal import Principal
+from backend.app.core.streaming import ExportFormat, export_response
 from backend.app.models.history import TransferHistory
-from backend.app.models.user import User
+from backend.app.models.transfer import TransferStatus
 
 router = APIRouter()
 
+# The export spans every transfer, so it's limited to the roles that see them all.
+_auditor = require_role("admin", "supervisor", "line_producer")
+
 
 class HistoryEntry(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -24,6 +30,7 @@ class HistoryEntry(BaseModel):
     transfer_id: int
     user_id: Optional[int] = None
     action: str
+    status: Optional[TransferStatus] = None
     description: Optional[str] = None
     metadata_json: Optional[dict] = None
     ip_address: Optional[str] = None
@@ -33,47 +40,79 @@ class HistoryEntry(BaseModel):
 
 class HistoryListResponse(BaseModel):
     items: List[HistoryEntry]
-    total: int
+    total: Optional[int] = None
+    total_estimated: bool = False
     page: int
     per_page: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+def _filters(transfer_id, user_id, action, since=None, until=None) -> list:
+    filters = []
+    if transfer_id is not None:
+        filters.append(TransferHistory.transfer_id == transfer_id)
+    if user_id is not None:
+        filters.append(TransferHistory.user_id == user_id)
+    if action:
+        filters.append(TransferHistory.action == action)
+    if since is not None:
+        filters.append(TransferHistory.created_at >= since)
+    if until is not None:
+        filters.append(TransferHistory.created_at < until)
+    return filters
 
 
 @router.get("/", response_model=HistoryListResponse)
 async def list_activity(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    _: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    _: Annotated[Principal, Depends(get_current_user)],
     transfer_id: Optional[int] = Query(None),
     user_id: Optional[int] = Query(None),
     action: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, max_length=200),
+    count: CountMode = Query("exact"),
 ):
-    query = select(TransferHistory).order_by(TransferHistory.created_at.desc())
-    count_q = select(func.count()).select_from(TransferHistory)
-
-    if transfer_id is not None:
-        query = query.where(TransferHistory.transfer_id == transfer_id)
-        count_q = count_q.where(TransferHistory.transfer_id == transfer_id)
-
-    if user_id is not None:
-        query = query.where(TransferHistory.user_id == user_id)
-        count_q = count_q.where(TransferHistory.user_id == user_id)
-
-    if action:
-        query = query.where(TransferHistory.action == action)
-        count_q = count_q.where(TransferHistory.action == action)
-
-    total = (await db.execute(count_q)).scalar() or 0
-    query = query.offset((page - 1) * per_page).limit(per_page)
+    filters = _filters(transfer_id, user_id, action)
+    total, estimated = await count_rows(db, TransferHistory, filters, count)
+    query = keyset_page(
+        select(TransferHistory).where(*filters),
+        TransferHistory.created_at, TransferHistory.id,
+        cursor=cursor, page=page, per_page=per_page,
+    )
     result = await db.execute(query)
+    rows, next_cursor = split_page(result.scalars().all(), per_page, lambda h: (h.created_at, h.id))
 
-    items = [HistoryEntry.model_validate(h) for h in result.scalars().all()]
+    items = [HistoryEntry.model_validate(h) for h in rows]
 
     return HistoryListResponse(
         items=items,
         total=total,
+        total_estimated=estimated,
         page=page,
         per_page=per_page,
-        pages=math.ceil(total / per_page) if total else 0,
+        pages=None if total is None else math.ceil(total / per_page),
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/export")
+async def export_activity(
+    open_session: Annotated[Callable, Depends(get_stream_session)],
+    _: Annotated[Principal, Depends(_auditor)],
+    format: ExportFormat = Query("ndjson"),
+    transfer_id: Optional[int] = Query(None),
+    user_id: Optional[int] = Query(None),
+    action: Optional[str] = Query(None),
+    since: Optional[datetime] = Query(None),
+    until: Optional[datetime] = Query(None),
+):
+    """The whole matching audit trail, oldest first, streamed as NDJSON or CSV."""
+    query = (
+        select(*(getattr(TransferHistory, field) for field in HistoryEntry.model_fields))
+        .where(*_filters(transfer_id, user_id, action, since, until))
+        .order_by(TransferHistory.created_at, TransferHistory.id)
     )
+    return export_response(open_session, query, HistoryEntry, format, "activity")
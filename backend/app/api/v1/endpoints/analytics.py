@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Annotated, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.database import get_read_db
+from backend.app.core.dependencies import require_role
+from backend.app.core.principal import Principal
+from backend.app.models.transfer import TransferStatus
+from backend.app.schemas.analytics import Period, StageDurationResponse, ThroughputResponse
+from backend.app.services.analytics_service import analytics_service
+
+router = APIRouter()
+
+_analyst = require_role("admin", "supervisor", "line_producer")
+
+
+def _date_range(since: Optional[date], until: Optional[date]) -> Tuple[date, date]:
+    until = until or datetime.now(timezone.utc).date()
+    since = since or until - timedelta(days=30)
+    if since > until:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'since' is after 'until'")
+    return since, until
+
+
+@router.get("/throughput", response_model=ThroughputResponse)
+async def throughput(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    _: Annotated[Principal, Depends(_analyst)],
+    period: Period = Query("day"),
+    since: Optional[date] = Query(None),
+    until: Optional[date] = Query(None),
+):
+    since, until = _date_range(since, until)
+    return await analytics_service.throughput(db, since, until, period)
+
+
+@router.get("/stage-durations", response_model=StageDurationResponse)
+async def stage_durations(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    _: Annotated[Principal, Depends(_analyst)],
+    period: Period = Query("day"),
+    since: Optional[date] = Query(None),
+    until: Optional[date] = Query(None),
+    stage: Optional[List[TransferStatus]] = Query(None),
+):
+    since, until = _date_range(since, until)
+    return await analytics_service.stage_durations(db, since, until, period, stages=stage)
@@ -7,11 +7,18 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.api.v1.endpoints.transfers import _build_transfer_response
-from backend.app.core.database import get_db
+from backend.app.core.database import get_db, get_read_db
 from backend.app.core.dependencies import get_current_user
-from backend.app.models.user import User
-from backend.app.schemas.approval import ApprovalAction, RejectAction
-from backend.app.schemas.transfer import ApprovalChainItem, TransferResponse
+from backend.app.core.principal import Principal
+from backend.app.core.responses import APIJSONResponse
+from backend.app.schemas.approval import (
+    ApprovalAction,
+    BulkApprovalAction,
+    BulkApprovalResponse,
+    BulkRejectAction,
+    RejectAction,
+)
+from backend.app.schemas.transfer import ApprovalChainItem, TransferResponse, TransferSummary
 from backend.app.services.approval_service import approval_service
 
 router = APIRouter()
@@ -24,24 +31,44 @@ class OverrideRequest(BaseModel):
 
 # ── Pending items for current user ───────────────────────────────
 
-@router.get("/pending", response_model=List[TransferResponse])
+@router.get("/pending", response_model=List[TransferSummary])
 async def get_pending(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
-    transfers = await approval_service.get_pending(current_user, db)
-    return [_build_transfer_response(t) for t in transfers]
+    return APIJSONResponse(await approval_service.get_pending(current_user, db))
 
 
 @router.get("/pending/count")
 async def get_pending_count(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
     count = await approval_service.get_pending_count(current_user, db)
     return {"count": count}
 
 
+# ── Bulk approve / reject ────────────────────────────────────────
+# Declared before /{transfer_id}/... so "bulk" isn't read as a transfer id.
+
+@router.post("/bulk/approve", response_model=BulkApprovalResponse)
+async def bulk_approve(
+    payload: BulkApprovalAction,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+):
+    return await approval_service.bulk_approve(payload.transfer_ids, current_user, payload.comment, db)
+
+
+@router.post("/bulk/reject", response_model=BulkApprovalResponse)
+async def bulk_reject(
+    payload: BulkRejectAction,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+):
+    return await approval_service.bulk_reject(payload.transfer_ids, current_user, payload.reason, db)
+
+
 # ── Approve ──────────────────────────────────────────────────────
 
 @router.post("/{transfer_id}/approve", response_model=TransferResponse)
@@ -49,7 +76,7 @@ async def approve_transfer(
     transfer_id: int,
     payload: ApprovalAction,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
     transfer = await approval_service.approve(
         transfer_id, current_user, payload.comment, db,
@@ -64,7 +91,7 @@ async def reject_transfer(
     transfer_id: int,
     payload: RejectAction,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
     transfer = await approval_service.reject(
         transfer_id, current_user, payload.reason, db,
@@ -78,7 +105,7 @@ async def reject_transfer(
 async def get_approval_chain(
     transfer_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: Annotated[User, Depends(get_current_user)],
+    _: Annotated[Principal, Depends(get_current_user)],
 ):
     return await approval_service.get_approval_chain(transfer_id, db)
 
@@ -90,7 +117,7 @@ async def admin_override(
     transfer_id: int,
     payload: OverrideRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
     transfer = await approval_service.admin_override(
         transfer_id, payload.target_status, current_user, payload.reason, db,
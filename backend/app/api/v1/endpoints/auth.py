@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.database import get_db
 from backend.app.core.dependencies import bearer_scheme, blacklist_token, get_current_user
+from backend.app.core.principal import Principal
+from backend.app.core.revocation import token_revocations
 from backend.app.core.security import decode_token
 from backend.app.models.user import User
 from backend.app.schemas.user import TokenResponse, UserLogin, UserResponse
@@ -31,9 +34,14 @@ async def login(
 
 @router.get("/me", response_model=UserResponse)
 async def get_me(
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
-    return current_user
+    result = await db.execute(select(User).where(User.id == current_user.id))
+    user = result.scalar_one_or_none()
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return user
 
 
 @router.post("/refresh", response_model=TokenResponse)
@@ -55,7 +63,11 @@ async def logout(
         exp = payload.get("exp", 0)
         ttl = max(int(exp - time.time()), 1)
     except Exception:
+        payload = {}
         ttl = 3600
 
-    blacklist_token(token, ttl)
+    if payload.get("jti"):
+        await token_revocations.revoke(payload["jti"], ttl)
+    else:
+        await blacklist_token(token, ttl)
     return {"message": "Logged out"}
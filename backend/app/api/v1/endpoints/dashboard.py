@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Annotated, AsyncContextManager, Callable
+
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.core.database import get_read_sessions
+from backend.app.core.dependencies import get_current_user
+from backend.app.core.principal import Principal
+from backend.app.schemas.dashboard import DashboardResponse
+from backend.app.services.dashboard_service import dashboard_service
+
+router = APIRouter()
+
+
+@router.get("/", response_model=DashboardResponse)
+async def get_dashboard(
+    open_session: Annotated[Callable[[], AsyncContextManager[AsyncSession]], Depends(get_read_sessions)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+):
+    """Stats, pending-approval count, unread notifications and recent
+    transfers, read concurrently on separate connections."""
+    return Response(
+        await dashboard_service.render(open_session, current_user),
+        media_type="application/json",
+        headers={"Cache-Control": f"private, max-age={settings.DASHBOARD_CACHE_TTL_SECONDS}"},
+    )
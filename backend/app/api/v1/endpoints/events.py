@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.core.database import get_db
+from backend.app.core.dependencies import get_current_user, get_stream_user
+from backend.app.core.events import Subscription, event_hub, format_sse
+from backend.app.core.principal import Principal
+from backend.app.core.security import create_stream_ticket
+from backend.app.services.notification_service import notification_service
+
+router = APIRouter()
+
+
+async def _event_stream(request: Request, sub: Subscription, snapshot: dict):
+    try:
+        yield f"retry: {settings.EVENTS_RETRY_MS}\n\n"
+        yield format_sse("ready", snapshot)
+        while True:
+            if await request.is_disconnected():
+                break
+            try:
+                payload = await asyncio.wait_for(
+                    sub.queue.get(), timeout=settings.EVENTS_KEEPALIVE_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield format_sse(payload.get("type", "message"), payload)
+    finally:
+        event_hub.unsubscribe(sub)
+
+
+@router.post("/ticket")
+async def stream_ticket(
+    current_user: Annotated[Principal, Depends(get_current_user)],
+):
+    return {
+        "ticket": create_stream_ticket(current_user.username),
+        "expires_in": settings.EVENTS_TICKET_TTL_SECONDS,
+    }
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[Principal, Depends(get_stream_user)],
+):
+    # Subscribe before taking the snapshot so nothing committed in between is lost.
+    sub = event_hub.subscribe(current_user.id, current_user.role)
+    unread = await notification_service.unread_count(db, current_user)
+
+    return StreamingResponse(
+        _event_stream(request, sub, {"user_id": current_user.id, "unread_count": unread}),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,19 +1,15 @@
 from __future__ import annotations
 
-import math
-from datetime import datetime
-from typing import Annotated, List, Optional
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, ConfigDict
-from sqlalchemy import func, select, update
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.database import get_db
 from backend.app.core.dependencies import get_current_user
-from backend.app.models.notification import Notification
-from backend.app.models.user import User
+from backend.app.core.principal import Principal
 from backend.app.schemas.notification import NotificationListResponse, NotificationResponse
+from backend.app.services.notification_service import notification_service
 
 router = APIRouter()
 
@@ -21,53 +17,28 @@ router = APIRouter()
 @router.get("/", response_model=NotificationListResponse)
 async def list_notifications(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, max_length=200),
 ):
-    base_filter = Notification.user_id == current_user.id
-
-    total = (await db.execute(
-        select(func.count()).select_from(Notification).where(base_filter)
-    )).scalar() or 0
-
-    unread_count = (await db.execute(
-        select(func.count()).select_from(Notification).where(
-            base_filter, Notification.is_read.is_(False),
-        )
-    )).scalar() or 0
-
-    query = (
-        select(Notification)
-        .where(base_filter)
-        .order_by(Notification.created_at.desc())
-        .offset((page - 1) * per_page)
-        .limit(per_page)
+    items, total, unread_count, next_cursor = await notification_service.list_for_user(
+        db, current_user, page=page, per_page=per_page, cursor=cursor,
     )
-    result = await db.execute(query)
-    items = [
-        NotificationResponse.model_validate(n)
-        for n in result.scalars().all()
-    ]
-
     return NotificationListResponse(
         items=items,
         total=total,
         unread_count=unread_count,
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/unread/count")
 async def unread_count(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
-    count = (await db.execute(
-        select(func.count()).select_from(Notification).where(
-            Notification.user_id == current_user.id,
-            Notification.is_read.is_(False),
-        )
-    )).scalar() or 0
+    count = await notification_service.unread_count(db, current_user)
     return {"count": count}
 
 
@@ -75,37 +46,15 @@ async def unread_count(
 async def mark_read(
     notification_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
-    result = await db.execute(
-        select(Notification).where(
-            Notification.id == notification_id,
-            Notification.user_id == current_user.id,
-        )
-    )
-    notif = result.scalar_one_or_none()
-    if notif is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Notification not found")
-
-    notif.is_read = True
-    await db.flush()
-    await db.commit()
-    await db.refresh(notif)
-    return NotificationResponse.model_validate(notif)
+    return await notification_service.mark_read(db, current_user, notification_id)
 
 
 @router.put("/read-all")
 async def mark_all_read(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
-    await db.execute(
-        update(Notification)
-        .where(
-            Notification.user_id == current_user.id,
-            Notification.is_read.is_(False),
-        )
-        .values(is_read=True)
-    )
-    await db.commit()
+    await notification_service.mark_all_read(db, current_user)
     return {"message": "All notifications marked as read"}
@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.database import get_db
 from backend.app.core.dependencies import get_current_user
-from backend.app.models.user import User
+from backend.app.core.principal import Principal
 from backend.app.services.shotgrid_service import shotgrid_service
 
 router = APIRouter()
@@ -22,7 +22,7 @@ class LinkRequest(BaseModel):
 
 @router.get("/projects")
 async def list_projects(
-    _: Annotated[User, Depends(get_current_user)],
+    _: Annotated[Principal, Depends(get_current_user)],
 ):
     projects = await shotgrid_service.get_projects()
     return {"projects": projects, "total": len(projects)}
@@ -31,7 +31,7 @@ async def list_projects(
 @router.get("/projects/{project_id}/shots")
 async def list_shots(
     project_id: int,
-    _: Annotated[User, Depends(get_current_user)],
+    _: Annotated[Principal, Depends(get_current_user)],
     sequence: Optional[str] = Query(None, description="Filter by sequence name"),
 ):
     shots = await shotgrid_service.get_shots(project_id, sequence=sequence)
@@ -41,7 +41,7 @@ async def list_shots(
 @router.get("/projects/{project_id}/assets")
 async def list_assets(
     project_id: int,
-    _: Annotated[User, Depends(get_current_user)],
+    _: Annotated[Principal, Depends(get_current_user)],
     asset_type: Optional[str] = Query(None, description="Filter by asset type"),
 ):
     assets = await shotgrid_service.get_assets(project_id, asset_type=asset_type)
@@ -52,7 +52,7 @@ async def list_assets(
 async def list_tasks(
     entity_type: str,
     entity_id: int,
-    _: Annotated[User, Depends(get_current_user)],
+    _: Annotated[Principal, Depends(get_current_user)],
 ):
     tasks = await shotgrid_service.get_tasks(entity_type, entity_id)
     return {"tasks": tasks, "total": len(tasks)}
@@ -62,7 +62,7 @@ async def list_tasks(
 async def link_transfer_to_entity(
     payload: LinkRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: Annotated[User, Depends(get_current_user)],
+    _: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         transfer = await shotgrid_service.link_transfer(
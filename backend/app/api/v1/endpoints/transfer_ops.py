@@ -6,11 +6,13 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.api.v1.endpoints.transfers import _build_transfer_response
-from backend.app.core.database import get_db
+from backend.app.core.database import get_db, get_read_db
 from backend.app.core.dependencies import get_current_user
-from backend.app.models.user import User
+from backend.app.core.principal import Principal
 from backend.app.schemas.transfer import TransferResponse
+from backend.app.services.progress_service import progress_service
 from backend.app.services.transfer_ops_service import transfer_ops_service
+from backend.app.services.transfer_service import transfer_service
 
 router = APIRouter()
 
@@ -19,7 +21,7 @@ router = APIRouter()
 async def execute_transfer(
     transfer_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
     transfer = await transfer_ops_service.initiate_transfer(transfer_id, current_user, db)
     return _build_transfer_response(transfer)
@@ -29,7 +31,18 @@ async def execute_transfer(
 async def complete_transfer(
     transfer_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
     transfer = await transfer_ops_service.complete_transfer(transfer_id, current_user, db)
     return _build_transfer_response(transfer)
+
+
+@router.get("/{transfer_id}/progress")
+async def transfer_progress(
+    transfer_id: int,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+):
+    await transfer_service.ensure_visible(transfer_id, db, current_user)
+    phases = await progress_service.get_progress(transfer_id)
+    return {"transfer_id": transfer_id, "phases": phases}
@@ -1,78 +1,73 @@
 from __future__ import annotations
 
-from typing import Annotated, List, Optional
+import math
+from typing import AbstractSet, Annotated, Callable, List, Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.core.database import get_db
+from backend.app.core.database import get_db, get_read_db, get_stream_session
 from backend.app.core.dependencies import get_current_user
-from backend.app.models.transfer import TransferCategory, TransferStatus
-from backend.app.models.user import User
+from backend.app.core.fieldsets import parse_fields
+from backend.app.core.pagination import CountMode
+from backend.app.core.principal import Principal
+from backend.app.core.responses import APIJSONResponse
+from backend.app.core.streaming import NDJSON_MEDIA_TYPE, ExportFormat, export_response, ndjson_rows
+from backend.app.models.transfer import TransferCategory, TransferFile, TransferStatus
 from backend.app.schemas.transfer import (
-    ApprovalChainItem,
+    TransferAutocompleteResponse,
+    TransferBatchResponse,
     TransferCreate,
+    TransferFileListResponse,
     TransferFileResponse,
     TransferListResponse,
     TransferResponse,
     TransferStatsResponse,
+    TransferSummary,
     TransferUpdate,
 )
-from backend.app.services.file_service import file_service
+from backend.app.services.file_service import ChecksumState, ScanStatus, file_select, file_service
 from backend.app.services.transfer_service import transfer_service
 
 router = APIRouter()
 
 
-def _build_transfer_response(transfer) -> TransferResponse:
-    files = [TransferFileResponse.model_validate(f) for f in transfer.files]
-    approval_chain = [
-        ApprovalChainItem(
-            role=a.required_role,
-            status=a.status,
-            approver_name=a.approver.display_name if a.approver else None,
-            comment=a.comment,
-            decided_at=a.decided_at,
-        )
-        for a in transfer.approvals
-    ]
-    return TransferResponse(
-        id=transfer.id,
-        reference=transfer.reference,
-        name=transfer.name,
-        description=transfer.description,
-        category=transfer.category,
-        status=transfer.status,
-        priority=transfer.priority,
-        artist_id=transfer.artist_id,
-        artist_name=transfer.artist.display_name if transfer.artist else "Unknown",
-        total_files=transfer.total_files,
-        total_size_bytes=transfer.total_size_bytes,
-        staging_path=transfer.staging_path,
-        production_path=transfer.production_path,
-        shotgrid_project_id=transfer.shotgrid_project_id,
-        shotgrid_entity_type=transfer.shotgrid_entity_type,
-        shotgrid_entity_id=transfer.shotgrid_entity_id,
-        shotgrid_entity_name=transfer.shotgrid_entity_name,
-        shotgrid_task_id=transfer.shotgrid_task_id,
-        shotgrid_version_id=transfer.shotgrid_version_id,
-        scan_started_at=transfer.scan_started_at,
-        scan_completed_at=transfer.scan_completed_at,
-        scan_result=transfer.scan_result,
-        scan_passed=transfer.scan_passed,
-        transfer_started_at=transfer.transfer_started_at,
-        transfer_completed_at=transfer.transfer_completed_at,
-        transfer_verified=transfer.transfer_verified,
-        transfer_method=transfer.transfer_method,
-        notes=transfer.notes,
-        rejection_reason=transfer.rejection_reason,
-        tags=transfer.tags,
-        created_at=transfer.created_at,
-        updated_at=transfer.updated_at,
-        files=files,
-        approval_chain=approval_chain,
-        size_display=transfer.size_display,
-    )
+# Served straight from the Transfer's attributes; the rest are built below.
+_DETAIL_FIELDS = [
+    f for f in TransferResponse.model_fields if f not in ("artist_name", "files", "approval_chain")
+]
+_FILE_FIELDS = list(TransferFileResponse.model_fields)
+
+
+def _build_transfer_response(
+    transfer,
+    status_code: int = status.HTTP_200_OK,
+    fields: Optional[AbstractSet[str]] = None,
+) -> APIJSONResponse:
+    """A ``TransferResponse`` (or the ``fields`` of it), mapped from the ORM
+    object to a dict and rendered by orjson without building (and
+    re-validating) the model."""
+    def wanted(name: str) -> bool:
+        return fields is None or name in fields
+
+    content = {field: getattr(transfer, field) for field in _DETAIL_FIELDS if wanted(field)}
+    if wanted("artist_name"):
+        content["artist_name"] = transfer.artist.display_name if transfer.artist else "Unknown"
+    if wanted("files"):
+        content["files"] = [{field: getattr(f, field) for field in _FILE_FIELDS} for f in transfer.files]
+    if wanted("approval_chain"):
+        content["approval_chain"] = [
+            {
+                "role": a.required_role,
+                "status": a.status,
+                "approver_name": a.approver.display_name if a.approver else None,
+                "comment": a.comment,
+                "decided_at": a.decided_at,
+            }
+            for a in transfer.approvals
+        ]
+    return APIJSONResponse(content, status_code=status_code)
 
 
 # ── Create ───────────────────────────────────────────────────────
@@ -81,25 +76,28 @@ def _build_transfer_response(transfer) -> TransferResponse:
 async def create_transfer(
     payload: TransferCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
     transfer = await transfer_service.create_transfer(payload, current_user, db)
-    return _build_transfer_response(transfer)
+    return _build_transfer_response(transfer, status.HTTP_201_CREATED)
 
 
 # ── List ─────────────────────────────────────────────────────────
 
 @router.get("/", response_model=TransferListResponse)
 async def list_transfers(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
     transfer_status: Optional[TransferStatus] = Query(None, alias="status"),
     category: Optional[TransferCategory] = Query(None),
     search: Optional[str] = Query(None, max_length=200),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, max_length=200),
+    count: CountMode = Query("exact"),
+    fields: Optional[str] = Query(None, max_length=500, description="Comma-separated TransferSummary fields"),
 ):
-    transfers, total = await transfer_service.list_transfers(
+    transfers, total, estimated, next_cursor = await transfer_service.list_transfers(
         db,
         user=current_user,
         transfer_status=transfer_status,
@@ -107,37 +105,90 @@ async def list_transfers(
         search=search,
         page=page,
         per_page=per_page,
+        cursor=cursor,
+        count=count,
+        fields=parse_fields(fields, TransferSummary.model_fields),
     )
-    import math
-    return TransferListResponse(
-        items=[_build_transfer_response(t) for t in transfers],
-        total=total,
-        page=page,
-        per_page=per_page,
-        pages=math.ceil(total / per_page) if total else 0,
-    )
+    return APIJSONResponse({
+        "items": transfers,
+        "total": total,
+        "total_estimated": estimated,
+        "page": page,
+        "per_page": per_page,
+        "pages": None if total is None else math.ceil(total / per_page),
+        "next_cursor": next_cursor,
+    })
 
 
 # ── Stats ────────────────────────────────────────────────────────
 
 @router.get("/stats", response_model=TransferStatsResponse)
 async def get_stats(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
     return await transfer_service.get_stats(db, current_user)
 
 
+# ── Batch ────────────────────────────────────────────────────────
+
+_BATCH_MAX_IDS = 200
+
+
+def _parse_ids(raw: str) -> List[int]:
+    try:
+        ids = list(dict.fromkeys(int(part) for part in raw.split(",") if part.strip()))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ids must be comma-separated integers")
+    if not ids or len(ids) > _BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Pass between 1 and {_BATCH_MAX_IDS} ids",
+        )
+    return ids
+
+
+@router.get("/batch", response_model=TransferBatchResponse)
+async def get_transfers_batch(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    ids: str = Query(..., max_length=4000, description="Comma-separated transfer ids"),
+    fields: Optional[str] = Query(None, max_length=500, description="Comma-separated TransferSummary fields"),
+):
+    transfer_ids = _parse_ids(ids)
+    items = await transfer_service.get_summaries(
+        db, current_user, transfer_ids, parse_fields(fields, TransferSummary.model_fields),
+    )
+    return APIJSONResponse({
+        "items": items,
+        "missing": [tid for tid in transfer_ids if tid not in items],
+    })
+
+
+# ── Autocomplete ─────────────────────────────────────────────────
+
+@router.get("/autocomplete", response_model=TransferAutocompleteResponse)
+async def autocomplete(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(10, ge=1, le=25),
+):
+    return await transfer_service.autocomplete(db, current_user, q, limit=limit)
+
+
 # ── Detail ───────────────────────────────────────────────────────
 
 @router.get("/{transfer_id}", response_model=TransferResponse)
 async def get_transfer(
     transfer_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    fields: Optional[str] = Query(None, max_length=500, description="Comma-separated TransferResponse fields"),
 ):
-    transfer = await transfer_service.get_transfer(transfer_id, db, current_user)
-    return _build_transfer_response(transfer)
+    selected = parse_fields(fields, TransferResponse.model_fields)
+    transfer = await transfer_service.get_transfer(transfer_id, db, current_user, selected)
+    return _build_transfer_response(transfer, fields=selected)
 
 
 # ── Update ───────────────────────────────────────────────────────
@@ -147,7 +198,7 @@ async def update_transfer(
     transfer_id: int,
     payload: TransferUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
     transfer = await transfer_service.update_transfer(
         transfer_id, payload, current_user, db,
@@ -161,7 +212,7 @@ async def update_transfer(
 async def cancel_transfer(
     transfer_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
     await transfer_service.cancel_transfer(transfer_id, current_user, db)
     return {"message": "Transfer cancelled"}
@@ -176,7 +227,7 @@ async def cancel_transfer(
 async def upload_files(
     transfer_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
     files: List[UploadFile] = File(...),
 ):
     from sqlalchemy import select as sa_select
@@ -203,15 +254,65 @@ async def upload_files(
 
 @router.get(
     "/{transfer_id}/files",
-    response_model=List[TransferFileResponse],
+    response_model=TransferFileListResponse,
 )
 async def list_files(
     transfer_id: int,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    scan_status: Optional[ScanStatus] = Query(None),
+    checksum: Optional[ChecksumState] = Query(None),
+    name_prefix: Optional[str] = Query(None, max_length=500),
+    per_page: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, max_length=200),
+):
+    await transfer_service.ensure_visible(transfer_id, db, current_user)
+    items, next_cursor = await file_service.list_files(
+        db, transfer_id,
+        scan_status=scan_status,
+        checksum=checksum,
+        name_prefix=name_prefix,
+        cursor=cursor,
+        per_page=per_page,
+    )
+    return TransferFileListResponse(items=items, next_cursor=next_cursor)
+
+
+@router.get("/{transfer_id}/files/stream")
+async def stream_files(
+    transfer_id: int,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    open_session: Annotated[Callable, Depends(get_stream_session)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    scan_status: Optional[ScanStatus] = Query(None),
+    checksum: Optional[ChecksumState] = Query(None),
+    name_prefix: Optional[str] = Query(None, max_length=500),
+):
+    """Every matching file as NDJSON, one ``TransferFileResponse`` per line."""
+    await transfer_service.ensure_visible(transfer_id, db, current_user)
+    query = file_select(transfer_id, scan_status, checksum, name_prefix).order_by(
+        TransferFile.uploaded_at.desc(), TransferFile.id.desc(),
+    )
+    return StreamingResponse(
+        ndjson_rows(open_session, query, TransferFileResponse),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+# ── Manifest ─────────────────────────────────────────────────────
+
+@router.get("/{transfer_id}/manifest")
+async def export_manifest(
+    transfer_id: int,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    open_session: Annotated[Callable, Depends(get_stream_session)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    format: ExportFormat = Query("csv"),
 ):
-    transfer = await transfer_service.get_transfer(transfer_id, db, current_user)
-    return [TransferFileResponse.model_validate(f) for f in transfer.files]
+    """Delivery manifest: every file of the transfer in upload order, as CSV or NDJSON."""
+    reference = await transfer_service.ensure_visible(transfer_id, db, current_user)
+    query = file_select(transfer_id).order_by(TransferFile.uploaded_at, TransferFile.id)
+    return export_response(open_session, query, TransferFileResponse, format, f"{reference}-manifest")
 
 
 # ── Delete File ──────────────────────────────────────────────────
@@ -221,7 +322,7 @@ async def delete_file(
     transfer_id: int,
     file_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ):
     await file_service.delete_file(file_id, current_user, db)
     return {"message": "File deleted"}
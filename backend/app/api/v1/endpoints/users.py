@@ -7,7 +7,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.dependencies import get_current_user, require_role
-from backend.app.core.database import get_db
+from backend.app.core.database import get_db, get_read_db
+from backend.app.core.principal import Principal
 from backend.app.models.user import User, UserRole
 from backend.app.schemas.user import UserResponse
 
@@ -16,8 +17,8 @@ router = APIRouter()
 
 @router.get("/", response_model=List[UserResponse])
 async def list_users(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    _: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    _: Annotated[Principal, Depends(get_current_user)],
 ):
     result = await db.execute(select(User).order_by(User.display_name.asc()))
     return result.scalars().all()
@@ -27,7 +28,7 @@ async def list_users(
 async def get_user(
     user_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: Annotated[User, Depends(get_current_user)],
+    _: Annotated[Principal, Depends(get_current_user)],
 ):
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
@@ -2,8 +2,11 @@ from fastapi import APIRouter
 
 from backend.app.api.v1.endpoints import (
     activity,
+    analytics,
     approvals,
     auth,
+    dashboard,
+    events,
     notifications,
     scanning,
     shotgrid,
@@ -16,6 +19,7 @@ api_router = APIRouter(prefix="/api/v1")
 
 api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 api_router.include_router(users.router, prefix="/users", tags=["Users"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["Dashboard"])
 api_router.include_router(transfers.router, prefix="/transfers", tags=["Transfers"])
 api_router.include_router(approvals.router, prefix="/approvals", tags=["Approvals"])
 api_router.include_router(scanning.router, prefix="/scanning", tags=["Data Team"])
@@ -23,3 +27,5 @@ api_router.include_router(transfer_ops.router, prefix="/transfer-ops", tags=["IT
 api_router.include_router(shotgrid.router, prefix="/shotgrid", tags=["ShotGrid"])
 api_router.include_router(notifications.router, prefix="/notifications", tags=["Notifications"])
 api_router.include_router(activity.router, prefix="/activity", tags=["Activity Log"])
+api_router.include_router(analytics.router, prefix="/analytics", tags=["Analytics"])
+api_router.include_router(events.router, prefix="/events", tags=["Events"])
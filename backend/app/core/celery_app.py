@@ -1,6 +1,9 @@
+import asyncio
+
 from celery import Celery
 
 from backend.app.core.config import settings
+from backend.app.core import events  # noqa: F401  (publishes model changes on commit)
 
 celery_app = Celery(
     "databridge",
@@ -26,8 +29,31 @@ celery_app.conf.update(
         "backend.app.tasks.notifications.*": {"queue": "notifications"},
         "backend.app.tasks.maintenance.*": {"queue": "default"},
     },
+    beat_schedule={
+        "reconcile-notification-counters": {
+            "task": "backend.app.tasks.maintenance.reconcile_notification_counters",
+            "schedule": settings.NOTIFICATION_RECONCILE_INTERVAL_SECONDS,
+        },
+        "rebuild-transfer-stats": {
+            "task": "backend.app.tasks.maintenance.rebuild_transfer_stats",
+            "schedule": settings.TRANSFER_STATS_REBUILD_INTERVAL_SECONDS,
+        },
+        "rollup-transfer-history": {
+            "task": "backend.app.tasks.maintenance.rollup_transfer_history",
+            "schedule": settings.ANALYTICS_ROLLUP_INTERVAL_SECONDS,
+        },
+    },
 )
 
 celery_app.autodiscover_tasks([
     "backend.app.tasks",
 ])
+
+
+async def dispatch_task(task, *args, **kwargs):
+    """``task.delay(*args, **kwargs)`` for async code.
+
+    Publishing to the broker is blocking socket I/O, so it runs in a worker
+    thread instead of on the event loop.
+    """
+    return await asyncio.to_thread(task.apply_async, args, kwargs)
@@ -26,9 +26,16 @@ class Settings(BaseSettings):
     DATABASE_ECHO: bool = False
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 10
+    # Optional read replica for list/aggregate GETs; empty means the primary.
+    DATABASE_READ_URL: str = ""
+    DATABASE_READ_RETRY_SECONDS: float = 30.0
+    # Rows fetched per server-side cursor round trip by streamed responses.
+    DATABASE_STREAM_BATCH_SIZE: int = 1000
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 2.0
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
 
@@ -68,6 +75,16 @@ class Settings(BaseSettings):
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 480
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Authenticated-user cache
+    AUTH_CACHE_TTL_SECONDS: int = 300
+    AUTH_CACHE_LOCAL_TTL_SECONDS: float = 30.0
+    AUTH_CACHE_MAX_ENTRIES: int = 2048
+
+    # Revoked-token filter
+    TOKEN_REVOCATION_FILTER_CAPACITY: int = 100_000
+    TOKEN_REVOCATION_FILTER_ERROR_RATE: float = 0.001
+    TOKEN_REVOCATION_REBUILD_SECONDS: int = 3600
+
     # File paths (network mounts on your server)
     STAGING_NETWORK_PATH: str = "/mnt/staging"
     PRODUCTION_NETWORK_PATH: str = "/mnt/production"
@@ -76,6 +93,16 @@ class Settings(BaseSettings):
 
     # Transfer
     TRANSFER_METHOD: str = "rsync"
+    PROGRESS_UPDATE_INTERVAL_SECONDS: float = 2.0
+    PROGRESS_TTL_SECONDS: int = 86400
+
+    # Response compression (brotli if installed, else gzip)
+    COMPRESSION_MIN_SIZE_BYTES: int = 1024
+
+    # Live events (SSE)
+    EVENTS_KEEPALIVE_SECONDS: float = 15.0
+    EVENTS_RETRY_MS: int = 5000
+    EVENTS_TICKET_TTL_SECONDS: int = 60
 
     # SMTP
     SMTP_HOST: str = "smtp.redchillies.com"
@@ -83,6 +110,23 @@ class Settings(BaseSettings):
     SMTP_FROM_EMAIL: str = "databridge@redchillies.com"
     NOTIFICATION_ENABLED: bool = True
 
+    # Notification counters (Redis)
+    NOTIFICATION_COUNTER_TTL_SECONDS: int = 86400
+    NOTIFICATION_RECONCILE_INTERVAL_SECONDS: int = 600
+
+    # Dashboard stats counters (Redis)
+    TRANSFER_STATS_TTL_SECONDS: int = 86400
+    TRANSFER_STATS_REBUILD_INTERVAL_SECONDS: int = 900
+
+    # Dashboard summary endpoint
+    DASHBOARD_CACHE_TTL_SECONDS: int = 5
+    DASHBOARD_RECENT_TRANSFERS: int = 15
+
+    # Analytics rollups
+    ANALYTICS_ROLLUP_INTERVAL_SECONDS: int = 300
+    ANALYTICS_ROLLUP_BATCH_SIZE: int = 5000
+    ANALYTICS_ROLLUP_SETTLE_SECONDS: int = 60
+
     # ClamAV
     CLAMAV_ENABLED: bool = False
 
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Callable
+
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -9,6 +15,8 @@ from sqlalchemy.orm import DeclarativeBase
 
 from backend.app.core.config import settings
 
+logger = logging.getLogger("databridge.database")
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DATABASE_ECHO,
@@ -23,6 +31,53 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Read sessions run in autocommit: no BEGIN, and nothing to COMMIT or roll
+# back afterwards. Each statement reads its own snapshot.
+read_engine = (
+    create_async_engine(
+        settings.DATABASE_READ_URL,
+        echo=settings.DATABASE_ECHO,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        isolation_level="AUTOCOMMIT",
+    )
+    if settings.DATABASE_READ_URL
+    else None
+)
+
+replica_session_factory = (
+    async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+    if read_engine is not None
+    else None
+)
+
+primary_read_session_factory = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+# Server-side cursors need a transaction, so streamed reads get one REPEATABLE
+# READ snapshot for the whole response rather than autocommit.
+replica_stream_session_factory = (
+    async_sessionmaker(
+        read_engine.execution_options(isolation_level="REPEATABLE READ"),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    if read_engine is not None
+    else None
+)
+
+primary_stream_session_factory = async_sessionmaker(
+    engine.execution_options(isolation_level="REPEATABLE READ"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+_replica_retry_after = 0.0
+
 
 class Base(DeclarativeBase):
     pass
@@ -40,6 +95,75 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+async def _open_read_session(streaming: bool = False) -> AsyncSession:
+    """Session on the replica if configured and reachable, else on the primary.
+
+    The replica connection is taken eagerly so an unreachable replica falls
+    back here rather than failing mid-request; after a failure it is skipped
+    for ``DATABASE_READ_RETRY_SECONDS``.
+    """
+    global _replica_retry_after
+    replica = replica_stream_session_factory if streaming else replica_session_factory
+    primary = primary_stream_session_factory if streaming else primary_read_session_factory
+    if replica is not None and time.monotonic() >= _replica_retry_after:
+        session = replica()
+        try:
+            await session.connection()
+            return session
+        except (DBAPIError, OSError) as exc:
+            await session.close()
+            _replica_retry_after = time.monotonic() + settings.DATABASE_READ_RETRY_SECONDS
+            logger.warning("Read replica unavailable (%s); reading from the primary", exc)
+    return primary()
+
+
+async def get_read_db() -> AsyncSession:
+    """Session for endpoints that only read: autocommit, never committed.
+
+    May be served by a replica that trails the primary slightly, so endpoints
+    a user reloads right after their own write keep using ``get_db``.
+    """
+    session = await _open_read_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+@asynccontextmanager
+async def read_session() -> AsyncIterator[AsyncSession]:
+    """``get_read_db``'s session for code that needs several at once."""
+    session = await _open_read_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+def get_read_sessions() -> Callable[[], AsyncContextManager[AsyncSession]]:
+    """``read_session``, for endpoints that run independent reads
+    concurrently: one AsyncSession can't serve overlapping queries, so each
+    gets its own pooled connection."""
+    return read_session
+
+
+@asynccontextmanager
+async def stream_session() -> AsyncIterator[AsyncSession]:
+    """Read session for a response body streamed from a server-side cursor."""
+    session = await _open_read_session(streaming=True)
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+def get_stream_session() -> Callable[[], AsyncContextManager[AsyncSession]]:
+    """``stream_session`` for the body generator to enter itself: sessions
+    from request dependencies are closed once the endpoint returns, before a
+    ``StreamingResponse`` body is sent."""
+    return stream_session
+
+
 async def init_db() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -47,3 +171,5 @@ async def init_db() -> None:
 
 async def close_db() -> None:
     await engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
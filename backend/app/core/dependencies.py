@@ -1,70 +1,51 @@
 from __future__ import annotations
 
 import logging
-from typing import Annotated, Callable, List
+from typing import Annotated, Callable, List, Optional
 
 import jwt
-import redis
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.core.config import settings
 from backend.app.core.database import get_db
+from backend.app.core.principal import Principal, load_principal
+from backend.app.core.redis_client import async_redis_failed, get_async_redis
+from backend.app.core.revocation import token_revocations
 from backend.app.core.security import decode_token
-from backend.app.models.user import User
 
 logger = logging.getLogger("databridge.auth")
 bearer_scheme = HTTPBearer()
+optional_bearer_scheme = HTTPBearer(auto_error=False)
 
-_redis_client = None
 
-
-def _get_redis() -> redis.Redis:
-    global _redis_client
-    if _redis_client is None:
-        try:
-            _redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
-            _redis_client.ping()
-        except Exception:
-            logger.warning("Redis unavailable — token blacklist disabled")
-            _redis_client = None
-    return _redis_client
-
-
-def is_token_blacklisted(token: str) -> bool:
-    r = _get_redis()
+# Whole-token blacklist, only for access tokens issued before they carried a jti.
+async def is_token_blacklisted(token: str) -> bool:
+    r = get_async_redis()
     if r is None:
         return False
     try:
-        return r.exists(f"blacklist:{token}") > 0
-    except Exception:
+        return await r.exists(f"blacklist:{token}") > 0
+    except Exception as exc:
+        async_redis_failed(exc)
         return False
 
 
-def blacklist_token(token: str, ttl_seconds: int) -> None:
-    r = _get_redis()
+async def blacklist_token(token: str, ttl_seconds: int) -> None:
+    r = get_async_redis()
     if r is None:
         return
     try:
-        r.setex(f"blacklist:{token}", ttl_seconds, "1")
-    except Exception:
+        await r.setex(f"blacklist:{token}", ttl_seconds, "1")
+    except Exception as exc:
+        async_redis_failed(exc)
         logger.warning("Failed to blacklist token in Redis")
 
 
-async def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(bearer_scheme)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
-    token = credentials.credentials
-
-    if is_token_blacklisted(token):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked")
-
+async def _authenticate(token: str, db: AsyncSession, token_type: str = "access") -> Principal:
     try:
         payload = decode_token(token)
-        if payload.get("type") != "access":
+        if payload.get("type") != token_type:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
         username: str = payload.get("sub")
         if not username:
@@ -74,18 +55,44 @@ async def get_current_user(
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    result = await db.execute(select(User).where(User.username == username))
-    user = result.scalar_one_or_none()
+    jti = payload.get("jti")
+    revoked = await token_revocations.is_revoked(jti) if jti else await is_token_blacklisted(token)
+    if revoked:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked")
 
-    if user is None or not user.is_active:
+    principal = await load_principal(username, db)
+    if principal is None or not principal.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or inactive")
-    return user
+    return principal
+
+
+async def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(bearer_scheme)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Principal:
+    return await _authenticate(credentials.credentials, db)
+
+
+async def get_stream_user(
+    credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(optional_bearer_scheme)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    ticket: Optional[str] = Query(None),
+) -> Principal:
+    """Like get_current_user, but also accepts a stream ticket (see
+    ``POST /events/ticket``) as ``?ticket=``, since the browser EventSource
+    API cannot send an Authorization header. Access tokens are never taken
+    from the query string."""
+    if credentials:
+        return await _authenticate(credentials.credentials, db)
+    if not ticket:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    return await _authenticate(ticket, db, token_type="stream")
 
 
 def require_role(*allowed_roles: str) -> Callable:
     async def role_checker(
-        current_user: Annotated[User, Depends(get_current_user)],
-    ) -> User:
+        current_user: Annotated[Principal, Depends(get_current_user)],
+    ) -> Principal:
         user_role = current_user.role.value if hasattr(current_user.role, "value") else current_user.role
         if user_role not in allowed_roles:
             raise HTTPException(
@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set
+
+import redis.asyncio as aioredis
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from backend.app.core.redis_client import (
+    async_redis_active,
+    async_redis_failed,
+    get_async_redis,
+    get_redis,
+    spawn,
+)
+from backend.app.models.notification import Notification
+from backend.app.models.transfer import Transfer, elapsed_seconds
+from backend.app.models.user import User, UserRole
+
+logger = logging.getLogger("databridge.events")
+
+EVENTS_CHANNEL = "databridge:events"
+
+_PENDING_KEY = "databridge_pending_events"
+
+_commit_handlers: List[Callable[[List[dict]], None]] = []
+
+# Changes that make a cached principal stale (see core.principal).
+_AUTH_ATTRS = ("username", "display_name", "role", "is_active")
+
+
+def _value(v):
+    if hasattr(v, "value"):
+        return v.value
+    if isinstance(v, datetime):
+        return v.isoformat()
+    return v
+
+
+# ── Collecting events from the ORM ──────────────────────────────────
+
+
+def queue_event(session: Session, payload: dict) -> None:
+    """Publish ``payload`` once ``session`` commits; dropped on rollback.
+
+    Needed for bulk UPDATE/INSERT statements, which the flush hooks below
+    never see.
+    """
+    session.info.setdefault(_PENDING_KEY, []).append(payload)
+
+
+def _notification_payload(notif: Notification) -> dict:
+    return {
+        "id": notif.id,
+        "transfer_id": notif.transfer_id,
+        "target_role": _value(notif.target_role),
+        "type": _value(notif.type),
+        "title": notif.title,
+        "message": notif.message,
+        "is_read": notif.is_read,
+        "created_at": _value(notif.created_at),
+    }
+
+
+def transfer_status_payload(transfer: Transfer, previous, previous_completed_at=None) -> dict:
+    return {
+        "type": "transfer.status",
+        "transfer_id": transfer.id,
+        "reference": transfer.reference,
+        "artist_id": transfer.artist_id,
+        "status": _value(transfer.status),
+        "previous_status": _value(previous),
+        # Lets the dashboard counters (services.transfer_stats) keep their
+        # completion-time averages without a query.
+        "completed_seconds": elapsed_seconds(transfer.created_at, transfer.transfer_completed_at),
+        "previous_completed_seconds": elapsed_seconds(transfer.created_at, previous_completed_at),
+    }
+
+
+def _user_changed_payload(user: User, deleted: bool = False) -> Optional[dict]:
+    state = inspect(user)
+    previous_username = None
+    if not deleted:
+        changed = [a for a in _AUTH_ATTRS if state.attrs[a].history.has_changes()]
+        if not changed:
+            return None
+        old = state.attrs.username.history.deleted
+        if old and old[0] != user.username:
+            previous_username = old[0]
+    return {
+        "type": "user.changed",
+        "user_id": user.id,
+        "username": user.username,
+        "previous_username": previous_username,
+    }
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_events(session: Session, flush_context) -> None:
+    for obj in session.new:
+        if isinstance(obj, Notification):
+            queue_event(session, {
+                "type": "notification.created",
+                "user_id": obj.user_id,
+                "target_role": _value(obj.target_role),
+                "notification": _notification_payload(obj),
+            })
+        elif isinstance(obj, Transfer):
+            queue_event(session, transfer_status_payload(obj, None))
+
+    for obj in session.dirty:
+        if isinstance(obj, Transfer):
+            state = inspect(obj)
+            hist = state.attrs.status.history
+            if hist.has_changes() and hist.deleted and hist.deleted[0] != obj.status:
+                completed = state.attrs.transfer_completed_at.history
+                if completed.deleted:
+                    previous_completed = completed.deleted[0]
+                elif completed.added:
+                    previous_completed = None
+                else:
+                    previous_completed = obj.transfer_completed_at
+                queue_event(session, transfer_status_payload(obj, hist.deleted[0], previous_completed))
+        elif isinstance(obj, Notification):
+            hist = inspect(obj).attrs.is_read.history
+            if hist.has_changes() and obj.is_read and hist.deleted and not hist.deleted[0]:
+                queue_event(session, {
+                    "type": "notification.read",
+                    "user_id": obj.user_id,
+                    "ids": [obj.id],
+                })
+        elif isinstance(obj, User):
+            payload = _user_changed_payload(obj)
+            if payload:
+                queue_event(session, payload)
+
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            queue_event(session, _user_changed_payload(obj, deleted=True))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_on_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        publish_events(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def on_commit(handler: Callable[[List[dict]], None]) -> Callable[[List[dict]], None]:
+    """Register ``handler`` to receive every committed batch of events in this process."""
+    _commit_handlers.append(handler)
+    return handler
+
+
+def publish_events(payloads: List[dict]) -> None:
+    for handler in _commit_handlers:
+        try:
+            handler(payloads)
+        except Exception:
+            logger.exception("Commit handler %s failed", getattr(handler, "__name__", handler))
+
+    if async_redis_active():
+        r = get_async_redis()
+        if r is None:
+            _deliver_locally(payloads)
+            return
+        if spawn(_publish_async, r, payloads):
+            return
+
+    r = get_redis()
+    if r is None:
+        _deliver_locally(payloads)
+        return
+    try:
+        pipe = r.pipeline(transaction=False)
+        for payload in payloads:
+            pipe.publish(EVENTS_CHANNEL, json.dumps(payload, default=str))
+        pipe.execute()
+    except Exception:
+        logger.warning("Failed to publish %d event(s)", len(payloads))
+
+
+async def _publish_async(r: aioredis.Redis, payloads: List[dict]) -> None:
+    try:
+        pipe = r.pipeline(transaction=False)
+        for payload in payloads:
+            pipe.publish(EVENTS_CHANNEL, json.dumps(payload, default=str))
+        await pipe.execute()
+    except Exception as exc:
+        async_redis_failed(exc)
+        logger.warning("Failed to publish %d event(s)", len(payloads))
+        _deliver_locally(payloads)
+
+
+def _deliver_locally(payloads: List[dict]) -> None:
+    # Without Redis, this process's own clients still get live updates.
+    for payload in payloads:
+        event_hub.deliver(payload)
+
+
+# ── Fan-out to connected clients ────────────────────────────────────
+
+_OPS_STATUSES = {
+    UserRole.DATA_TEAM: {
+        "approved", "scanning", "scan_passed", "scan_failed", "copying", "ready_for_transfer",
+    },
+    UserRole.IT_TEAM: {
+        "ready_for_transfer", "transferring", "verifying", "transferred",
+    },
+}
+
+
+def _can_see_status(role: UserRole, user_id: int, artist_id: int, status: Optional[str]) -> bool:
+    # Mirrors TransferService._build_visibility_filter.
+    if status is None:
+        return False
+    if role == UserRole.ADMIN or artist_id == user_id:
+        return True
+    if role == UserRole.TEAM_LEAD:
+        return status == "pending_team_lead"
+    if role in (UserRole.SUPERVISOR, UserRole.LINE_PRODUCER):
+        return status != "uploaded"
+    return status in _OPS_STATUSES.get(role, ())
+
+
+@dataclass(eq=False)
+class Subscription:
+    user_id: int
+    role: UserRole
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=256))
+
+    def wants(self, payload: dict) -> bool:
+        if payload.get("target_role"):
+            return payload["target_role"] == self.role.value
+        if "user_id" in payload:
+            return payload["user_id"] == self.user_id
+        if payload.get("type") == "transfer.status":
+            artist_id = payload.get("artist_id")
+            return (
+                _can_see_status(self.role, self.user_id, artist_id, payload.get("status"))
+                or _can_see_status(self.role, self.user_id, artist_id, payload.get("previous_status"))
+            )
+        return False
+
+    def push(self, payload: dict) -> None:
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            # Client is too far behind for deltas to be useful; tell it to refetch.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "resync"})
+
+
+class EventHub:
+    """Per-process fan-out of the Redis events channel to SSE subscribers.
+
+    One pub/sub connection per uvicorn worker, opened at startup (or when the
+    first client connects); each client only receives events it is allowed
+    to see. Handlers registered with ``on_event`` see every event, so
+    in-process caches can drop what other processes changed.
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: Set[Subscription] = set()
+        self._listener: Optional[asyncio.Task] = None
+        self._handlers: List[Callable[[dict], None]] = []
+
+    def on_event(self, handler: Callable[[dict], None]) -> Callable[[dict], None]:
+        self._handlers.append(handler)
+        return handler
+
+    def start(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    def subscribe(self, user_id: int, role) -> Subscription:
+        sub = Subscription(user_id=user_id, role=UserRole(_value(role)))
+        self._subscriptions.add(sub)
+        self.start()
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        self._subscriptions.discard(sub)
+
+    def deliver(self, payload: dict) -> None:
+        for handler in self._handlers:
+            try:
+                handler(payload)
+            except Exception:
+                logger.exception("Event handler %s failed", getattr(handler, "__qualname__", handler))
+        for sub in list(self._subscriptions):
+            if sub.wants(payload):
+                sub.push(payload)
+
+    @property
+    def connected_clients(self) -> int:
+        return len(self._subscriptions)
+
+    async def _listen(self) -> None:
+        delay = 1.0
+        while True:
+            client = get_async_redis()
+            if client is None:
+                # Pool not open yet or Redis backing off; local delivery covers us.
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+                continue
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(EVENTS_CHANNEL)
+                delay = 1.0
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        self.deliver(json.loads(message["data"]))
+                    except ValueError:
+                        logger.warning("Dropping malformed event on %s", EVENTS_CHANNEL)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                async_redis_failed(exc)
+                logger.warning("Event listener lost Redis, retrying in %.0fs", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        self._subscriptions.clear()
+
+
+event_hub = EventHub()
+
+
+def format_sse(event_name: str, data: Dict) -> str:
+    return f"event: {event_name}\ndata: {json.dumps(data, default=str)}\n\n"
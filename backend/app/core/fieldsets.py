@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import FrozenSet, Iterable, Optional
+
+from fastapi import HTTPException, status
+
+
+def parse_fields(raw: Optional[str], allowed: Iterable[str]) -> Optional[FrozenSet[str]]:
+    """A comma-separated ``fields=`` parameter as a set (always with ``id``),
+    or None when absent, meaning every field.
+
+    Unknown names are a 400 rather than ignored, so a typo doesn't quietly
+    return less than the client expects.
+    """
+    if raw is None or not raw.strip():
+        return None
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown field(s): {', '.join(sorted(unknown))}",
+        )
+    return frozenset(requested | {"id"})
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import base64
+import json
+import logging
+from datetime import datetime
+from typing import Any, Callable, List, Literal, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+logger = logging.getLogger("databridge.pagination")
+
+# How a list endpoint reports its total: an exact COUNT(*), the planner's
+# row estimate (cheap on large tables, Postgres only), or not at all.
+CountMode = Literal["exact", "estimated", "none"]
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def keyset_page(query, created_col, id_col, *, cursor: Optional[str], page: int, per_page: int):
+    """Newest-first page of ``query``, by cursor when given, else by page number.
+
+    Rows are ordered on ``(created_at, id)`` so a cursor resumes exactly after
+    the last row seen, as an index range scan rather than an OFFSET that reads
+    and discards every earlier row. One extra row is fetched to tell whether
+    there is a next page; pass the result through ``split_page``.
+    """
+    query = query.order_by(created_col.desc(), id_col.desc())
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.where(tuple_(created_col, id_col) < tuple_(created_at, row_id))
+    else:
+        query = query.offset((page - 1) * per_page)
+    return query.limit(per_page + 1)
+
+
+def split_page(
+    rows: Sequence[Any],
+    per_page: int,
+    key: Callable[[Any], Tuple[datetime, int]],
+) -> Tuple[List[Any], Optional[str]]:
+    """(rows for this page, cursor for the next one or None)."""
+    rows = list(rows)
+    if len(rows) <= per_page:
+        return rows, None
+    rows = rows[:per_page]
+    return rows, encode_cursor(*key(rows[-1]))
+
+
+async def count_rows(
+    db: AsyncSession, entity, filters: Sequence, mode: CountMode,
+) -> Tuple[Optional[int], bool]:
+    """(total rows of ``entity`` matching ``filters``, whether it's an estimate)
+    according to ``mode``.
+
+    ``estimated`` asks the Postgres planner (``EXPLAIN``), whose row estimate
+    comes from ``pg_class.reltuples`` and column statistics; other databases,
+    or an EXPLAIN that fails, get the exact count.
+    """
+    if mode == "none":
+        return None, False
+    if mode == "estimated":
+        estimate = await _planner_estimate(db, select(1).select_from(entity).where(*filters))
+        if estimate is not None:
+            return estimate, True
+    total = (await db.execute(select(func.count()).select_from(entity).where(*filters))).scalar() or 0
+    return total, False
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement, executed with its parameters
+    bound (and type-processed) like any other query."""
+
+    inherit_cache = False
+
+    def __init__(self, statement) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def _planner_estimate(db: AsyncSession, query) -> Optional[int]:
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    try:
+        plan = (await db.execute(_Explain(query))).scalar()
+    except Exception:
+        # Count sessions are autocommit, so a failed EXPLAIN leaves nothing to roll back.
+        logger.warning("EXPLAIN for a row estimate failed; falling back to an exact count", exc_info=True)
+        return None
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (LookupError, TypeError, ValueError):
+        logger.warning("Unexpected EXPLAIN output; falling back to an exact count")
+        return None
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.core.events import event_hub, on_commit
+from backend.app.core.redis_client import (
+    async_redis_active,
+    async_redis_failed,
+    get_async_redis,
+    get_redis,
+    spawn,
+)
+from backend.app.models.user import User, UserRole
+
+logger = logging.getLogger("databridge.principal")
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated caller: only what authorization and auditing need.
+
+    Returned by ``get_current_user``; endpoints that need the full profile
+    load ``User`` themselves.
+    """
+
+    id: int
+    username: str
+    display_name: str
+    role: UserRole
+    is_active: bool = True
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            username=user.username,
+            display_name=user.display_name,
+            role=UserRole(user.role),
+            is_active=user.is_active,
+        )
+
+
+def _key(username: str) -> str:
+    return f"auth:user:{username}"
+
+
+def _generation_key(username: str) -> str:
+    return f"auth:gen:{username}"
+
+
+# Write the entry only if no invalidation has happened since the caller
+# read the generation (before it read the user from the database).
+_PUT_IF_CURRENT = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then
+    return 0
+end
+redis.call('SETEX', KEYS[1], ARGV[2], ARGV[3])
+return 1
+"""
+
+# (local epoch, Redis generation) as read before loading a user.
+Generation = Tuple[int, Optional[str]]
+
+
+class PrincipalCache:
+    """Active-user state keyed by username: an in-process LRU in front of Redis.
+
+    Entries are dropped from both tiers when a committed change touches a
+    user's role, active flag or name (see ``user.changed`` in core.events),
+    and other API processes drop their local copy when the event reaches
+    their ``EventHub``. Each invalidation bumps a per-user generation, and
+    ``put`` only writes if it hasn't moved since the caller's ``generation``
+    read, so a principal loaded just before a change is never cached after it.
+    """
+
+    def __init__(self) -> None:
+        self._local: "OrderedDict[str, Tuple[float, Principal]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._epoch = 0
+
+    async def get(self, username: str) -> Optional[Principal]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._local.get(username)
+            if entry is not None:
+                if entry[0] > now:
+                    self._local.move_to_end(username)
+                    return entry[1]
+                del self._local[username]
+
+        r = get_async_redis()
+        if r is None:
+            return None
+        try:
+            raw = await r.get(_key(username))
+        except Exception as exc:
+            async_redis_failed(exc)
+            return None
+        if not raw:
+            return None
+        try:
+            data = json.loads(raw)
+            principal = Principal(**{**data, "role": UserRole(data["role"])})
+        except (ValueError, TypeError, KeyError):
+            return None
+        self._store_local(principal)
+        return principal
+
+    async def generation(self, username: str) -> Generation:
+        """Read before loading ``username`` from the database; pass to ``put``."""
+        epoch = self._epoch
+        r = get_async_redis()
+        if r is None:
+            return epoch, None
+        try:
+            return epoch, await r.get(_generation_key(username)) or ""
+        except Exception as exc:
+            async_redis_failed(exc)
+            return epoch, None
+
+    async def put(self, principal: Principal, generation: Generation) -> None:
+        epoch, redis_generation = generation
+        self._store_local(principal, epoch)
+        r = get_async_redis()
+        if r is None or redis_generation is None:
+            return
+        data = {**asdict(principal), "role": principal.role.value}
+        try:
+            await r.eval(
+                _PUT_IF_CURRENT, 2, _key(principal.username), _generation_key(principal.username),
+                redis_generation, settings.AUTH_CACHE_TTL_SECONDS, json.dumps(data),
+            )
+        except Exception as exc:
+            async_redis_failed(exc)
+            logger.warning("Failed to cache auth state for %s", principal.username)
+
+    def invalidate(self, *usernames: str) -> None:
+        usernames = tuple(u for u in usernames if u)
+        if not usernames:
+            return
+        self.drop_local(*usernames)
+        if async_redis_active():
+            r = get_async_redis()
+            if r is None or spawn(self._invalidate_async, r, usernames):
+                return
+        r = get_redis()
+        if r is None:
+            return
+        try:
+            pipe = r.pipeline()
+            self._queue_invalidate(pipe, usernames)
+            pipe.execute()
+        except Exception:
+            logger.warning("Failed to invalidate auth state for %s", ", ".join(usernames))
+
+    def drop_local(self, *usernames: str) -> None:
+        with self._lock:
+            self._epoch += 1
+            for username in usernames:
+                self._local.pop(username, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._local.clear()
+
+    def apply(self, payloads: List[dict]) -> None:
+        self.invalidate(*self._stale(payloads))
+
+    def apply_remote(self, payload: dict) -> None:
+        # Redis was already invalidated by the process that committed.
+        self.drop_local(*self._stale([payload]))
+
+    @staticmethod
+    def _stale(payloads: List[dict]) -> List[str]:
+        stale = []
+        for p in payloads:
+            if p.get("type") == "user.changed":
+                stale.extend(u for u in (p.get("username"), p.get("previous_username")) if u)
+        return stale
+
+    @staticmethod
+    def _queue_invalidate(pipe, usernames) -> None:
+        for username in usernames:
+            pipe.delete(_key(username))
+            pipe.incr(_generation_key(username))
+            pipe.expire(_generation_key(username), settings.AUTH_CACHE_TTL_SECONDS)
+
+    async def _invalidate_async(self, r, usernames) -> None:
+        pipe = r.pipeline()
+        self._queue_invalidate(pipe, usernames)
+        await pipe.execute()
+
+    def _store_local(self, principal: Principal, epoch: Optional[int] = None) -> None:
+        expires = time.monotonic() + settings.AUTH_CACHE_LOCAL_TTL_SECONDS
+        with self._lock:
+            if epoch is not None and epoch != self._epoch:
+                return
+            self._local[principal.username] = (expires, principal)
+            self._local.move_to_end(principal.username)
+            while len(self._local) > settings.AUTH_CACHE_MAX_ENTRIES:
+                self._local.popitem(last=False)
+
+
+principal_cache = PrincipalCache()
+on_commit(principal_cache.apply)
+event_hub.on_event(principal_cache.apply_remote)
+
+
+async def load_principal(username: str, db: AsyncSession) -> Optional[Principal]:
+    """Cached principal for ``username``, or None if no such user exists."""
+    principal = await principal_cache.get(username)
+    if principal is not None:
+        return principal
+
+    generation = await principal_cache.generation(username)
+    # Plain columns: no identity-map entry and no relationship loads.
+    row = (await db.execute(
+        select(User.id, User.username, User.display_name, User.role, User.is_active)
+        .where(User.username == username)
+    )).one_or_none()
+    if row is None:
+        return None
+    principal = Principal(
+        id=row.id,
+        username=row.username,
+        display_name=row.display_name,
+        role=UserRole(row.role),
+        is_active=row.is_active,
+    )
+    await principal_cache.put(principal, generation)
+    return principal
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional, Set
+
+import redis
+import redis.asyncio as aioredis
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger("databridge.redis")
+
+_RETRY_INTERVAL_SECONDS = 30.0
+
+_redis_client: Optional[redis.Redis] = None
+_retry_after = 0.0
+
+_async_client: Optional[aioredis.Redis] = None
+_async_retry_after = 0.0
+_background: Set[asyncio.Task] = set()
+
+
+def get_redis() -> Optional[redis.Redis]:
+    """Shared synchronous client, or None while Redis is unreachable.
+
+    For Celery workers and scripts; code running on the API event loop uses
+    ``get_async_redis`` instead. A failed connection is not retried for
+    ``_RETRY_INTERVAL_SECONDS`` so that hot paths (progress ticks) don't pay a
+    connect attempt every time Redis is down.
+    """
+    global _redis_client, _retry_after
+    if _redis_client is None and time.monotonic() >= _retry_after:
+        try:
+            client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+            client.ping()
+            _redis_client = client
+        except Exception:
+            logger.warning("Redis unavailable at %s", settings.REDIS_URL)
+            _redis_client = None
+            _retry_after = time.monotonic() + _RETRY_INTERVAL_SECONDS
+    return _redis_client
+
+
+# ── Async pool (API process) ────────────────────────────────────────
+
+
+async def init_async_redis() -> None:
+    """Open the API process's shared ``redis.asyncio`` pool (app lifespan)."""
+    global _async_client
+    if _async_client is not None:
+        return
+    _async_client = aioredis.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        health_check_interval=30,
+    )
+    try:
+        await _async_client.ping()
+    except Exception as exc:
+        async_redis_failed(exc)
+
+
+async def close_async_redis() -> None:
+    global _async_client
+    if _background:
+        await asyncio.gather(*list(_background), return_exceptions=True)
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+
+def async_redis_active() -> bool:
+    """True in the API process, where Redis I/O must go through the async pool."""
+    return _async_client is not None
+
+
+def get_async_redis() -> Optional[aioredis.Redis]:
+    """Shared async client, or None if the pool isn't open or Redis is backing off."""
+    if _async_client is None or time.monotonic() < _async_retry_after:
+        return None
+    return _async_client
+
+
+def async_redis_failed(exc: Exception) -> None:
+    """Record a failed async call; connection errors pause Redis use for a while."""
+    global _async_retry_after
+    if isinstance(exc, (redis.ConnectionError, redis.TimeoutError, OSError)):
+        logger.warning("Redis unavailable at %s", settings.REDIS_URL)
+        _async_retry_after = time.monotonic() + _RETRY_INTERVAL_SECONDS
+
+
+def spawn(fn: Callable[..., Awaitable], *args) -> bool:
+    """Schedule ``fn(*args)`` on the running loop without waiting for it.
+
+    Lets synchronous hooks (session commit handlers) hand Redis writes to the
+    async pool. Returns False when no loop is running so the caller can fall
+    back to the sync client.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+
+    async def _run():
+        try:
+            await fn(*args)
+        except Exception as exc:
+            async_redis_failed(exc)
+            logger.warning("Background Redis call %s failed", getattr(fn, "__qualname__", fn))
+
+    task = loop.create_task(_run())
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+    return True
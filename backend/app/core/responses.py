@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+def dumps(content: Any) -> bytes:
+    """``content`` as ``APIJSONResponse`` renders it, for bodies cached as bytes."""
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+
+class APIJSONResponse(ORJSONResponse):
+    """The app's default response class: JSON rendered by orjson.
+
+    orjson encodes datetimes, enums and UUIDs itself, so endpoints on hot
+    paths can return one of these around plain dicts built straight from
+    rows and skip response-model validation entirely (FastAPI leaves a
+    returned Response alone). UTC datetimes end in ``Z``, as Pydantic
+    writes them.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
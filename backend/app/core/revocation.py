@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from typing import Iterable, Optional
+
+from backend.app.core.config import settings
+from backend.app.core.redis_client import async_redis_failed, get_async_redis
+
+logger = logging.getLogger("databridge.revocation")
+
+REVOCATIONS_CHANNEL = "databridge:revocations"
+
+# Every revoked jti, scored by its token's expiry, so a filter can be rebuilt.
+_INDEX_KEY = "revoked:jti"
+
+
+def _key(jti: str) -> str:
+    return f"revoked:{jti}"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives)."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self.size = max(int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)), 8)
+        self.hashes = max(int(round(self.size / capacity * math.log(2))), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+def _new_filter(jtis: Iterable[str] = ()) -> BloomFilter:
+    bloom = BloomFilter(settings.TOKEN_REVOCATION_FILTER_CAPACITY, settings.TOKEN_REVOCATION_FILTER_ERROR_RATE)
+    for jti in jtis:
+        bloom.add(jti)
+    return bloom
+
+
+class TokenRevocations:
+    """Revoked access-token ids: Redis is the record, each API process keeps
+    a Bloom filter of it so unrevoked tokens are cleared without a round trip.
+
+    The filter is rebuilt from Redis on (re)connect and every
+    ``TOKEN_REVOCATION_REBUILD_SECONDS`` (dropping expired ids), and kept
+    current in between from the ``databridge:revocations`` channel. Until it
+    is in sync every check goes to Redis.
+    """
+
+    def __init__(self) -> None:
+        self._filter = _new_filter()
+        self._synced = False
+        self._listener: Optional[asyncio.Task] = None
+
+    async def revoke(self, jti: str, ttl_seconds: int) -> None:
+        self._filter.add(jti)
+        r = get_async_redis()
+        if r is None:
+            logger.warning("Redis unavailable; token %s revoked in this process only", jti)
+            return
+        try:
+            pipe = r.pipeline()
+            pipe.setex(_key(jti), ttl_seconds, "1")
+            pipe.zadd(_INDEX_KEY, {jti: time.time() + ttl_seconds})
+            pipe.publish(REVOCATIONS_CHANNEL, jti)
+            await pipe.execute()
+        except Exception as exc:
+            async_redis_failed(exc)
+            logger.warning("Failed to record revocation of token %s", jti)
+
+    async def is_revoked(self, jti: str) -> bool:
+        if self._synced and jti not in self._filter:
+            return False
+        r = get_async_redis()
+        if r is None:
+            # Can't confirm; a local hit is treated as revoked.
+            return jti in self._filter
+        try:
+            return bool(await r.exists(_key(jti)))
+        except Exception as exc:
+            async_redis_failed(exc)
+            return jti in self._filter
+
+    def start(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        self._synced = False
+
+    async def _rebuild(self, r) -> None:
+        now = time.time()
+        await r.zremrangebyscore(_INDEX_KEY, "-inf", now)
+        jtis = await r.zrangebyscore(_INDEX_KEY, now, "+inf")
+        self._filter = _new_filter(jtis)
+        self._synced = True
+        logger.debug("Token revocation filter rebuilt with %d id(s)", len(jtis))
+
+    async def _listen(self) -> None:
+        delay = 1.0
+        while True:
+            r = get_async_redis()
+            if r is None:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+                continue
+            pubsub = r.pubsub(ignore_subscribe_messages=True)
+            try:
+                # Subscribe first so nothing revoked during the rebuild is missed.
+                await pubsub.subscribe(REVOCATIONS_CHANNEL)
+                await self._rebuild(r)
+                delay = 1.0
+                rebuild_at = time.monotonic() + settings.TOKEN_REVOCATION_REBUILD_SECONDS
+                while True:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._filter.add(message["data"])
+                    if time.monotonic() >= rebuild_at:
+                        await self._rebuild(r)
+                        rebuild_at = time.monotonic() + settings.TOKEN_REVOCATION_REBUILD_SECONDS
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._synced = False
+                async_redis_failed(exc)
+                logger.warning("Revocation listener lost Redis, retrying in %.0fs", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+
+token_revocations = TokenRevocations()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
@@ -20,7 +21,12 @@ def create_access_token(
         expires_delta
         or timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
     )
-    payload: dict[str, Any] = {"sub": subject, "exp": expire, "type": "access"}
+    payload: dict[str, Any] = {
+        "sub": subject,
+        "exp": expire,
+        "type": "access",
+        "jti": uuid.uuid4().hex,
+    }
     if extra_claims:
         payload.update(extra_claims)
     return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
@@ -32,6 +38,14 @@ def create_refresh_token(subject: str) -> str:
     return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
+def create_stream_ticket(subject: str) -> str:
+    """Short-lived token that only opens the event stream, for the query
+    string EventSource needs, where an access token would end up in logs."""
+    expire = datetime.now(timezone.utc) + timedelta(seconds=settings.EVENTS_TICKET_TTL_SECONDS)
+    payload = {"sub": subject, "exp": expire, "type": "stream", "jti": uuid.uuid4().hex}
+    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+
 def decode_token(token: str) -> dict:
     return jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
 
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+
+def like_escape(term: str) -> str:
+    """``term`` with LIKE wildcards escaped, for use with ``escape="\\\\"``, so
+    user input matches literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Literal, Sequence, Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+
+ExportFormat = Literal["ndjson", "csv"]
+
+SessionOpener = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+async def _row_batches(open_session: SessionOpener, query) -> AsyncIterator[Sequence[Row]]:
+    """Rows of ``query`` off a server-side cursor, ``DATABASE_STREAM_BATCH_SIZE``
+    at a time, so memory stays flat however many rows there are."""
+    async with open_session() as session:
+        result = await session.stream(
+            query.execution_options(yield_per=settings.DATABASE_STREAM_BATCH_SIZE)
+        )
+        async for rows in result.partitions():
+            yield rows
+
+
+async def ndjson_rows(open_session: SessionOpener, query, model: Type[BaseModel]) -> AsyncIterator[bytes]:
+    """One ``model`` JSON line per row of ``query``, a chunk per batch.
+    ``query`` must select the model's fields as columns."""
+    async for rows in _row_batches(open_session, query):
+        yield b"".join(model(**row._mapping).model_dump_json().encode() + b"\n" for row in rows)
+
+
+# Spreadsheets run a cell starting with one of these as a formula; filenames,
+# descriptions and comments are user input, so such cells get a leading '.
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+async def csv_rows(open_session: SessionOpener, query, model: Type[BaseModel]) -> AsyncIterator[bytes]:
+    """``model``'s fields as a CSV header, then one line per row of ``query``.
+    Nested values (JSON columns) are written as compact JSON, and text that a
+    spreadsheet would read as a formula is prefixed with ``'``."""
+    fields = list(model.model_fields)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    async for rows in _row_batches(open_session, query):
+        for row in rows:
+            data = model(**row._mapping).model_dump(mode="json")
+            writer.writerow([_csv_value(data[field]) for field in fields])
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def export_response(
+    open_session: SessionOpener,
+    query,
+    model: Type[BaseModel],
+    fmt: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """Download of ``query`` as NDJSON or CSV, streamed as it's read."""
+    if fmt == "csv":
+        body, media_type = csv_rows(open_session, query, model), CSV_MEDIA_TYPE
+    else:
+        body, media_type = ndjson_rows(open_session, query, model), NDJSON_MEDIA_TYPE
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
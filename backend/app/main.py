@@ -12,6 +12,11 @@ from fastapi.staticfiles import StaticFiles
 from backend.app.api.v1.router import api_router
 from backend.app.core.config import settings
 from backend.app.core.database import close_db, init_db
+from backend.app.core.events import event_hub
+from backend.app.core.redis_client import close_async_redis, init_async_redis
+from backend.app.core.responses import APIJSONResponse
+from backend.app.core.revocation import token_revocations
+from backend.app.middleware.compression import CompressionMiddleware
 from backend.app.middleware.request_logging import RequestLoggingMiddleware
 
 logger = logging.getLogger("databridge")
@@ -26,8 +31,14 @@ async def lifespan(app: FastAPI):
     )
     logger.info("Starting %s [debug=%s]", settings.APP_NAME, settings.DEBUG)
     await init_db()
+    await init_async_redis()
+    token_revocations.start()
+    event_hub.start()
     yield
     logger.info("Shutting down %s", settings.APP_NAME)
+    await event_hub.close()
+    await token_revocations.close()
+    await close_async_redis()
     await close_db()
 
 
@@ -37,6 +48,7 @@ app = FastAPI(
     redoc_url="/api/redoc" if settings.DEBUG else None,
     openapi_url="/api/openapi.json" if settings.DEBUG else None,
     lifespan=lifespan,
+    default_response_class=APIJSONResponse,
 )
 
 app.add_middleware(
@@ -47,6 +59,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.add_middleware(RequestLoggingMiddleware)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE_BYTES)
 
 app.include_router(api_router)
 
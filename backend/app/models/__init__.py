@@ -8,7 +8,16 @@ from backend.app.models.transfer import (
 )
 from backend.app.models.approval import Approval, ApprovalStatus
 from backend.app.models.history import TransferHistory
-from backend.app.models.notification import Notification, NotificationType
+from backend.app.models.notification import (
+    Notification,
+    NotificationReadCursor,
+    NotificationType,
+)
+from backend.app.models.analytics import (
+    RollupWatermark,
+    StageDurationRollup,
+    TransferDailyRollup,
+)
 
 __all__ = [
     "User",
@@ -22,5 +31,9 @@ __all__ = [
     "ApprovalStatus",
     "TransferHistory",
     "Notification",
+    "NotificationReadCursor",
     "NotificationType",
+    "RollupWatermark",
+    "StageDurationRollup",
+    "TransferDailyRollup",
 ]
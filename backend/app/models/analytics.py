@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+from sqlalchemy import BigInteger, Date, DateTime, Enum, Float, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.core.database import Base
+from backend.app.models.transfer import TransferStatus
+
+
+class RollupWatermark(Base):
+    """Last source row folded into the rollups, per source."""
+
+    __tablename__ = "rollup_watermarks"
+
+    source: Mapped[str] = mapped_column(String(50), primary_key=True)
+    last_id: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+
+class TransferDailyRollup(Base):
+    """Transfers (and their bytes) entering each status, per UTC day."""
+
+    __tablename__ = "transfer_daily_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[TransferStatus] = mapped_column(
+        Enum(TransferStatus, values_callable=lambda e: [x.value for x in e]), primary_key=True,
+    )
+    entered: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_bytes: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+
+
+class StageDurationRollup(Base):
+    """Histogram of time spent in each status, by the UTC day it was left.
+
+    Buckets are logarithmic (see ``services.analytics_service``) so days and
+    weeks can be merged and percentiles read back without the raw durations.
+    """
+
+    __tablename__ = "stage_duration_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[TransferStatus] = mapped_column(
+        Enum(TransferStatus, values_callable=lambda e: [x.value for x in e]), primary_key=True,
+    )
+    bucket: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_seconds: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
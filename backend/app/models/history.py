@@ -3,26 +3,35 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text, event, select
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.app.core.database import Base
+from backend.app.models.transfer import Transfer, TransferStatus
 
 if TYPE_CHECKING:
-    from backend.app.models.transfer import Transfer
     from backend.app.models.user import User
 
 
 class TransferHistory(Base):
     __tablename__ = "transfer_history"
+    __table_args__ = (
+        Index("ix_transfer_history_created_at_id", "created_at", "id"),
+        Index("ix_transfer_history_transfer_created_at_id", "transfer_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     transfer_id: Mapped[int] = mapped_column(
-        ForeignKey("transfers.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("transfers.id", ondelete="CASCADE"), nullable=False
     )
     user_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True)
     action: Mapped[str] = mapped_column(String(100), nullable=False)
+    # The transfer's status once this entry was written; the analytics
+    # rollups read stage transitions from it.
+    status: Mapped[Optional[TransferStatus]] = mapped_column(
+        Enum(TransferStatus, values_callable=lambda e: [x.value for x in e]), nullable=True,
+    )
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     metadata_json: Mapped[Optional[dict]] = mapped_column("metadata", JSON, nullable=True)
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
@@ -38,3 +47,13 @@ class TransferHistory(Base):
 
     def __repr__(self) -> str:
         return f"<TransferHistory transfer_id={self.transfer_id} action={self.action}>"
+
+
+@event.listens_for(TransferHistory, "before_insert")
+def _stamp_status(mapper, connection, target: TransferHistory) -> None:
+    # Transfers are flushed before their history, so this sees a status
+    # changed in the same flush.
+    if target.status is None:
+        target.status = (
+            select(Transfer.status).where(Transfer.id == target.transfer_id).scalar_subquery()
+        )
@@ -2,15 +2,28 @@ from __future__ import annotations
 
 import enum
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Optional
+from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    column,
+    event,
+    func,
+    insert,
+    select,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.app.core.database import Base
-
-if TYPE_CHECKING:
-    from backend.app.models.user import User
+from backend.app.models.user import User, UserRole
 
 
 class NotificationType(str, enum.Enum):
@@ -28,10 +41,34 @@ class NotificationType(str, enum.Enum):
 
 
 class Notification(Base):
+    """A notification for one user, or a broadcast to every user in ``target_role``.
+
+    Broadcasts are a single row; whether a user has read one is decided by
+    their NotificationReadCursor rather than ``is_read``.
+    """
+
     __tablename__ = "notifications"
+    __table_args__ = (
+        CheckConstraint(
+            "(user_id IS NULL) <> (target_role IS NULL)",
+            name="ck_notifications_user_or_role",
+        ),
+        Index("ix_notifications_user_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_notifications_role_created_at_id", "target_role", "created_at", "id"),
+        # Unread personal notifications only: mark-all-read and the counter
+        # rebuild touch these and nothing else.
+        Index(
+            "ix_notifications_user_unread", "user_id", "id",
+            postgresql_where=column("is_read").is_(False),
+            sqlite_where=column("is_read").is_(False),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
+    user_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True)
+    target_role: Mapped[Optional[UserRole]] = mapped_column(
+        Enum(UserRole, values_callable=lambda e: [x.value for x in e]), nullable=True,
+    )
     transfer_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey("transfers.id", ondelete="SET NULL"), nullable=True
     )
@@ -46,9 +83,45 @@ class Notification(Base):
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
     )
 
-    user: Mapped[User] = relationship(
+    user: Mapped[Optional[User]] = relationship(
         "User", back_populates="notifications", foreign_keys=[user_id]
     )
 
     def __repr__(self) -> str:
+        if self.target_role is not None:
+            return f"<Notification role={self.target_role.value} type={self.type.value}>"
         return f"<Notification user_id={self.user_id} type={self.type.value}>"
+
+
+class NotificationReadCursor(Base):
+    """Highest broadcast notification id a user has read."""
+
+    __tablename__ = "notification_read_cursors"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True,
+    )
+    last_read_id: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+@event.listens_for(User, "after_insert")
+def _start_read_cursor(mapper, connection, target: User) -> None:
+    # New accounts start caught up instead of inheriting every past broadcast as unread.
+    latest = (
+        select(func.coalesce(func.max(Notification.id), 0))
+        .where(Notification.target_role.isnot(None))
+        .scalar_subquery()
+    )
+    connection.execute(
+        insert(NotificationReadCursor).values(
+            user_id=target.id,
+            last_read_id=latest,
+            updated_at=datetime.now(timezone.utc),
+        )
+    )
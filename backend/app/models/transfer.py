@@ -7,12 +7,17 @@ from typing import TYPE_CHECKING, List, Optional
 from sqlalchemy import (
     BigInteger,
     Boolean,
+    DDL,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
+    Sequence,
     String,
     Text,
+    column,
+    event,
 )
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -63,8 +68,53 @@ class TransferCategory(str, enum.Enum):
     OTHER = "other"
 
 
+PENDING_APPROVAL_STATUSES = ("pending_team_lead", "pending_supervisor", "pending_line_producer")
+IN_FLIGHT_STATUSES = ("scanning", "copying", "transferring", "verifying")
+
+# Numbers the TRF-xxxxx references. Only created on PostgreSQL; see
+# ``TransferService._generate_reference`` for the SQLite stand-in.
+TRANSFER_REFERENCE_SEQ = Sequence("transfer_reference_seq", metadata=Base.metadata)
+
+
+def format_size(num_bytes: int) -> str:
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if abs(size) < 1024.0:
+            return f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} PB"
+
+
+def elapsed_seconds(start: Optional[datetime], end: Optional[datetime]) -> Optional[float]:
+    if start is None or end is None:
+        return None
+    # SQLite hands back naive datetimes; everything is stored as UTC.
+    if start.tzinfo is not None:
+        start = start.astimezone(timezone.utc).replace(tzinfo=None)
+    if end.tzinfo is not None:
+        end = end.astimezone(timezone.utc).replace(tzinfo=None)
+    return (end - start).total_seconds()
+
+
 class Transfer(Base):
     __tablename__ = "transfers"
+    # Keyset pagination walks (created_at, id) newest-first, optionally
+    # within one artist's or one status's transfers. The partial indexes stay
+    # small however many transfers have finished: the approval queues, and
+    # the stale-transfer sweep over in-flight work.
+    __table_args__ = (
+        Index("ix_transfers_created_at_id", "created_at", "id"),
+        Index("ix_transfers_artist_created_at_id", "artist_id", "created_at", "id"),
+        Index("ix_transfers_status_created_at_id", "status", "created_at", "id"),
+        Index(
+            "ix_transfers_pending_created_at", "created_at",
+            postgresql_where=column("status").in_(PENDING_APPROVAL_STATUSES),
+        ),
+        Index(
+            "ix_transfers_in_flight_updated_at", "updated_at",
+            postgresql_where=column("status").in_(IN_FLIGHT_STATUSES),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     reference: Mapped[str] = mapped_column(String(20), unique=True, nullable=False, index=True)
@@ -75,7 +125,7 @@ class Transfer(Base):
     )
     status: Mapped[TransferStatus] = mapped_column(
         Enum(TransferStatus, values_callable=lambda e: [x.value for x in e]),
-        default=TransferStatus.UPLOADED, nullable=False, index=True,
+        default=TransferStatus.UPLOADED, nullable=False,
     )
     priority: Mapped[TransferPriority] = mapped_column(
         Enum(TransferPriority, values_callable=lambda e: [x.value for x in e]),
@@ -101,7 +151,10 @@ class Transfer(Base):
     scan_passed: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
 
     transfer_started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
-    transfer_completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Old value is loaded before overwriting so status events can report it.
+    transfer_completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True, active_history=True,
+    )
     transfer_verified: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
     transfer_method: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
@@ -135,23 +188,41 @@ class Transfer(Base):
 
     @property
     def size_display(self) -> str:
-        size = float(self.total_size_bytes)
-        for unit in ("B", "KB", "MB", "GB", "TB"):
-            if abs(size) < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} PB"
+        return format_size(self.total_size_bytes)
 
     def __repr__(self) -> str:
         return f"<Transfer {self.reference}>"
 
 
+# PostgreSQL-only search support, kept out of the mapping so the SQLite test
+# database still builds (migration 005 adds the same to existing databases):
+# a generated tsvector over the descriptive text, and trigram indexes so
+# substring matches on codes and names don't scan the table.
+_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "ALTER TABLE transfers ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, '') || ' ' || "
+    "coalesce(notes, '') || ' ' || coalesce(shotgrid_entity_name, '') || ' ' || "
+    "coalesce(tags::text, ''))) STORED",
+    "CREATE INDEX ix_transfers_search_vector ON transfers USING gin (search_vector)",
+    "CREATE INDEX ix_transfers_reference_trgm ON transfers USING gin (reference gin_trgm_ops)",
+    "CREATE INDEX ix_transfers_name_trgm ON transfers USING gin (name gin_trgm_ops)",
+    "CREATE INDEX ix_transfers_shotgrid_entity_name_trgm ON transfers "
+    "USING gin (shotgrid_entity_name gin_trgm_ops)",
+]
+for _statement in _SEARCH_DDL:
+    event.listen(Transfer.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+
 class TransferFile(Base):
     __tablename__ = "transfer_files"
+    __table_args__ = (
+        Index("ix_transfer_files_transfer_uploaded_at_id", "transfer_id", "uploaded_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     transfer_id: Mapped[int] = mapped_column(
-        ForeignKey("transfers.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("transfers.id", ondelete="CASCADE"), nullable=False
     )
     filename: Mapped[str] = mapped_column(String(500), nullable=False)
     original_path: Mapped[str] = mapped_column(String(1000), nullable=False)
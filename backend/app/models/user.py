@@ -55,16 +55,16 @@ class User(Base):
     )
 
     transfers: Mapped[List[Transfer]] = relationship(
-        "Transfer", back_populates="artist", foreign_keys="Transfer.artist_id", lazy="selectin"
+        "Transfer", back_populates="artist", foreign_keys="Transfer.artist_id"
     )
     approvals_given: Mapped[List[Approval]] = relationship(
-        "Approval", back_populates="approver", foreign_keys="Approval.approver_id", lazy="selectin"
+        "Approval", back_populates="approver", foreign_keys="Approval.approver_id"
     )
     history_entries: Mapped[List[TransferHistory]] = relationship(
-        "TransferHistory", back_populates="user", foreign_keys="TransferHistory.user_id", lazy="selectin"
+        "TransferHistory", back_populates="user", foreign_keys="TransferHistory.user_id"
     )
     notifications: Mapped[List[Notification]] = relationship(
-        "Notification", back_populates="user", foreign_keys="Notification.user_id", lazy="selectin"
+        "Notification", back_populates="user", foreign_keys="Notification.user_id"
     )
 
     def __repr__(self) -> str:
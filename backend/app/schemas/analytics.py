@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Dict, List, Literal
+
+from pydantic import BaseModel
+
+from backend.app.models.transfer import TransferStatus
+
+Period = Literal["day", "week"]
+
+
+class ThroughputPoint(BaseModel):
+    period_start: date
+    entered: Dict[TransferStatus, int]
+    transferred: int = 0
+    bytes_delivered: int = 0
+
+
+class ThroughputResponse(BaseModel):
+    period: Period
+    items: List[ThroughputPoint]
+
+
+class StageDurationPoint(BaseModel):
+    period_start: date
+    stage: TransferStatus
+    count: int
+    avg_hours: float
+    p50_hours: float
+    p95_hours: float
+
+
+class StageDurationResponse(BaseModel):
+    period: Period
+    items: List[StageDurationPoint]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -17,6 +17,26 @@ class RejectAction(BaseModel):
     reason: str = Field(..., min_length=10)
 
 
+class BulkApprovalAction(BaseModel):
+    transfer_ids: List[int] = Field(..., min_length=1, max_length=200)
+    comment: Optional[str] = None
+
+
+class BulkRejectAction(BaseModel):
+    transfer_ids: List[int] = Field(..., min_length=1, max_length=200)
+    reason: str = Field(..., min_length=10)
+
+
+class BulkSkipped(BaseModel):
+    transfer_id: int
+    detail: str
+
+
+class BulkApprovalResponse(BaseModel):
+    updated: List[int]
+    skipped: List[BulkSkipped]
+
+
 class ApprovalResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
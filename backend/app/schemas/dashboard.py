@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from typing import List
+
+from pydantic import BaseModel
+
+from backend.app.schemas.transfer import TransferStatsResponse, TransferSummary
+
+
+class DashboardResponse(BaseModel):
+    stats: TransferStatsResponse
+    pending_approvals: int
+    unread_notifications: int
+    recent_transfers: List[TransferSummary]
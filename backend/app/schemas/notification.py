@@ -6,6 +6,7 @@ from typing import List, Optional
 from pydantic import BaseModel, ConfigDict
 
 from backend.app.models.notification import NotificationType
+from backend.app.models.user import UserRole
 
 
 class NotificationResponse(BaseModel):
@@ -13,6 +14,7 @@ class NotificationResponse(BaseModel):
 
     id: int
     transfer_id: Optional[int] = None
+    target_role: Optional[UserRole] = None
     type: NotificationType
     title: str
     message: Optional[str] = None
@@ -24,3 +26,4 @@ class NotificationListResponse(BaseModel):
     items: List[NotificationResponse]
     total: int
     unread_count: int
+    next_cursor: Optional[str] = None
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -34,10 +34,16 @@ class TransferFileResponse(BaseModel):
     filename: str
     size_bytes: int
     checksum_sha256: Optional[str] = None
+    checksum_verified: Optional[bool] = None
     virus_scan_status: str
     uploaded_at: datetime
 
 
+class TransferFileListResponse(BaseModel):
+    items: List[TransferFileResponse]
+    next_cursor: Optional[str] = None
+
+
 class ApprovalChainItem(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -95,12 +101,60 @@ class TransferResponse(BaseModel):
     size_display: str = ""
 
 
+class ApprovalStageSummary(BaseModel):
+    role: UserRole
+    status: ApprovalStatus
+    approver_name: Optional[str] = None
+
+
+class TransferSummary(BaseModel):
+    """List-row view of a transfer: scalar columns only, no files."""
+
+    id: int
+    reference: str
+    name: str
+    category: Optional[TransferCategory] = None
+    status: TransferStatus
+    priority: TransferPriority
+    artist_id: int
+    artist_name: str
+    total_files: int
+    total_size_bytes: int
+    size_display: str = ""
+    shotgrid_entity_name: Optional[str] = None
+    rejection_reason: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    approval_chain: List[ApprovalStageSummary] = []
+
+
 class TransferListResponse(BaseModel):
-    items: List[TransferResponse]
-    total: int
+    items: List[TransferSummary]
+    total: Optional[int] = None
+    total_estimated: bool = False
     page: int
     per_page: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+class TransferBatchResponse(BaseModel):
+    """Summaries keyed by transfer id; ``missing`` ids don't exist or aren't
+    visible to the caller."""
+
+    items: Dict[int, TransferSummary]
+    missing: List[int] = []
+
+
+class AutocompleteReference(BaseModel):
+    id: int
+    reference: str
+    name: str
+
+
+class TransferAutocompleteResponse(BaseModel):
+    references: List[AutocompleteReference]
+    shots: List[str]
 
 
 class TransferStatsResponse(BaseModel):
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import logging
+import math
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import settings
+from backend.app.models.analytics import RollupWatermark, StageDurationRollup, TransferDailyRollup
+from backend.app.models.history import TransferHistory
+from backend.app.models.transfer import Transfer, TransferStatus, elapsed_seconds
+from backend.app.schemas.analytics import (
+    Period,
+    StageDurationPoint,
+    StageDurationResponse,
+    ThroughputPoint,
+    ThroughputResponse,
+)
+
+logger = logging.getLogger("databridge.analytics_service")
+
+HISTORY_SOURCE = "transfer_history"
+
+# Duration histogram buckets grow by 2^(1/4) (~19%), so a percentile read
+# back from a bucket midpoint is within ~10% of the true value.
+_BUCKET_GROWTH = 2 ** 0.25
+
+
+def duration_bucket(seconds: float) -> int:
+    if seconds < 1:
+        return 0
+    return int(math.log(seconds, _BUCKET_GROWTH)) + 1
+
+
+def bucket_midpoint(bucket: int) -> float:
+    if bucket <= 0:
+        return 0.5
+    return _BUCKET_GROWTH ** (bucket - 0.5)
+
+
+def _utc_day(ts: datetime) -> date:
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc)
+    return ts.date()
+
+
+def _period_start(day: date, period: Period) -> date:
+    return day - timedelta(days=day.weekday()) if period == "week" else day
+
+
+def _percentile(histogram: Dict[int, int], q: float) -> float:
+    total = sum(histogram.values())
+    rank = q * total
+    seen = 0
+    for bucket in sorted(histogram):
+        seen += histogram[bucket]
+        if seen >= rank:
+            return bucket_midpoint(bucket)
+    return 0.0
+
+
+# ── Rollup (Celery) ─────────────────────────────────────────────────
+
+
+def _upsert(db: Session):
+    # ON CONFLICT has the same shape on both; tests run on SQLite.
+    return postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+
+
+def _status_started(db: Session, transfer_ids, up_to_id: int) -> Dict[int, Tuple[TransferStatus, datetime]]:
+    """(current status, when it began) per transfer, from history up to
+    ``up_to_id``. Rows that don't change the status (e.g.
+    ``verification_started``) are still stamped with it, so the start is the
+    last row whose status differs from the row before it."""
+    ordered = select(
+        TransferHistory.id,
+        TransferHistory.transfer_id,
+        TransferHistory.status,
+        TransferHistory.created_at,
+        func.lag(TransferHistory.status).over(
+            partition_by=TransferHistory.transfer_id, order_by=TransferHistory.id,
+        ).label("previous"),
+    ).where(
+        TransferHistory.transfer_id.in_(transfer_ids),
+        TransferHistory.id <= up_to_id,
+        TransferHistory.status.isnot(None),
+    ).subquery()
+    changes = db.execute(
+        select(ordered.c.transfer_id, ordered.c.status, ordered.c.created_at)
+        .where(or_(ordered.c.previous.is_(None), ordered.c.previous != ordered.c.status))
+        .order_by(ordered.c.id)
+    )
+    return {tid: (st, at) for tid, st, at in changes}
+
+
+def rollup_history(db: Session, batch_size: Optional[int] = None) -> int:
+    """Fold the next batch of TransferHistory rows past the watermark into the rollups.
+
+    Only rows that change a transfer's status count. The time spent in the
+    previous status is measured from when the transfer entered it, which
+    may sit before the watermark. The batch stops at the first row newer
+    than ``ANALYTICS_ROLLUP_SETTLE_SECONDS``, so ids still held by open
+    transactions aren't skipped. The watermark row is locked for the whole
+    batch, so overlapping runs take turns rather than counting rows twice.
+    Returns the number of rows consumed.
+    """
+    batch_size = batch_size or settings.ANALYTICS_ROLLUP_BATCH_SIZE
+    insert = _upsert(db)
+    db.execute(
+        insert(RollupWatermark)
+        .values(source=HISTORY_SOURCE, last_id=0, updated_at=datetime.now(timezone.utc))
+        .on_conflict_do_nothing(index_elements=[RollupWatermark.source])
+    )
+    watermark = db.get(RollupWatermark, HISTORY_SOURCE, with_for_update=True)
+
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.ANALYTICS_ROLLUP_SETTLE_SECONDS)
+    rows = db.execute(
+        select(
+            TransferHistory.id,
+            TransferHistory.transfer_id,
+            TransferHistory.status,
+            TransferHistory.created_at,
+        )
+        .where(TransferHistory.id > watermark.last_id)
+        .order_by(TransferHistory.id)
+        .limit(batch_size)
+    ).all()
+    settled = next((i for i, r in enumerate(rows) if elapsed_seconds(r.created_at, cutoff) < 0), len(rows))
+    rows = rows[:settled]
+    if not rows:
+        db.rollback()
+        return 0
+
+    transfer_ids = {r.transfer_id for r in rows if r.status is not None}
+    current = _status_started(db, transfer_ids, watermark.last_id)
+    sizes = dict(db.execute(
+        select(Transfer.id, Transfer.total_size_bytes).where(Transfer.id.in_(transfer_ids))
+    ).all())
+
+    entered: Dict[Tuple[date, TransferStatus], List[int]] = defaultdict(lambda: [0, 0])
+    durations: Dict[Tuple[date, TransferStatus, int], List[float]] = defaultdict(lambda: [0, 0.0])
+    for row in rows:
+        if row.status is None:
+            continue
+        previous = current.get(row.transfer_id)
+        if previous is not None and previous[0] == row.status:
+            continue
+        day = _utc_day(row.created_at)
+        counts = entered[(day, row.status)]
+        counts[0] += 1
+        counts[1] += sizes.get(row.transfer_id, 0)
+        if previous is not None:
+            seconds = max(elapsed_seconds(previous[1], row.created_at), 0.0)
+            hist = durations[(day, previous[0], duration_bucket(seconds))]
+            hist[0] += 1
+            hist[1] += seconds
+        current[row.transfer_id] = (row.status, row.created_at)
+
+    if entered:
+        stmt = insert(TransferDailyRollup).values([
+            {"day": day, "status": st, "entered": count, "total_bytes": size}
+            for (day, st), (count, size) in entered.items()
+        ])
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[TransferDailyRollup.day, TransferDailyRollup.status],
+            set_={
+                "entered": TransferDailyRollup.entered + stmt.excluded.entered,
+                "total_bytes": TransferDailyRollup.total_bytes + stmt.excluded.total_bytes,
+            },
+        ))
+    if durations:
+        stmt = insert(StageDurationRollup).values([
+            {"day": day, "status": st, "bucket": bucket, "count": count, "total_seconds": seconds}
+            for (day, st, bucket), (count, seconds) in durations.items()
+        ])
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[StageDurationRollup.day, StageDurationRollup.status, StageDurationRollup.bucket],
+            set_={
+                "count": StageDurationRollup.count + stmt.excluded.count,
+                "total_seconds": StageDurationRollup.total_seconds + stmt.excluded.total_seconds,
+            },
+        ))
+
+    watermark.last_id = rows[-1].id
+    watermark.updated_at = datetime.now(timezone.utc)
+    db.commit()
+    return len(rows)
+
+
+# ── Reads (API) ─────────────────────────────────────────────────────
+
+
+class AnalyticsService:
+    """Pipeline analytics, read only from the rollup tables."""
+
+    async def throughput(
+        self,
+        db: AsyncSession,
+        since: date,
+        until: date,
+        period: Period = "day",
+    ) -> ThroughputResponse:
+        result = await db.execute(
+            select(TransferDailyRollup.day, TransferDailyRollup.status,
+                   TransferDailyRollup.entered, TransferDailyRollup.total_bytes)
+            .where(TransferDailyRollup.day.between(since, until))
+        )
+        points: Dict[date, ThroughputPoint] = {}
+        for day, st, count, size in result.all():
+            start = _period_start(day, period)
+            point = points.setdefault(start, ThroughputPoint(period_start=start, entered={}))
+            point.entered[st] = point.entered.get(st, 0) + count
+            if st == TransferStatus.TRANSFERRED:
+                point.transferred += count
+                point.bytes_delivered += size
+        return ThroughputResponse(period=period, items=[points[k] for k in sorted(points)])
+
+    async def stage_durations(
+        self,
+        db: AsyncSession,
+        since: date,
+        until: date,
+        period: Period = "day",
+        stages: Optional[List[TransferStatus]] = None,
+    ) -> StageDurationResponse:
+        query = select(
+            StageDurationRollup.day, StageDurationRollup.status, StageDurationRollup.bucket,
+            StageDurationRollup.count, StageDurationRollup.total_seconds,
+        ).where(StageDurationRollup.day.between(since, until))
+        if stages:
+            query = query.where(StageDurationRollup.status.in_(stages))
+
+        merged: Dict[Tuple[date, TransferStatus], Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        seconds: Dict[Tuple[date, TransferStatus], float] = defaultdict(float)
+        for day, st, bucket, count, total in (await db.execute(query)).all():
+            key = (_period_start(day, period), st)
+            merged[key][bucket] += count
+            seconds[key] += total
+
+        items = []
+        for (start, st) in sorted(merged, key=lambda k: (k[0], k[1].value)):
+            histogram = merged[(start, st)]
+            count = sum(histogram.values())
+            items.append(StageDurationPoint(
+                period_start=start,
+                stage=st,
+                count=count,
+                avg_hours=round(seconds[(start, st)] / count / 3600.0, 2),
+                p50_hours=round(_percentile(histogram, 0.50) / 3600.0, 2),
+                p95_hours=round(_percentile(histogram, 0.95) / 3600.0, 2),
+            ))
+        return StageDurationResponse(period=period, items=items)
+
+
+analytics_service = AnalyticsService()
@@ -1,20 +1,35 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from backend.app.core.principal import Principal
 from backend.app.models.approval import Approval, ApprovalStatus
 from backend.app.models.history import TransferHistory
 from backend.app.models.notification import Notification, NotificationType
 from backend.app.models.transfer import Transfer, TransferStatus
-from backend.app.models.user import User, UserRole
+from backend.app.models.user import UserRole
+from backend.app.schemas.approval import BulkApprovalResponse, BulkSkipped
 from backend.app.schemas.transfer import ApprovalChainItem
+from backend.app.services.notification_dispatcher import (
+    approver_recipients,
+    notification_dispatcher,
+)
+from backend.app.services.transfer_service import (
+    detail_select,
+    fetch_summaries,
+    summary_select,
+    transition_many,
+    transition_status,
+)
+from backend.app.services.transfer_stats import ALL_SCOPE, transfer_stats
 
 logger = logging.getLogger("databridge.approval_service")
 
@@ -41,6 +56,25 @@ WORKFLOW: Dict[str, dict] = {
 
 _ROLE_TO_ENUM = {r.value: r for r in UserRole}
 
+_ROLE_STAGE = {step["required_role"]: stage for stage, step in WORKFLOW.items()}
+
+# References listed in a bulk notification before "and N more".
+_BULK_LISTED_REFERENCES = 10
+
+# Statuses that make up each role's approvals queue.
+_PENDING_STATUSES: Dict[str, List[TransferStatus]] = {
+    "admin": [
+        TransferStatus.PENDING_TEAM_LEAD,
+        TransferStatus.PENDING_SUPERVISOR,
+        TransferStatus.PENDING_LINE_PRODUCER,
+    ],
+    "team_lead": [TransferStatus.PENDING_TEAM_LEAD],
+    "supervisor": [TransferStatus.PENDING_SUPERVISOR],
+    "line_producer": [TransferStatus.PENDING_LINE_PRODUCER],
+    "data_team": [TransferStatus.APPROVED, TransferStatus.SCAN_PASSED],
+    "it_team": [TransferStatus.READY_FOR_TRANSFER],
+}
+
 _CHAIN_ORDER = [
     UserRole.TEAM_LEAD,
     UserRole.SUPERVISOR,
@@ -50,100 +84,111 @@ _CHAIN_ORDER = [
 ]
 
 
-class ApprovalService:
-
-    async def get_pending(self, user: User, db: AsyncSession) -> List[Transfer]:
-        role = user.role.value if hasattr(user.role, "value") else user.role
+def _pending_statuses(user: Principal) -> List[TransferStatus]:
+    role = user.role.value if hasattr(user.role, "value") else user.role
+    return _PENDING_STATUSES.get(role, [])
 
-        base = select(Transfer).options(
-            selectinload(Transfer.artist),
-            selectinload(Transfer.files),
-            selectinload(Transfer.approvals).selectinload(Approval.approver),
-        )
 
-        if role == "admin":
-            statuses = [
-                TransferStatus.PENDING_TEAM_LEAD,
-                TransferStatus.PENDING_SUPERVISOR,
-                TransferStatus.PENDING_LINE_PRODUCER,
-            ]
-            q = base.where(Transfer.status.in_(statuses))
-        elif role == "team_lead":
-            q = base.where(Transfer.status == TransferStatus.PENDING_TEAM_LEAD)
-        elif role == "supervisor":
-            q = base.where(Transfer.status == TransferStatus.PENDING_SUPERVISOR)
-        elif role == "line_producer":
-            q = base.where(Transfer.status == TransferStatus.PENDING_LINE_PRODUCER)
-        elif role == "data_team":
-            q = base.where(
-                Transfer.status.in_([TransferStatus.APPROVED, TransferStatus.SCAN_PASSED])
-            )
-        elif role == "it_team":
-            q = base.where(Transfer.status == TransferStatus.READY_FOR_TRANSFER)
-        else:
-            return []
+def _reference_list(rows) -> str:
+    refs = ", ".join(row.reference for row in rows[:_BULK_LISTED_REFERENCES])
+    extra = len(rows) - _BULK_LISTED_REFERENCES
+    return f"{refs} and {extra} more" if extra > 0 else refs
 
-        q = q.order_by(Transfer.created_at.desc())
-        result = await db.execute(q)
-        return list(result.scalars().unique().all())
 
-    async def get_pending_count(self, user: User, db: AsyncSession) -> int:
-        items = await self.get_pending(user, db)
-        return len(items)
+class ApprovalService:
 
-    async def approve(
-        self,
-        transfer_id: int,
-        user: User,
-        comment: Optional[str],
-        db: AsyncSession,
-    ) -> Transfer:
+    async def get_pending(self, user: Principal, db: AsyncSession) -> List[dict]:
+        statuses = _pending_statuses(user)
+        if not statuses:
+            return []
+        q = summary_select().where(Transfer.status.in_(statuses)).order_by(Transfer.created_at.desc())
+        return await fetch_summaries(db, q)
+
+    async def get_pending_count(self, user: Principal, db: AsyncSession) -> int:
+        """Size of ``user``'s queue, summed from the cached ``all`` stats scope
+        (kept current by every status transition) when it's loaded, else a
+        COUNT over the same statuses ``get_pending`` lists."""
+        statuses = _pending_statuses(user)
+        if not statuses:
+            return 0
+        buckets = (await transfer_stats.get([ALL_SCOPE])).get(ALL_SCOPE)
+        if buckets is not None:
+            return sum(buckets.get(s.value, (0, 0.0, 0))[0] for s in statuses)
         result = await db.execute(
-            select(Transfer).where(Transfer.id == transfer_id)
+            select(func.count()).select_from(Transfer).where(Transfer.status.in_(statuses))
         )
-        transfer = result.scalar_one_or_none()
-        if transfer is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transfer not found")
+        return result.scalar() or 0
 
-        current_status = transfer.status.value if hasattr(transfer.status, "value") else transfer.status
-        step = WORKFLOW.get(current_status)
-        if step is None:
+    async def _stage_for(self, transfer_id: int, user: Principal, db: AsyncSession, verb: str) -> str:
+        """The approval stage ``user`` acts at. Stage approvers only ever act at
+        their own stage; only an admin's depends on the transfer, so only that
+        needs a read."""
+        user_role = user.role.value if hasattr(user.role, "value") else user.role
+        if user_role in _ROLE_STAGE:
+            return _ROLE_STAGE[user_role]
+        if user_role != "admin":
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Transfer status '{current_status}' is not an approval stage",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Role '{user_role}' cannot {verb} transfers",
             )
 
-        user_role = user.role.value if hasattr(user.role, "value") else user.role
-        if user_role != step["required_role"] and user_role != "admin":
+        current = (await db.execute(
+            select(Transfer.status).where(Transfer.id == transfer_id)
+        )).scalar_one_or_none()
+        if current is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transfer not found")
+        current_status = current.value if hasattr(current, "value") else current
+        if current_status not in WORKFLOW:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Role '{user_role}' cannot approve at stage '{step['label']}'",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Transfer status '{current_status}' is not an approval stage",
             )
+        return current_status
 
-        required_role_enum = _ROLE_TO_ENUM[step["required_role"]]
-        approval_result = await db.execute(
-            select(Approval).where(
+    async def _decide(
+        self,
+        db: AsyncSession,
+        transfer_id: int,
+        step: dict,
+        decision: ApprovalStatus,
+        user: Principal,
+        comment: Optional[str],
+    ) -> None:
+        result = await db.execute(
+            update(Approval)
+            .where(
                 Approval.transfer_id == transfer_id,
-                Approval.required_role == required_role_enum,
+                Approval.required_role == _ROLE_TO_ENUM[step["required_role"]],
                 Approval.status == ApprovalStatus.PENDING,
             )
+            .values(
+                status=decision,
+                approver_id=user.id,
+                comment=comment,
+                decided_at=datetime.now(timezone.utc),
+            ),
+            execution_options={"synchronize_session": False},
         )
-        approval = approval_result.scalar_one_or_none()
-        if approval is None:
+        if result.rowcount == 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="No pending approval record found for this stage",
             )
 
-        now = datetime.now(timezone.utc)
-        approval.status = ApprovalStatus.APPROVED
-        approval.approver_id = user.id
-        approval.comment = comment
-        approval.decided_at = now
-
-        old_status = current_status
+    async def approve(
+        self,
+        transfer_id: int,
+        user: Principal,
+        comment: Optional[str],
+        db: AsyncSession,
+    ) -> Transfer:
+        old_status = await self._stage_for(transfer_id, user, db, "approve")
+        step = WORKFLOW[old_status]
         new_status = step["next_status"]
-        transfer.status = TransferStatus(new_status)
+        transfer = await transition_status(
+            db, transfer_id, TransferStatus(old_status), TransferStatus(new_status),
+        )
+        await self._decide(db, transfer_id, step, ApprovalStatus.APPROVED, user, comment)
 
         db.add(TransferHistory(
             transfer_id=transfer.id,
@@ -162,31 +207,20 @@ class ApprovalService:
             role_enum = _ROLE_TO_ENUM.get(notify_role)
             if role_enum is None:
                 continue
-            users_result = await db.execute(
-                select(User).where(User.role == role_enum, User.is_active.is_(True))
-            )
-            for target_user in users_result.scalars().all():
-                db.add(Notification(
-                    user_id=target_user.id,
-                    transfer_id=transfer.id,
-                    type=NotificationType.APPROVAL_REQUIRED,
-                    title=f"Approval needed: {transfer.reference}",
-                    message=(
-                        f"Transfer '{transfer.name}' has been approved at {step['label']} "
-                        f"and now requires your review."
-                    ),
-                ))
+            db.add(Notification(
+                target_role=role_enum,
+                transfer_id=transfer.id,
+                type=NotificationType.APPROVAL_REQUIRED,
+                title=f"Approval needed: {transfer.reference}",
+                message=(
+                    f"Transfer '{transfer.name}' has been approved at {step['label']} "
+                    f"and now requires your review."
+                ),
+            ))
 
-        await db.flush()
         await db.commit()
 
-        refreshed = await db.execute(
-            select(Transfer).options(
-                selectinload(Transfer.artist),
-                selectinload(Transfer.files),
-                selectinload(Transfer.approvals).selectinload(Approval.approver),
-            ).where(Transfer.id == transfer.id)
-        )
+        refreshed = await db.execute(detail_select().where(Transfer.id == transfer_id))
         transfer = refreshed.scalar_one()
 
         logger.info(
@@ -198,56 +232,17 @@ class ApprovalService:
     async def reject(
         self,
         transfer_id: int,
-        user: User,
+        user: Principal,
         reason: str,
         db: AsyncSession,
     ) -> Transfer:
-        result = await db.execute(
-            select(Transfer).where(Transfer.id == transfer_id)
+        old_status = await self._stage_for(transfer_id, user, db, "reject")
+        step = WORKFLOW[old_status]
+        transfer = await transition_status(
+            db, transfer_id, TransferStatus(old_status), TransferStatus.REJECTED,
+            rejection_reason=reason,
         )
-        transfer = result.scalar_one_or_none()
-        if transfer is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transfer not found")
-
-        current_status = transfer.status.value if hasattr(transfer.status, "value") else transfer.status
-        step = WORKFLOW.get(current_status)
-        if step is None:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Transfer status '{current_status}' is not an approval stage",
-            )
-
-        user_role = user.role.value if hasattr(user.role, "value") else user.role
-        if user_role != step["required_role"] and user_role != "admin":
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Role '{user_role}' cannot reject at stage '{step['label']}'",
-            )
-
-        required_role_enum = _ROLE_TO_ENUM[step["required_role"]]
-        approval_result = await db.execute(
-            select(Approval).where(
-                Approval.transfer_id == transfer_id,
-                Approval.required_role == required_role_enum,
-                Approval.status == ApprovalStatus.PENDING,
-            )
-        )
-        approval = approval_result.scalar_one_or_none()
-        if approval is None:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No pending approval record found for this stage",
-            )
-
-        now = datetime.now(timezone.utc)
-        approval.status = ApprovalStatus.REJECTED
-        approval.approver_id = user.id
-        approval.comment = reason
-        approval.decided_at = now
-
-        old_status = current_status
-        transfer.status = TransferStatus.REJECTED
-        transfer.rejection_reason = reason
+        await self._decide(db, transfer_id, step, ApprovalStatus.REJECTED, user, reason)
 
         db.add(TransferHistory(
             transfer_id=transfer.id,
@@ -270,36 +265,22 @@ class ApprovalService:
             message=f"Your transfer '{transfer.name}' was rejected at {step['label']}. Reason: {reason}",
         ))
 
-        prev_approvals = await db.execute(
-            select(Approval).where(
-                Approval.transfer_id == transfer_id,
-                Approval.status == ApprovalStatus.APPROVED,
-                Approval.approver_id.isnot(None),
-            )
+        await notification_dispatcher.fan_out(
+            db,
+            approver_recipients(transfer_id),
+            exclude_user_ids=[transfer.artist_id],
+            transfer_id=transfer.id,
+            ntype=NotificationType.REJECTED,
+            title=f"Transfer rejected: {transfer.reference}",
+            message=(
+                f"Transfer '{transfer.name}' (which you previously approved) "
+                f"was rejected at {step['label']}. Reason: {reason}"
+            ),
         )
-        for prev in prev_approvals.scalars().all():
-            if prev.approver_id and prev.approver_id != transfer.artist_id:
-                db.add(Notification(
-                    user_id=prev.approver_id,
-                    transfer_id=transfer.id,
-                    type=NotificationType.REJECTED,
-                    title=f"Transfer rejected: {transfer.reference}",
-                    message=(
-                        f"Transfer '{transfer.name}' (which you previously approved) "
-                        f"was rejected at {step['label']}. Reason: {reason}"
-                    ),
-                ))
 
-        await db.flush()
         await db.commit()
 
-        refreshed = await db.execute(
-            select(Transfer).options(
-                selectinload(Transfer.artist),
-                selectinload(Transfer.files),
-                selectinload(Transfer.approvals).selectinload(Approval.approver),
-            ).where(Transfer.id == transfer.id)
-        )
+        refreshed = await db.execute(detail_select().where(Transfer.id == transfer_id))
         transfer = refreshed.scalar_one()
 
         logger.info(
@@ -308,6 +289,277 @@ class ApprovalService:
         )
         return transfer
 
+    # ── Bulk decisions ──────────────────────────────────────────────
+
+    async def _bulk_stages(
+        self, transfer_ids: List[int], user: Principal, db: AsyncSession, verb: str,
+    ) -> Dict[str, List[int]]:
+        """``transfer_ids`` grouped by the stage ``user`` decides them at."""
+        user_role = user.role.value if hasattr(user.role, "value") else user.role
+        if user_role in _ROLE_STAGE:
+            return {_ROLE_STAGE[user_role]: transfer_ids}
+        if user_role != "admin":
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Role '{user_role}' cannot {verb} transfers",
+            )
+        stages: Dict[str, List[int]] = defaultdict(list)
+        rows = await db.execute(select(Transfer.id, Transfer.status).where(Transfer.id.in_(transfer_ids)))
+        for tid, current in rows:
+            current = current.value if hasattr(current, "value") else current
+            if current in WORKFLOW:
+                stages[current].append(tid)
+        return stages
+
+    async def _bulk_transition(
+        self,
+        db: AsyncSession,
+        transfer_ids: List[int],
+        old_status: str,
+        new_status: TransferStatus,
+        decision: ApprovalStatus,
+        user: Principal,
+        comment: Optional[str],
+        **values,
+    ) -> list:
+        """Decide the stage's pending approval row of each of ``transfer_ids``
+        still at ``old_status``, then move exactly those transfers. Like
+        ``_decide`` for a single transfer, one without a pending row isn't
+        moved. Returns the rows that moved."""
+        step = WORKFLOW[old_status]
+        stage = (
+            Approval.required_role == _ROLE_TO_ENUM[step["required_role"]],
+            Approval.status == ApprovalStatus.PENDING,
+        )
+        at_stage = select(Transfer.id).where(
+            Transfer.id.in_(transfer_ids), Transfer.status == TransferStatus(old_status),
+        )
+        decided = list(dict.fromkeys((await db.execute(
+            update(Approval)
+            .where(Approval.transfer_id.in_(at_stage), *stage)
+            .values(status=decision, approver_id=user.id, comment=comment, decided_at=datetime.now(timezone.utc))
+            .returning(Approval.transfer_id),
+            execution_options={"synchronize_session": False},
+        )).scalars()))
+        if not decided:
+            return []
+        rows = await transition_many(db, decided, TransferStatus(old_status), new_status, **values)
+
+        # A transfer moved by someone else in between keeps its row pending.
+        stranded = set(decided).difference(row.id for row in rows)
+        if stranded:
+            await db.execute(
+                update(Approval)
+                .where(
+                    Approval.transfer_id.in_(stranded),
+                    Approval.required_role == _ROLE_TO_ENUM[step["required_role"]],
+                    Approval.status == decision,
+                    Approval.approver_id == user.id,
+                )
+                .values(status=ApprovalStatus.PENDING, approver_id=None, comment=None, decided_at=None),
+                execution_options={"synchronize_session": False},
+            )
+        return rows
+
+    async def _bulk_result(
+        self,
+        transfer_ids: List[int],
+        moved: List[int],
+        stages: Dict[str, List[int]],
+        db: AsyncSession,
+    ) -> BulkApprovalResponse:
+        moved_set = set(moved)
+        missed = [tid for tid in transfer_ids if tid not in moved_set]
+        current = {}
+        if missed:
+            current = dict((await db.execute(
+                select(Transfer.id, Transfer.status).where(Transfer.id.in_(missed))
+            )).all())
+        stage_of = {tid: stage for stage, ids in stages.items() for tid in ids}
+
+        def detail(tid: int) -> str:
+            if tid not in current:
+                return "Transfer not found"
+            if current[tid].value == stage_of.get(tid):
+                return "No pending approval record found for this stage"
+            return f"Transfer status is '{current[tid].value}'"
+
+        skipped = [BulkSkipped(transfer_id=tid, detail=detail(tid)) for tid in missed]
+        return BulkApprovalResponse(updated=moved, skipped=skipped)
+
+    async def bulk_approve(
+        self,
+        transfer_ids: List[int],
+        user: Principal,
+        comment: Optional[str],
+        db: AsyncSession,
+    ) -> BulkApprovalResponse:
+        """Approve many transfers in one transaction.
+
+        Set-based per stage: one conditional UPDATE of the transfers, one of
+        their approval rows, one batch of history rows, and a single
+        notification per role to notify rather than one per transfer.
+        Transfers that aren't at the stage (or don't exist) are skipped.
+        """
+        transfer_ids = list(dict.fromkeys(transfer_ids))
+        stages = await self._bulk_stages(transfer_ids, user, db, "approve")
+
+        moved: List[int] = []
+        history = []
+        to_notify: Dict[str, list] = defaultdict(list)
+        for old_status, ids in stages.items():
+            step = WORKFLOW[old_status]
+            new_status = TransferStatus(step["next_status"])
+            rows = await self._bulk_transition(
+                db, ids, old_status, new_status, ApprovalStatus.APPROVED, user, comment,
+            )
+            if not rows:
+                continue
+            for row in rows:
+                moved.append(row.id)
+                history.append({
+                    "transfer_id": row.id,
+                    "user_id": user.id,
+                    "action": "approved",
+                    "status": new_status,
+                    "description": f"{step['label']} approved by {user.display_name}",
+                    "metadata_json": {
+                        "old_status": old_status,
+                        "new_status": new_status.value,
+                        "approver": user.username,
+                        "comment": comment,
+                        "bulk": True,
+                    },
+                })
+            for notify_role in step.get("notify_roles", []):
+                to_notify[notify_role].extend(rows)
+
+        if history:
+            await db.execute(insert(TransferHistory), history)
+        for notify_role, rows in to_notify.items():
+            role_enum = _ROLE_TO_ENUM.get(notify_role)
+            if role_enum is None:
+                continue
+            if len(rows) == 1:
+                title = f"Approval needed: {rows[0].reference}"
+                message = f"Transfer '{rows[0].name}' has been approved and now requires your review."
+            else:
+                title = f"Approval needed: {len(rows)} transfers"
+                message = (
+                    f"{len(rows)} transfers were approved by {user.display_name} and now require "
+                    f"your review: {_reference_list(rows)}"
+                )
+            db.add(Notification(
+                target_role=role_enum,
+                transfer_id=rows[0].id if len(rows) == 1 else None,
+                type=NotificationType.APPROVAL_REQUIRED,
+                title=title,
+                message=message,
+            ))
+
+        await db.commit()
+        logger.info("Bulk approval by %s: %d of %d transfer(s) advanced", user.username, len(moved), len(transfer_ids))
+        return await self._bulk_result(transfer_ids, moved, stages, db)
+
+    async def bulk_reject(
+        self,
+        transfer_ids: List[int],
+        user: Principal,
+        reason: str,
+        db: AsyncSession,
+    ) -> BulkApprovalResponse:
+        """Reject many transfers in one transaction; see ``bulk_approve``.
+
+        Each artist gets one notification covering their rejected transfers,
+        and each earlier approver one listing just the transfers they approved.
+        """
+        transfer_ids = list(dict.fromkeys(transfer_ids))
+        stages = await self._bulk_stages(transfer_ids, user, db, "reject")
+
+        rejected = []
+        history = []
+        for old_status, ids in stages.items():
+            step = WORKFLOW[old_status]
+            rows = await self._bulk_transition(
+                db, ids, old_status, TransferStatus.REJECTED, ApprovalStatus.REJECTED, user, reason,
+                rejection_reason=reason,
+            )
+            if not rows:
+                continue
+            rejected.extend(rows)
+            history.extend({
+                "transfer_id": row.id,
+                "user_id": user.id,
+                "action": "rejected",
+                "status": TransferStatus.REJECTED,
+                "description": f"Rejected at {step['label']} by {user.display_name}: {reason}",
+                "metadata_json": {
+                    "old_status": old_status,
+                    "new_status": "rejected",
+                    "rejector": user.username,
+                    "reason": reason,
+                    "bulk": True,
+                },
+            } for row in rows)
+
+        if history:
+            await db.execute(insert(TransferHistory), history)
+
+        by_artist: Dict[int, list] = defaultdict(list)
+        for row in rejected:
+            by_artist[row.artist_id].append(row)
+        for artist_id, rows in by_artist.items():
+            if len(rows) == 1:
+                title = f"Transfer rejected: {rows[0].reference}"
+                message = f"Your transfer '{rows[0].name}' was rejected. Reason: {reason}"
+            else:
+                title = f"{len(rows)} transfers rejected"
+                message = f"Your transfers {_reference_list(rows)} were rejected. Reason: {reason}"
+            db.add(Notification(
+                user_id=artist_id,
+                transfer_id=rows[0].id if len(rows) == 1 else None,
+                type=NotificationType.REJECTED,
+                title=title,
+                message=message,
+            ))
+
+        # Each earlier approver hears only about the transfers they approved,
+        # other than their own (the artist notice covers those): one fan-out
+        # per distinct set of those transfers.
+        rows_by_id = {row.id: row for row in rejected}
+        approved_by: Dict[int, set] = defaultdict(set)
+        if rejected:
+            for approver_id, transfer_id in await db.execute(
+                approver_recipients(*rows_by_id).add_columns(Approval.transfer_id)
+            ):
+                if approver_id != rows_by_id[transfer_id].artist_id:
+                    approved_by[approver_id].add(transfer_id)
+        audiences: Dict[frozenset, List[int]] = defaultdict(list)
+        for approver_id, ids in approved_by.items():
+            audiences[frozenset(ids)].append(approver_id)
+        for ids, approver_ids in audiences.items():
+            rows = [rows_by_id[tid] for tid in sorted(ids)]
+            await notification_dispatcher.fan_out(
+                db,
+                approver_ids,
+                transfer_id=rows[0].id if len(rows) == 1 else None,
+                ntype=NotificationType.REJECTED,
+                title=(
+                    f"Transfer rejected: {rows[0].reference}" if len(rows) == 1
+                    else f"{len(rows)} transfers rejected"
+                ),
+                message=(
+                    f"{'A transfer' if len(rows) == 1 else 'Transfers'} you previously approved "
+                    f"{'was' if len(rows) == 1 else 'were'} rejected by {user.display_name}: "
+                    f"{_reference_list(rows)}. Reason: {reason}"
+                ),
+            )
+
+        await db.commit()
+        moved = [row.id for row in rejected]
+        logger.info("Bulk rejection by %s: %d of %d transfer(s) rejected", user.username, len(moved), len(transfer_ids))
+        return await self._bulk_result(transfer_ids, moved, stages, db)
+
     async def get_approval_chain(
         self,
         transfer_id: int,
@@ -344,7 +596,7 @@ class ApprovalService:
         self,
         transfer_id: int,
         target_status: str,
-        admin_user: User,
+        admin_user: Principal,
         reason: str,
         db: AsyncSession,
     ) -> Transfer:
@@ -411,13 +663,7 @@ class ApprovalService:
         await db.flush()
         await db.commit()
 
-        refreshed = await db.execute(
-            select(Transfer).options(
-                selectinload(Transfer.artist),
-                selectinload(Transfer.files),
-                selectinload(Transfer.approvals).selectinload(Approval.approver),
-            ).where(Transfer.id == transfer.id)
-        )
+        refreshed = await db.execute(detail_select().where(Transfer.id == transfer.id))
         transfer = refreshed.scalar_one()
 
         logger.info(
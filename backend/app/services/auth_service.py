@@ -8,6 +8,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.config import settings
+from backend.app.core.principal import Principal, principal_cache
 from backend.app.core.security import (
     create_access_token,
     create_refresh_token,
@@ -40,6 +41,7 @@ class AuthService:
                 detail="Invalid credentials",
             )
 
+        generation = await principal_cache.generation(username)
         result = await db.execute(select(User).where(User.username == username))
         user = result.scalar_one_or_none()
 
@@ -80,6 +82,7 @@ class AuthService:
         user.last_login = datetime.now(timezone.utc)
         await db.flush()
         await db.commit()
+        await principal_cache.put(Principal.from_user(user), generation)
 
         access_token = create_access_token(
             subject=user.username,
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import AsyncContextManager, Awaitable, Callable, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.core.principal import Principal
+from backend.app.core.redis_client import async_redis_failed, get_async_redis
+from backend.app.core.responses import dumps
+from backend.app.services.approval_service import approval_service
+from backend.app.services.notification_service import notification_service
+from backend.app.services.transfer_service import transfer_service
+
+logger = logging.getLogger("databridge.dashboard_service")
+
+SessionOpener = Callable[[], AsyncContextManager[AsyncSession]]
+
+T = TypeVar("T")
+
+
+def _cache_key(user: Principal) -> str:
+    # The role decides what a user sees, so a role change starts afresh.
+    return f"dashboard:{user.id}:{user.role.value}"
+
+
+class DashboardService:
+    """Everything the dashboard page shows on load, in one response."""
+
+    async def render(self, open_session: SessionOpener, user: Principal) -> bytes:
+        """The ``DashboardResponse`` JSON for ``user``, served from Redis for
+        ``DASHBOARD_CACHE_TTL_SECONDS`` after it's built."""
+        body = await self._cached(user)
+        if body is not None:
+            return body
+        body = dumps(await self.build(open_session, user))
+        await self._store(user, body)
+        return body
+
+    async def build(self, open_session: SessionOpener, user: Principal) -> dict:
+        async def on_own_session(fn: Callable[[AsyncSession], Awaitable[T]]) -> T:
+            async with open_session() as db:
+                return await fn(db)
+
+        stats, pending, unread, (recent, _, _, _) = await asyncio.gather(
+            on_own_session(lambda db: transfer_service.get_stats(db, user)),
+            on_own_session(lambda db: approval_service.get_pending_count(user, db)),
+            on_own_session(lambda db: notification_service.unread_count(db, user)),
+            on_own_session(lambda db: transfer_service.list_transfers(
+                db, user, per_page=settings.DASHBOARD_RECENT_TRANSFERS, count="none",
+            )),
+        )
+        return {
+            "stats": stats.model_dump(),
+            "pending_approvals": pending,
+            "unread_notifications": unread,
+            "recent_transfers": recent,
+        }
+
+    async def _cached(self, user: Principal) -> Optional[bytes]:
+        r = get_async_redis()
+        if r is None:
+            return None
+        try:
+            cached = await r.get(_cache_key(user))
+        except Exception as exc:
+            async_redis_failed(exc)
+            logger.warning("Failed to read cached dashboard for user %s", user.id)
+            return None
+        return cached.encode() if cached is not None else None
+
+    async def _store(self, user: Principal, body: bytes) -> None:
+        r = get_async_redis()
+        if r is None:
+            return
+        try:
+            await r.set(_cache_key(user), body, ex=settings.DASHBOARD_CACHE_TTL_SECONDS)
+        except Exception as exc:
+            async_redis_failed(exc)
+            logger.warning("Failed to cache dashboard for user %s", user.id)
+
+
+dashboard_service = DashboardService()
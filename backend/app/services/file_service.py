@@ -5,21 +5,59 @@ import logging
 import os
 import shutil
 from pathlib import Path
-from typing import BinaryIO, List, Tuple
+from typing import BinaryIO, List, Literal, Optional, Tuple
 
 from fastapi import HTTPException, UploadFile, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.config import settings
+from backend.app.core.pagination import keyset_page, split_page
+from backend.app.core.principal import Principal
+from backend.app.core.sql import like_escape
 from backend.app.models.transfer import Transfer, TransferFile, TransferStatus
-from backend.app.models.user import User
+from backend.app.schemas.transfer import TransferFileResponse
 
 logger = logging.getLogger("databridge.file_service")
 
 UPLOADABLE_STATUSES = {TransferStatus.UPLOADED, TransferStatus.REJECTED}
 CHUNK_SIZE = 1024 * 1024  # 1 MB
 
+ScanStatus = Literal["pending", "clean", "infected", "error"]
+# verified/failed once the post-scan or post-transfer check has run, else unchecked.
+ChecksumState = Literal["verified", "failed", "unchecked"]
+
+_CHECKSUM_FILTERS = {
+    "verified": TransferFile.checksum_verified.is_(True),
+    "failed": TransferFile.checksum_verified.is_(False),
+    "unchecked": TransferFile.checksum_verified.is_(None),
+}
+
+
+def file_select(
+    transfer_id: int,
+    scan_status: Optional[ScanStatus] = None,
+    checksum: Optional[ChecksumState] = None,
+    name_prefix: Optional[str] = None,
+):
+    """SELECT of the ``TransferFileResponse`` columns of one transfer's files."""
+    query = select(
+        TransferFile.id,
+        TransferFile.filename,
+        TransferFile.size_bytes,
+        TransferFile.checksum_sha256,
+        TransferFile.checksum_verified,
+        TransferFile.virus_scan_status,
+        TransferFile.uploaded_at,
+    ).where(TransferFile.transfer_id == transfer_id)
+    if scan_status:
+        query = query.where(TransferFile.virus_scan_status == scan_status)
+    if checksum:
+        query = query.where(_CHECKSUM_FILTERS[checksum])
+    if name_prefix:
+        query = query.where(TransferFile.filename.like(like_escape(name_prefix) + "%", escape="\\"))
+    return query
+
 
 class FileService:
     def __init__(self) -> None:
@@ -136,10 +174,30 @@ class FileService:
             records.append(tf)
         return records
 
+    async def list_files(
+        self,
+        db: AsyncSession,
+        transfer_id: int,
+        scan_status: Optional[ScanStatus] = None,
+        checksum: Optional[ChecksumState] = None,
+        name_prefix: Optional[str] = None,
+        cursor: Optional[str] = None,
+        per_page: int = 100,
+    ) -> Tuple[List[TransferFileResponse], Optional[str]]:
+        """A page of the transfer's files, newest upload first."""
+        query = keyset_page(
+            file_select(transfer_id, scan_status, checksum, name_prefix),
+            TransferFile.uploaded_at, TransferFile.id,
+            cursor=cursor, page=1, per_page=per_page,
+        )
+        rows = (await db.execute(query)).all()
+        items = [TransferFileResponse(**row._mapping) for row in rows]
+        return split_page(items, per_page, lambda f: (f.uploaded_at, f.id))
+
     async def delete_file(
         self,
         file_id: int,
-        user: User,
+        user: Principal,
         db: AsyncSession,
     ) -> None:
         result = await db.execute(
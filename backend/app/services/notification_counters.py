@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import logging
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import redis
+
+from backend.app.core.config import settings
+from backend.app.core.events import on_commit
+from backend.app.core.redis_client import (
+    async_redis_active,
+    async_redis_failed,
+    get_async_redis,
+    get_redis,
+    spawn,
+)
+
+logger = logging.getLogger("databridge.notification_counters")
+
+# Per user: hash {total, unread, cursor} for personal notifications plus the
+# broadcast read cursor. Per role: sorted set of broadcast ids (score = id),
+# with a sentinel member so an empty-but-loaded set still exists.
+_SENTINEL = "-"
+
+# Counters are only ever adjusted in place; a key that isn't loaded is left
+# alone so the next read repopulates it from Postgres.
+_APPLY_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return 0 end
+local op, n = ARGV[1], tonumber(ARGV[2])
+if op == 'new' then
+  redis.call('HINCRBY', KEYS[1], 'total', 1)
+  if n == 1 then redis.call('HINCRBY', KEYS[1], 'unread', 1) end
+elseif op == 'read' then
+  if redis.call('HINCRBY', KEYS[1], 'unread', -n) < 0 then
+    redis.call('HSET', KEYS[1], 'unread', 0)
+  end
+elseif op == 'read_all' then
+  redis.call('HSET', KEYS[1], 'unread', 0)
+elseif op == 'cursor' then
+  if n > tonumber(redis.call('HGET', KEYS[1], 'cursor') or '0') then
+    redis.call('HSET', KEYS[1], 'cursor', n)
+  end
+elseif op == 'broadcast' then
+  redis.call('ZADD', KEYS[1], n, n)
+end
+return 1
+"""
+
+_READ_LUA = """
+local h = redis.call('HMGET', KEYS[1], 'total', 'unread', 'cursor')
+if not h[1] or redis.call('EXISTS', KEYS[2]) == 0 then return nil end
+local btotal = redis.call('ZCARD', KEYS[2]) - 1
+local bunread = redis.call('ZCOUNT', KEYS[2], '(' .. (h[3] or '0'), '+inf')
+return {tonumber(h[1]) + btotal, tonumber(h[2]) + bunread}
+"""
+
+
+def _user_key(user_id: int) -> str:
+    return f"notif:user:{user_id}"
+
+
+def _role_key(role: str) -> str:
+    return f"notif:role:{role}"
+
+
+def _role_value(role) -> str:
+    return role.value if hasattr(role, "value") else role
+
+
+def _queue_prime_user(pipe, user_id: int, total: int, unread: int, cursor: int) -> None:
+    key = _user_key(user_id)
+    pipe.hset(key, mapping={"total": total, "unread": unread, "cursor": cursor})
+    pipe.expire(key, settings.NOTIFICATION_COUNTER_TTL_SECONDS)
+
+
+def _queue_prime_role(pipe, role, broadcast_ids: Iterable[int]) -> None:
+    key = _role_key(_role_value(role))
+    members = {_SENTINEL: 0}
+    members.update({str(i): i for i in broadcast_ids})
+    pipe.delete(key)
+    pipe.zadd(key, members)
+    pipe.expire(key, settings.NOTIFICATION_COUNTER_TTL_SECONDS)
+
+
+class NotificationCounters:
+    """Redis copies of each user's notification total / unread counts.
+
+    Kept current from committed notification events; every method is a no-op
+    (or returns None) when Redis is unavailable so callers fall back to SQL.
+    Request paths use the async methods; the ``*_sync`` variants are for
+    Celery workers.
+    """
+
+    async def get(self, user_id: int, role) -> Optional[Tuple[int, int]]:
+        r = get_async_redis()
+        if r is None:
+            return None
+        try:
+            result = await r.eval(_READ_LUA, 2, _user_key(user_id), _role_key(_role_value(role)))
+        except Exception as exc:
+            async_redis_failed(exc)
+            logger.warning("Failed to read notification counters for user %d", user_id)
+            return None
+        if not result:
+            return None
+        return int(result[0]), int(result[1])
+
+    async def has_role(self, role) -> bool:
+        r = get_async_redis()
+        if r is None:
+            return False
+        try:
+            return bool(await r.exists(_role_key(_role_value(role))))
+        except Exception as exc:
+            async_redis_failed(exc)
+            return False
+
+    async def prime_user(self, user_id: int, total: int, unread: int, cursor: int) -> None:
+        r = get_async_redis()
+        if r is None:
+            return
+        try:
+            pipe = r.pipeline()
+            _queue_prime_user(pipe, user_id, total, unread, cursor)
+            await pipe.execute()
+        except Exception as exc:
+            async_redis_failed(exc)
+            logger.warning("Failed to prime notification counters for user %d", user_id)
+
+    async def prime_role(self, role, broadcast_ids: Iterable[int]) -> None:
+        r = get_async_redis()
+        if r is None:
+            return
+        try:
+            pipe = r.pipeline()
+            _queue_prime_role(pipe, role, broadcast_ids)
+            await pipe.execute()
+        except Exception as exc:
+            async_redis_failed(exc)
+            logger.warning("Failed to prime broadcast counters for role %s", _role_value(role))
+
+    def repair_user_sync(
+        self, user_id: int, seen: Sequence[Optional[str]], total: int, unread: int, cursor: int,
+    ) -> bool:
+        """Prime a user's counters unless the hash has moved on since ``seen``."""
+        key = _user_key(user_id)
+        return self._prime_if_unchanged(
+            key,
+            lambda pipe: pipe.hmget(key, "total", "unread", "cursor") == list(seen),
+            lambda pipe: _queue_prime_user(pipe, user_id, total, unread, cursor),
+        )
+
+    def repair_role_sync(self, role, seen: Sequence[str], broadcast_ids: Iterable[int]) -> bool:
+        """Prime a role's broadcast set unless it has moved on since ``seen``."""
+        key = _role_key(_role_value(role))
+        return self._prime_if_unchanged(
+            key,
+            lambda pipe: pipe.zrange(key, 0, -1) == list(seen),
+            lambda pipe: _queue_prime_role(pipe, role, broadcast_ids),
+        )
+
+    def _prime_if_unchanged(self, key: str, unchanged, queue) -> bool:
+        r = get_redis()
+        if r is None:
+            return False
+        try:
+            with r.pipeline() as pipe:
+                pipe.watch(key)
+                if not unchanged(pipe):
+                    return False
+                pipe.multi()
+                queue(pipe)
+                pipe.execute()
+                return True
+        except redis.WatchError:
+            return False
+        except Exception:
+            logger.warning("Failed to repair notification counters at %s", key)
+            return False
+
+    def forget_user(self, user_id: int) -> None:
+        r = get_redis()
+        if r is None:
+            return
+        try:
+            r.delete(_user_key(user_id))
+        except Exception:
+            pass
+
+    def apply(self, payloads: List[dict]) -> None:
+        ops = []
+        for p in payloads:
+            kind = p.get("type")
+            if kind == "notification.created":
+                if p.get("target_role"):
+                    ops.append((_role_key(p["target_role"]), "broadcast", p["notification"]["id"]))
+                else:
+                    unread = 0 if p["notification"].get("is_read") else 1
+                    ops.append((_user_key(p["user_id"]), "new", unread))
+            elif kind == "notification.read":
+                key = _user_key(p["user_id"])
+                if p.get("all"):
+                    ops.append((key, "read_all", 0))
+                elif p.get("ids"):
+                    ops.append((key, "read", len(p["ids"])))
+                if p.get("up_to"):
+                    ops.append((key, "cursor", p["up_to"]))
+        if not ops:
+            return
+
+        if async_redis_active():
+            r = get_async_redis()
+            if r is None or spawn(self._apply_async, r, ops):
+                return
+
+        r = get_redis()
+        if r is None:
+            return
+        try:
+            pipe = r.pipeline(transaction=False)
+            for key, op, n in ops:
+                pipe.eval(_APPLY_LUA, 1, key, op, n)
+            pipe.execute()
+        except Exception:
+            logger.warning("Failed to apply %d notification counter update(s)", len(ops))
+
+    async def _apply_async(self, r, ops) -> None:
+        pipe = r.pipeline(transaction=False)
+        for key, op, n in ops:
+            pipe.eval(_APPLY_LUA, 1, key, op, n)
+        await pipe.execute()
+
+
+notification_counters = NotificationCounters()
+on_commit(notification_counters.apply)
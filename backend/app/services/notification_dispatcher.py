@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy import insert, literal, literal_column, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+
+from backend.app.core.config import settings
+from backend.app.core.events import queue_event
+from backend.app.models.approval import Approval, ApprovalStatus
+from backend.app.models.notification import Notification, NotificationType
+from backend.app.models.user import User, UserRole
+
+logger = logging.getLogger("databridge.notification_dispatcher")
+
+_notifications = Notification.__table__
+_recipient = aliased(User, name="recipient")
+
+
+@dataclass
+class DispatchedNotification:
+    id: int
+    user_id: int
+    email: Optional[str]
+
+
+def role_recipients(role: UserRole):
+    return select(User.id).where(User.role == role)
+
+
+def approver_recipients(*transfer_ids: int):
+    return select(Approval.approver_id).where(
+        Approval.transfer_id.in_(transfer_ids),
+        Approval.status == ApprovalStatus.APPROVED,
+        Approval.approver_id.isnot(None),
+    )
+
+
+def _fan_out_statement(recipients, exclude_user_ids, transfer_id, ntype, title, message):
+    source = (
+        select(
+            User.id,
+            literal(transfer_id, type_=_notifications.c.transfer_id.type),
+            literal(ntype, type_=_notifications.c.type.type),
+            literal(title, type_=_notifications.c.title.type),
+            literal(message, type_=_notifications.c.message.type),
+        )
+        .where(User.id.in_(recipients), User.is_active.is_(True))
+    )
+    if exclude_user_ids:
+        source = source.where(User.id.notin_(exclude_user_ids))
+
+    # Unqualified correlation: SQLAlchemy won't correlate a RETURNING
+    # subquery to the INSERT target on its own.
+    email = (
+        select(_recipient.email)
+        .where(_recipient.id == literal_column("notifications.user_id"))
+        .scalar_subquery()
+    )
+    return (
+        insert(_notifications)
+        .from_select(["user_id", "transfer_id", "type", "title", "message"], source)
+        .returning(
+            _notifications.c.id,
+            _notifications.c.user_id,
+            _notifications.c.created_at,
+            email.label("email"),
+        )
+    )
+
+
+def _collect(session: Session, rows, transfer_id, ntype, title, message) -> List[DispatchedNotification]:
+    dispatched = []
+    for row in rows:
+        dispatched.append(DispatchedNotification(id=row.id, user_id=row.user_id, email=row.email))
+        # INSERT ... SELECT bypasses the ORM flush, so publish explicitly.
+        queue_event(session, {
+            "type": "notification.created",
+            "user_id": row.user_id,
+            "target_role": None,
+            "notification": {
+                "id": row.id,
+                "transfer_id": transfer_id,
+                "target_role": None,
+                "type": ntype.value,
+                "title": title,
+                "message": message,
+                "is_read": False,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+            },
+        })
+    return dispatched
+
+
+class NotificationDispatcher:
+    """Per-user notification fan-out as one INSERT ... SELECT ... RETURNING.
+
+    ``recipients`` is any SELECT yielding user ids (see ``role_recipients``,
+    ``approver_recipients``); inactive users are skipped. Role-wide messages
+    that don't need a row per user should use a broadcast instead
+    (``Notification(target_role=...)``).
+    """
+
+    async def fan_out(
+        self,
+        db: AsyncSession,
+        recipients,
+        *,
+        ntype: NotificationType,
+        title: str,
+        message: Optional[str] = None,
+        transfer_id: Optional[int] = None,
+        exclude_user_ids: Optional[List[int]] = None,
+    ) -> List[DispatchedNotification]:
+        stmt = _fan_out_statement(recipients, exclude_user_ids, transfer_id, ntype, title, message)
+        rows = (await db.execute(stmt)).all()
+        return _collect(db.sync_session, rows, transfer_id, ntype, title, message)
+
+    def fan_out_sync(
+        self,
+        db: Session,
+        recipients,
+        *,
+        ntype: NotificationType,
+        title: str,
+        message: Optional[str] = None,
+        transfer_id: Optional[int] = None,
+        exclude_user_ids: Optional[List[int]] = None,
+    ) -> List[DispatchedNotification]:
+        stmt = _fan_out_statement(recipients, exclude_user_ids, transfer_id, ntype, title, message)
+        rows = db.execute(stmt).all()
+        return _collect(db, rows, transfer_id, ntype, title, message)
+
+    def queue_emails(self, db: Session, dispatched: List[DispatchedNotification], title: str, message: str) -> int:
+        """Queue one batched email task for ``dispatched`` and flag the rows as emailed.
+
+        Call after the notifications are committed; the caller commits the flag.
+        """
+        if not (settings.NOTIFICATION_ENABLED and settings.SMTP_HOST):
+            return 0
+        with_email = [d for d in dispatched if d.email]
+        if not with_email:
+            return 0
+
+        from backend.app.tasks.notifications import send_email_batch
+        try:
+            send_email_batch.delay([d.email for d in with_email], title, message)
+        except Exception:
+            logger.warning("Failed to queue %d notification email(s)", len(with_email))
+            return 0
+        db.execute(
+            update(Notification)
+            .where(Notification.id.in_([d.id for d in with_email]))
+            .values(email_sent=True)
+        )
+        return len(with_email)
+
+
+notification_dispatcher = NotificationDispatcher()
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.events import queue_event
+from backend.app.core.pagination import keyset_page, split_page
+from backend.app.core.principal import Principal
+from backend.app.models.notification import Notification, NotificationReadCursor
+from backend.app.schemas.notification import NotificationResponse
+from backend.app.services.notification_counters import notification_counters
+
+logger = logging.getLogger("databridge.notification_service")
+
+
+def _cursor_value(user_id: int):
+    return func.coalesce(
+        select(NotificationReadCursor.last_read_id)
+        .where(NotificationReadCursor.user_id == user_id)
+        .scalar_subquery(),
+        0,
+    )
+
+
+class NotificationService:
+
+    def visible_filter(self, user: Principal):
+        return or_(
+            Notification.user_id == user.id,
+            Notification.target_role == user.role,
+        )
+
+    async def counts(self, db: AsyncSession, user: Principal) -> Tuple[int, int]:
+        """(total, unread) for ``user``, from Redis when warm."""
+        cached = await notification_counters.get(user.id, user.role)
+        if cached is not None:
+            return cached
+
+        personal = Notification.user_id == user.id
+        broadcast = Notification.target_role == user.role
+        cursor = _cursor_value(user.id)
+        row = (await db.execute(
+            select(
+                func.count().filter(personal),
+                func.count().filter(personal, Notification.is_read.is_(False)),
+                func.count().filter(broadcast),
+                func.count().filter(broadcast, Notification.id > cursor),
+                cursor,
+            ).where(self.visible_filter(user))
+        )).one()
+        personal_total, personal_unread, broadcast_total, broadcast_unread, cursor_id = row
+
+        await notification_counters.prime_user(user.id, personal_total, personal_unread, cursor_id or 0)
+        if not await notification_counters.has_role(user.role):
+            ids = (await db.execute(select(Notification.id).where(broadcast))).scalars().all()
+            await notification_counters.prime_role(user.role, ids)
+        return personal_total + broadcast_total, personal_unread + broadcast_unread
+
+    async def unread_count(self, db: AsyncSession, user: Principal) -> int:
+        return (await self.counts(db, user))[1]
+
+    async def list_for_user(
+        self,
+        db: AsyncSession,
+        user: Principal,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[NotificationResponse], int, int, Optional[str]]:
+        total, unread = await self.counts(db, user)
+
+        is_read = case(
+            (Notification.target_role.is_(None), Notification.is_read),
+            else_=Notification.id <= _cursor_value(user.id),
+        )
+        result = await db.execute(keyset_page(
+            select(Notification, is_read).where(self.visible_filter(user)),
+            Notification.created_at, Notification.id,
+            cursor=cursor, page=page, per_page=per_page,
+        ))
+        rows, next_cursor = split_page(result.all(), per_page, lambda r: (r[0].created_at, r[0].id))
+        items = [
+            NotificationResponse.model_validate(n).model_copy(update={"is_read": bool(read)})
+            for n, read in rows
+        ]
+        return items, total, unread, next_cursor
+
+    async def mark_read(self, db: AsyncSession, user: Principal, notification_id: int) -> NotificationResponse:
+        result = await db.execute(
+            select(Notification).where(
+                Notification.id == notification_id,
+                self.visible_filter(user),
+            )
+        )
+        notif = result.scalar_one_or_none()
+        if notif is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Notification not found")
+
+        if notif.target_role is None:
+            notif.is_read = True
+            await db.flush()
+            await db.commit()
+            await db.refresh(notif)
+            return NotificationResponse.model_validate(notif)
+
+        # A broadcast is read by moving the user's cursor up to it, which also
+        # marks any older broadcast for the role as read.
+        await self._advance_cursor(db, user, notif.id)
+        await db.commit()
+        return NotificationResponse.model_validate(notif).model_copy(update={"is_read": True})
+
+    async def mark_all_read(self, db: AsyncSession, user: Principal) -> None:
+        await db.execute(
+            update(Notification)
+            .where(
+                Notification.user_id == user.id,
+                Notification.is_read.is_(False),
+            )
+            .values(is_read=True)
+        )
+        latest = (await db.execute(
+            select(func.max(Notification.id)).where(Notification.target_role == user.role)
+        )).scalar()
+        payload = {"type": "notification.read", "user_id": user.id, "all": True}
+        if latest is not None:
+            await self._advance_cursor(db, user, latest, publish=False)
+            payload["up_to"] = latest
+        queue_event(db.sync_session, payload)
+        await db.commit()
+
+    async def _advance_cursor(
+        self,
+        db: AsyncSession,
+        user: Principal,
+        up_to: int,
+        publish: bool = True,
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        result = await db.execute(
+            update(NotificationReadCursor)
+            .where(
+                NotificationReadCursor.user_id == user.id,
+                NotificationReadCursor.last_read_id < up_to,
+            )
+            .values(last_read_id=up_to, updated_at=now)
+        )
+        if result.rowcount == 0:
+            if await db.get(NotificationReadCursor, user.id) is not None:
+                return
+            db.add(NotificationReadCursor(user_id=user.id, last_read_id=up_to, updated_at=now))
+        await db.flush()
+        if publish:
+            queue_event(db.sync_session, {
+                "type": "notification.read",
+                "user_id": user.id,
+                "up_to": up_to,
+            })
+
+
+notification_service = NotificationService()
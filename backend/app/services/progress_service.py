@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from backend.app.core.config import settings
+from backend.app.core.redis_client import async_redis_failed, get_async_redis, get_redis
+
+logger = logging.getLogger("databridge.progress")
+
+PHASES = ("scan", "checksum", "transfer", "verify")
+
+# Weight given to the newest throughput sample when smoothing.
+_RATE_SMOOTHING = 0.3
+
+
+def _progress_key(transfer_id: int, phase: str) -> str:
+    return f"progress:{transfer_id}:{phase}"
+
+
+class ProgressTracker:
+    """Records bytes/files done, throughput and ETA for one phase of a transfer.
+
+    Used from the Celery workers. ``update`` is cheap to call per file or per
+    chunk; the snapshot is only written to Redis once every
+    ``PROGRESS_UPDATE_INTERVAL_SECONDS``. It returns True when it flushed, so
+    callers can piggy-back their own periodic work (e.g. a DB commit) on it.
+    """
+
+    def __init__(
+        self,
+        transfer_id: int,
+        phase: str,
+        *,
+        total_bytes: int = 0,
+        total_files: int = 0,
+        interval: Optional[float] = None,
+    ) -> None:
+        self.transfer_id = transfer_id
+        self.phase = phase
+        self.total_bytes = total_bytes
+        self.total_files = total_files
+        self.bytes_done = 0
+        self.files_done = 0
+        self.current_file: Optional[str] = None
+        self.interval = settings.PROGRESS_UPDATE_INTERVAL_SECONDS if interval is None else interval
+        self.started_at = datetime.now(timezone.utc)
+
+        now = time.monotonic()
+        self._start = now
+        self._last_flush: Optional[float] = None
+        self._sample_time = now
+        self._sample_bytes = 0
+        self._rate: Optional[float] = None
+
+    def update(
+        self,
+        *,
+        bytes_done: Optional[int] = None,
+        files_done: Optional[int] = None,
+        advance_bytes: int = 0,
+        advance_files: int = 0,
+        current_file: Optional[str] = None,
+        force: bool = False,
+    ) -> bool:
+        if bytes_done is not None:
+            self.bytes_done = bytes_done
+        if files_done is not None:
+            self.files_done = files_done
+        self.bytes_done += advance_bytes
+        self.files_done += advance_files
+        if current_file is not None:
+            self.current_file = current_file
+
+        now = time.monotonic()
+        if not force and self._last_flush is not None and now - self._last_flush < self.interval:
+            return False
+        self._sample_rate(now)
+        self._write("running")
+        self._last_flush = now
+        return True
+
+    def finish(self, state: str = "completed", detail: Optional[str] = None) -> None:
+        self._sample_rate(time.monotonic())
+        self._write(state, detail)
+
+    def _sample_rate(self, now: float) -> None:
+        elapsed = now - self._sample_time
+        if elapsed <= 0:
+            return
+        instant = max(self.bytes_done - self._sample_bytes, 0) / elapsed
+        if self._rate is None:
+            self._rate = instant
+        else:
+            self._rate = _RATE_SMOOTHING * instant + (1 - _RATE_SMOOTHING) * self._rate
+        self._sample_time = now
+        self._sample_bytes = self.bytes_done
+
+    def snapshot(self, state: str = "running", detail: Optional[str] = None) -> dict:
+        rate = self._rate or 0.0
+        eta: Optional[float] = None
+        if state == "running" and rate > 0 and self.total_bytes > self.bytes_done:
+            eta = round((self.total_bytes - self.bytes_done) / rate, 1)
+        elif state == "completed":
+            eta = 0.0
+
+        percent: Optional[float] = None
+        if self.total_bytes:
+            percent = round(min(self.bytes_done / self.total_bytes, 1.0) * 100, 1)
+        elif self.total_files:
+            percent = round(min(self.files_done / self.total_files, 1.0) * 100, 1)
+
+        return {
+            "transfer_id": self.transfer_id,
+            "phase": self.phase,
+            "state": state,
+            "bytes_done": self.bytes_done,
+            "bytes_total": self.total_bytes,
+            "files_done": self.files_done,
+            "files_total": self.total_files,
+            "percent": percent,
+            "current_file": self.current_file,
+            "throughput_bps": round(rate, 1),
+            "eta_seconds": eta,
+            "elapsed_seconds": round(time.monotonic() - self._start, 1),
+            "detail": detail,
+            "started_at": self.started_at.isoformat(),
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def _write(self, state: str, detail: Optional[str] = None) -> None:
+        r = get_redis()
+        if r is None:
+            return
+        try:
+            r.setex(
+                _progress_key(self.transfer_id, self.phase),
+                settings.PROGRESS_TTL_SECONDS,
+                json.dumps(self.snapshot(state, detail)),
+            )
+        except Exception:
+            logger.warning("Failed to record %s progress for transfer %d", self.phase, self.transfer_id)
+
+
+class ProgressService:
+
+    async def get_progress(self, transfer_id: int, *phases: str) -> Dict[str, dict]:
+        """Latest snapshot per phase, read from Redis only (one MGET)."""
+        wanted = phases or PHASES
+        r = get_async_redis()
+        if r is None:
+            return {}
+        try:
+            raw = await r.mget([_progress_key(transfer_id, p) for p in wanted])
+        except Exception as exc:
+            async_redis_failed(exc)
+            logger.warning("Failed to read progress for transfer %d", transfer_id)
+            return {}
+        return {phase: json.loads(value) for phase, value in zip(wanted, raw) if value}
+
+
+progress_service = ProgressService()
@@ -8,10 +8,14 @@ from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.core.celery_app import dispatch_task
+from backend.app.core.principal import Principal
 from backend.app.models.history import TransferHistory
 from backend.app.models.notification import Notification, NotificationType
 from backend.app.models.transfer import Transfer, TransferFile, TransferStatus
-from backend.app.models.user import User, UserRole
+from backend.app.models.user import UserRole
+from backend.app.services.progress_service import progress_service
+from backend.app.services.transfer_service import detail_select, transition_status
 
 logger = logging.getLogger("databridge.scanning_service")
 
@@ -21,16 +25,9 @@ class ScanningService:
     async def start_scan(
         self,
         transfer_id: int,
-        user: User,
+        user: Principal,
         db: AsyncSession,
     ) -> Transfer:
-        result = await db.execute(
-            select(Transfer).where(Transfer.id == transfer_id)
-        )
-        transfer = result.scalar_one_or_none()
-        if transfer is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transfer not found")
-
         user_role = user.role.value if hasattr(user.role, "value") else user.role
         if user_role not in ("data_team", "admin"):
             raise HTTPException(
@@ -38,14 +35,10 @@ class ScanningService:
                 detail="Only data_team or admin can start scans",
             )
 
-        if transfer.status != TransferStatus.APPROVED:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot scan — transfer status is '{transfer.status.value}', expected 'approved'",
-            )
-
-        transfer.status = TransferStatus.SCANNING
-        transfer.scan_started_at = datetime.now(timezone.utc)
+        transfer = await transition_status(
+            db, transfer_id, TransferStatus.APPROVED, TransferStatus.SCANNING,
+            scan_started_at=datetime.now(timezone.utc),
+        )
 
         db.add(TransferHistory(
             transfer_id=transfer.id,
@@ -54,13 +47,12 @@ class ScanningService:
             description=f"Scanning started by {user.display_name}",
         ))
 
-        await db.flush()
         await db.commit()
-        await db.refresh(transfer)
+        transfer = (await db.execute(detail_select().where(Transfer.id == transfer_id))).scalar_one()
 
         from backend.app.tasks.scanning import virus_scan_transfer, checksum_verify_transfer
-        virus_scan_transfer.delay(transfer_id)
-        checksum_verify_transfer.delay(transfer_id)
+        await dispatch_task(virus_scan_transfer, transfer_id)
+        await dispatch_task(checksum_verify_transfer, transfer_id)
 
         logger.info("Scan started for transfer %s by %s", transfer.reference, user.username)
         return transfer
@@ -68,16 +60,9 @@ class ScanningService:
     async def complete_scan(
         self,
         transfer_id: int,
-        user: User,
+        user: Principal,
         db: AsyncSession,
     ) -> Transfer:
-        result = await db.execute(
-            select(Transfer).where(Transfer.id == transfer_id)
-        )
-        transfer = result.scalar_one_or_none()
-        if transfer is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transfer not found")
-
         user_role = user.role.value if hasattr(user.role, "value") else user.role
         if user_role not in ("data_team", "admin"):
             raise HTTPException(
@@ -85,12 +70,6 @@ class ScanningService:
                 detail="Only data_team or admin can complete scans",
             )
 
-        if transfer.status != TransferStatus.SCANNING:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Transfer status is '{transfer.status.value}', expected 'scanning'",
-            )
-
         files_result = await db.execute(
             select(TransferFile).where(TransferFile.transfer_id == transfer_id)
         )
@@ -100,9 +79,11 @@ class ScanningService:
         checksum_failed = [f for f in files if f.checksum_verified is False]
 
         if infected or checksum_failed:
-            transfer.status = TransferStatus.SCAN_FAILED
-            transfer.scan_passed = False
-            transfer.scan_completed_at = datetime.now(timezone.utc)
+            transfer = await transition_status(
+                db, transfer_id, TransferStatus.SCANNING, TransferStatus.SCAN_FAILED,
+                scan_passed=False,
+                scan_completed_at=datetime.now(timezone.utc),
+            )
 
             detail_parts = []
             if infected:
@@ -125,16 +106,17 @@ class ScanningService:
                 message=f"Your transfer failed scanning: {', '.join(detail_parts)}",
             ))
 
-            await db.flush()
             await db.commit()
-            await db.refresh(transfer)
+            transfer = (await db.execute(detail_select().where(Transfer.id == transfer_id))).scalar_one()
 
             logger.warning("Scan FAILED for %s: %s", transfer.reference, ", ".join(detail_parts))
             return transfer
 
-        transfer.status = TransferStatus.SCAN_PASSED
-        transfer.scan_passed = True
-        transfer.scan_completed_at = datetime.now(timezone.utc)
+        transfer = await transition_status(
+            db, transfer_id, TransferStatus.SCANNING, TransferStatus.SCAN_PASSED,
+            scan_passed=True,
+            scan_completed_at=datetime.now(timezone.utc),
+        )
 
         db.add(TransferHistory(
             transfer_id=transfer.id,
@@ -143,12 +125,11 @@ class ScanningService:
             description=f"All {len(files)} files passed scanning",
         ))
 
-        await db.flush()
         await db.commit()
-        await db.refresh(transfer)
+        transfer = (await db.execute(detail_select().where(Transfer.id == transfer_id))).scalar_one()
 
         from backend.app.tasks.transfer import prepare_for_transfer
-        prepare_for_transfer.delay(transfer_id)
+        await dispatch_task(prepare_for_transfer, transfer_id)
 
         logger.info("Scan PASSED for %s — dispatching prepare_for_transfer", transfer.reference)
         return transfer
@@ -187,6 +168,7 @@ class ScanningService:
                 "checksum_verified": sum(1 for f in files if f.checksum_verified is True),
                 "checksum_failed": sum(1 for f in files if f.checksum_verified is False),
             },
+            "progress": await progress_service.get_progress(transfer_id, "scan", "checksum"),
         }
         return scan_summary
 
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime, timezone
 
 from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.core.celery_app import dispatch_task
+from backend.app.core.config import settings
+from backend.app.core.principal import Principal
 from backend.app.models.history import TransferHistory
 from backend.app.models.transfer import Transfer, TransferStatus
-from backend.app.models.user import User
+from backend.app.services.transfer_service import detail_select, transition_status
 
 logger = logging.getLogger("databridge.transfer_ops_service")
 
@@ -18,16 +22,9 @@ class TransferOpsService:
     async def initiate_transfer(
         self,
         transfer_id: int,
-        user: User,
+        user: Principal,
         db: AsyncSession,
     ) -> Transfer:
-        result = await db.execute(
-            select(Transfer).where(Transfer.id == transfer_id)
-        )
-        transfer = result.scalar_one_or_none()
-        if transfer is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transfer not found")
-
         user_role = user.role.value if hasattr(user.role, "value") else user.role
         if user_role not in ("it_team", "admin"):
             raise HTTPException(
@@ -35,11 +32,13 @@ class TransferOpsService:
                 detail="Only it_team or admin can initiate transfers",
             )
 
-        if transfer.status != TransferStatus.READY_FOR_TRANSFER:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Transfer status is '{transfer.status.value}', expected 'ready_for_transfer'",
-            )
+        # Claiming the transfer here, rather than leaving it to the worker,
+        # means a second click can't dispatch a second copy.
+        transfer = await transition_status(
+            db, transfer_id, TransferStatus.READY_FOR_TRANSFER, TransferStatus.TRANSFERRING,
+            transfer_started_at=datetime.now(timezone.utc),
+            transfer_method=settings.TRANSFER_METHOD,
+        )
 
         db.add(TransferHistory(
             transfer_id=transfer.id,
@@ -48,12 +47,11 @@ class TransferOpsService:
             description=f"File transfer initiated by {user.display_name}",
         ))
 
-        await db.flush()
         await db.commit()
-        await db.refresh(transfer)
+        transfer = (await db.execute(detail_select().where(Transfer.id == transfer_id))).scalar_one()
 
         from backend.app.tasks.transfer import execute_transfer
-        execute_transfer.delay(transfer_id)
+        await dispatch_task(execute_transfer, transfer_id)
 
         logger.info("Transfer %s initiated by %s", transfer.reference, user.username)
         return transfer
@@ -61,7 +59,7 @@ class TransferOpsService:
     async def complete_transfer(
         self,
         transfer_id: int,
-        user: User,
+        user: Principal,
         db: AsyncSession,
     ) -> Transfer:
         result = await db.execute(
@@ -85,12 +83,11 @@ class TransferOpsService:
             description=f"Transfer verification triggered by {user.display_name}",
         ))
 
-        await db.flush()
         await db.commit()
-        await db.refresh(transfer)
+        transfer = (await db.execute(detail_select().where(Transfer.id == transfer_id))).scalar_one()
 
         from backend.app.tasks.transfer import verify_transfer
-        verify_transfer.delay(transfer_id)
+        await dispatch_task(verify_transfer, transfer_id)
 
         logger.info("Verification dispatched for %s by %s", transfer.reference, user.username)
         return transfer
@@ -1,30 +1,48 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import AbstractSet, Callable, Dict, List, Optional, Sequence, Tuple
 
 from fastapi import HTTPException, status
-from sqlalchemy import extract, func, or_, select
+from sqlalchemy import Row, case, func, literal_column, or_, select, true, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, joinedload, load_only, noload, selectinload
 
 from backend.app.core.config import settings
+from backend.app.core.events import queue_event, transfer_status_payload
+from backend.app.core.pagination import CountMode, count_rows, keyset_page, split_page
+from backend.app.core.principal import Principal
+from backend.app.core.sql import like_escape
 from backend.app.models.approval import Approval, ApprovalStatus
 from backend.app.models.history import TransferHistory
 from backend.app.models.notification import Notification, NotificationType
 from backend.app.models.transfer import (
+    TRANSFER_REFERENCE_SEQ,
     Transfer,
     TransferCategory,
     TransferStatus,
+    format_size,
 )
 from backend.app.models.user import User, UserRole
 from backend.app.schemas.transfer import (
+    AutocompleteReference,
+    TransferAutocompleteResponse,
     TransferCreate,
+    TransferResponse,
     TransferStatsResponse,
+    TransferSummary,
     TransferUpdate,
 )
+from backend.app.services.transfer_stats import (
+    ALL_SCOPE,
+    artist_scope,
+    bucket_row,
+    buckets_select,
+    transfer_stats,
+)
 
 logger = logging.getLogger("databridge.transfer_service")
 
@@ -52,28 +70,235 @@ _ROLE_VISIBLE_STATUSES = {
 }
 
 
+def _search_filter(term: str, dialect: str):
+    """Match ``term`` in codes and names, plus descriptive text.
+
+    On PostgreSQL the substring matches are served by trigram indexes and the
+    descriptive text by the generated ``search_vector`` (see models.transfer);
+    elsewhere (the SQLite test database) everything falls back to ILIKE.
+    """
+    pattern = f"%{like_escape(term)}%"
+    codes = [
+        Transfer.reference.ilike(pattern, escape="\\"),
+        Transfer.name.ilike(pattern, escape="\\"),
+        Transfer.shotgrid_entity_name.ilike(pattern, escape="\\"),
+    ]
+    if dialect == "postgresql":
+        text_match = literal_column("transfers.search_vector").bool_op("@@")(
+            func.websearch_to_tsquery(literal_column("'simple'"), term)
+        )
+        return or_(*codes, text_match)
+    return or_(
+        *codes,
+        Transfer.description.ilike(pattern, escape="\\"),
+        Transfer.notes.ilike(pattern, escape="\\"),
+    )
+
+
+# TransferResponse fields that aren't Transfer columns.
+_DETAIL_DERIVED = ("artist_name", "size_display", "files", "approval_chain")
+# TransferSummary fields that aren't Transfer columns.
+_SUMMARY_DERIVED = ("artist_name", "size_display", "approval_chain")
+# Summary columns always selected: the identity and the keyset.
+_SUMMARY_KEY = ("id", "created_at")
+
+
+def summary_select(fields: Optional[AbstractSet[str]] = None):
+    """SELECT of exactly what ``TransferSummary`` needs, without ORM loading.
+
+    With ``fields`` (see ``core.fieldsets``), only those columns plus id and
+    created_at, and the users join only for ``artist_name``.
+    """
+    def wanted(name: str) -> bool:
+        return fields is None or name in fields
+
+    columns = []
+    for name in TransferSummary.model_fields:
+        if name == "artist_name" and wanted(name):
+            columns.append(func.coalesce(User.display_name, "Unknown").label("artist_name"))
+        elif name not in _SUMMARY_DERIVED and (
+            wanted(name) or name in _SUMMARY_KEY
+            or (name == "total_size_bytes" and wanted("size_display"))
+        ):
+            columns.append(getattr(Transfer, name))
+    query = select(*columns).select_from(Transfer)
+    if wanted("artist_name"):
+        query = query.outerjoin(User, User.id == Transfer.artist_id)
+    return query
+
+
+async def fetch_summaries(
+    db: AsyncSession,
+    query,
+    fields: Optional[AbstractSet[str]] = None,
+) -> List[dict]:
+    """Run a ``summary_select()`` query; approval stages come from one extra
+    query, skipped when ``fields`` leaves them out.
+
+    Rows map straight to plain dicts shaped like ``TransferSummary`` rather
+    than models, for endpoints to hand to ``APIJSONResponse`` unvalidated.
+    They keep the key columns even when not requested; see ``only_fields``.
+    """
+    rows = (await db.execute(query)).all()
+    if not rows:
+        return []
+
+    chains = None
+    if fields is None or "approval_chain" in fields:
+        approver = aliased(User)
+        stages = await db.execute(
+            select(Approval.transfer_id, Approval.required_role, Approval.status, approver.display_name)
+            .outerjoin(approver, approver.id == Approval.approver_id)
+            .where(Approval.transfer_id.in_([row.id for row in rows]))
+            .order_by(Approval.transfer_id, Approval.id)
+        )
+        chains = defaultdict(list)
+        for transfer_id, role, stage_status, approver_name in stages:
+            chains[transfer_id].append({"role": role, "status": stage_status, "approver_name": approver_name})
+
+    items = []
+    for row in rows:
+        item = dict(row._mapping)
+        if fields is None or "size_display" in fields:
+            item["size_display"] = format_size(row.total_size_bytes)
+        if chains is not None:
+            item["approval_chain"] = chains[row.id]
+        items.append(item)
+    return items
+
+
+def only_fields(items: List[dict], fields: Optional[AbstractSet[str]]) -> List[dict]:
+    """Drop what ``fields`` didn't ask for but the query needed anyway."""
+    if fields is None:
+        return items
+    return [{k: v for k, v in item.items() if k in fields} for item in items]
+
+
+def detail_select(fields: Optional[AbstractSet[str]] = None):
+    """SELECT of a Transfer with everything ``TransferResponse`` renders, and
+    not its history, which it doesn't.
+
+    With ``fields``, only those columns are loaded, and only the artist,
+    files and approvals they name.
+
+    ``populate_existing`` so rows changed by bulk statements earlier in the
+    session (see ``transition_status``) aren't served stale from the
+    identity map.
+    """
+    if fields is None:
+        options = [
+            joinedload(Transfer.artist),
+            selectinload(Transfer.files),
+            selectinload(Transfer.approvals).joinedload(Approval.approver),
+        ]
+    else:
+        columns = [
+            getattr(Transfer, name) for name in TransferResponse.model_fields
+            if name in fields and name not in _DETAIL_DERIVED
+        ]
+        if "size_display" in fields:
+            columns.append(Transfer.total_size_bytes)
+        options = [
+            load_only(*columns),
+            joinedload(Transfer.artist) if "artist_name" in fields else noload(Transfer.artist),
+            selectinload(Transfer.files) if "files" in fields else noload(Transfer.files),
+            selectinload(Transfer.approvals).joinedload(Approval.approver)
+            if "approval_chain" in fields else noload(Transfer.approvals),
+        ]
+    return (
+        select(Transfer)
+        .options(*options, noload(Transfer.history))
+        .execution_options(populate_existing=True)
+    )
+
+
+# What transition_status/transition_many hand back: enough for history,
+# notifications and the transfer.status event.
+_TRANSITION_RETURNING = (
+    Transfer.id,
+    Transfer.reference,
+    Transfer.name,
+    Transfer.artist_id,
+    Transfer.status,
+    Transfer.created_at,
+    Transfer.transfer_completed_at,
+)
+
+
+async def transition_many(
+    db: AsyncSession,
+    transfer_ids: Sequence[int],
+    expected: TransferStatus,
+    new_status: TransferStatus,
+    **values,
+) -> List[Row]:
+    """Move whichever of ``transfer_ids`` are still at ``expected`` to
+    ``new_status`` in one statement; returns the rows that moved.
+
+    The flush hooks don't see this UPDATE, so ``transfer.status`` events are
+    queued here.
+    """
+    rows = (await db.execute(
+        update(Transfer)
+        .where(Transfer.id.in_(transfer_ids), Transfer.status == expected)
+        .values(status=new_status, **values)
+        .returning(*_TRANSITION_RETURNING),
+        execution_options={"synchronize_session": False},
+    )).all()
+    for row in rows:
+        queue_event(db.sync_session, transfer_status_payload(row, expected, row.transfer_completed_at))
+    return rows
+
+
+async def transition_status(
+    db: AsyncSession,
+    transfer_id: int,
+    expected: TransferStatus,
+    new_status: TransferStatus,
+    **values,
+) -> Row:
+    """Move a transfer from ``expected`` to ``new_status`` in one statement.
+
+    ``UPDATE transfers SET status = :new WHERE id = :id AND status = :expected
+    RETURNING ...`` checks and writes together, so when two requests race for
+    the same transition exactly one succeeds; the other gets a 409 (or 404
+    if the transfer doesn't exist). ``values`` are written in the same
+    statement. Returns the columns callers need for history and
+    notifications; load the full transfer with ``detail_select`` after
+    committing.
+    """
+    rows = await transition_many(db, [transfer_id], expected, new_status, **values)
+    if not rows:
+        current = (await db.execute(
+            select(Transfer.status).where(Transfer.id == transfer_id)
+        )).scalar_one_or_none()
+        if current is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transfer not found")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Transfer status is '{current.value}', expected '{expected.value}'",
+        )
+    return rows[0]
+
+
 class TransferService:
 
     async def _generate_reference(self, db: AsyncSession) -> str:
-        result = await db.execute(
-            select(Transfer.reference)
-            .order_by(Transfer.id.desc())
-            .limit(1)
-        )
-        last_ref = result.scalar_one_or_none()
-        if last_ref and last_ref.startswith("TRF-"):
-            try:
-                num = int(last_ref.split("-")[1]) + 1
-            except (IndexError, ValueError):
-                num = 1
+        """Next reference from ``transfer_reference_seq``. Sequence values are
+        handed out outside transactions, so concurrent creates never collide;
+        a rolled-back create just leaves a gap. SQLite has no sequences but
+        serialises writers, so the next id stands in there."""
+        if db.get_bind().dialect.name == "postgresql":
+            next_number = select(TRANSFER_REFERENCE_SEQ.next_value())
         else:
-            num = 1
+            next_number = select(func.coalesce(func.max(Transfer.id), 0) + 1)
+        num = (await db.execute(next_number)).scalar_one()
         return f"TRF-{num:05d}"
 
     async def create_transfer(
         self,
         data: TransferCreate,
-        user: User,
+        user: Principal,
         db: AsyncSession,
     ) -> Transfer:
         reference = await self._generate_reference(db)
@@ -114,39 +339,26 @@ class TransferService:
         transfer.status = TransferStatus.PENDING_TEAM_LEAD
         await db.flush()
 
-        tl_result = await db.execute(
-            select(User).where(
-                User.role == UserRole.TEAM_LEAD,
-                User.is_active.is_(True),
-            )
-        )
-        for tl in tl_result.scalars().all():
-            db.add(Notification(
-                user_id=tl.id,
-                transfer_id=transfer.id,
-                type=NotificationType.APPROVAL_REQUIRED,
-                title=f"Approval needed: {reference}",
-                message=f"Transfer '{transfer.name}' from {user.display_name} needs team lead approval.",
-            ))
+        db.add(Notification(
+            target_role=UserRole.TEAM_LEAD,
+            transfer_id=transfer.id,
+            type=NotificationType.APPROVAL_REQUIRED,
+            title=f"Approval needed: {reference}",
+            message=f"Transfer '{transfer.name}' from {user.display_name} needs team lead approval.",
+        ))
 
         await db.flush()
         await db.commit()
 
         result = await db.execute(
-            select(Transfer)
-            .options(
-                selectinload(Transfer.artist),
-                selectinload(Transfer.files),
-                selectinload(Transfer.approvals).selectinload(Approval.approver),
-            )
-            .where(Transfer.id == transfer.id)
+            detail_select().where(Transfer.id == transfer.id)
         )
         transfer = result.scalar_one()
 
         logger.info("Transfer %s created by %s", reference, user.username)
         return transfer
 
-    def _build_visibility_filter(self, user: User):
+    def _build_visibility_filter(self, user: Principal):
         role = user.role
         if role == UserRole.ADMIN:
             return None
@@ -175,92 +387,131 @@ class TransferService:
     async def list_transfers(
         self,
         db: AsyncSession,
-        user: User,
+        user: Principal,
         transfer_status: Optional[TransferStatus] = None,
         category: Optional[TransferCategory] = None,
         search: Optional[str] = None,
         page: int = 1,
         per_page: int = 20,
-    ) -> Tuple[List[Transfer], int]:
-        query = (
-            select(Transfer)
-            .options(
-                selectinload(Transfer.artist),
-                selectinload(Transfer.files),
-                selectinload(Transfer.approvals).selectinload(Approval.approver),
-            )
-            .order_by(Transfer.created_at.desc())
-        )
-        count_q = select(func.count()).select_from(Transfer)
+        cursor: Optional[str] = None,
+        count: CountMode = "exact",
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> Tuple[List[dict], Optional[int], bool, Optional[str]]:
+        filters = []
 
         vis = self._build_visibility_filter(user)
         if vis is not None:
-            query = query.where(vis)
-            count_q = count_q.where(vis)
+            filters.append(vis)
 
         if transfer_status:
-            query = query.where(Transfer.status == transfer_status)
-            count_q = count_q.where(Transfer.status == transfer_status)
+            filters.append(Transfer.status == transfer_status)
 
         if category:
-            query = query.where(Transfer.category == category)
-            count_q = count_q.where(Transfer.category == category)
+            filters.append(Transfer.category == category)
 
         if search:
-            pattern = f"%{search}%"
-            search_filter = or_(
-                Transfer.name.ilike(pattern),
-                Transfer.reference.ilike(pattern),
-            )
-            query = query.where(search_filter)
-            count_q = count_q.where(search_filter)
+            filters.append(_search_filter(search, db.get_bind().dialect.name))
 
-        total = (await db.execute(count_q)).scalar() or 0
-        query = query.offset((page - 1) * per_page).limit(per_page)
-        result = await db.execute(query)
-        transfers = list(result.scalars().all())
+        total, estimated = await count_rows(db, Transfer, filters, count)
+        query = keyset_page(
+            summary_select(fields).where(*filters),
+            Transfer.created_at, Transfer.id,
+            cursor=cursor, page=page, per_page=per_page,
+        )
+        items, next_cursor = split_page(
+            await fetch_summaries(db, query, fields), per_page, lambda t: (t["created_at"], t["id"])
+        )
+        return only_fields(items, fields), total, estimated, next_cursor
 
-        return transfers, total
+    async def get_summaries(
+        self,
+        db: AsyncSession,
+        user: Principal,
+        transfer_ids: Sequence[int],
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> Dict[int, dict]:
+        """Summaries of whichever of ``transfer_ids`` ``user`` can see, by id,
+        with visibility applied in the same query."""
+        vis = self._build_visibility_filter(user)
+        query = summary_select(fields).where(
+            Transfer.id.in_(transfer_ids), *([vis] if vis is not None else []),
+        )
+        items = only_fields(await fetch_summaries(db, query, fields), fields)
+        return {item["id"]: item for item in items}
 
-    async def get_transfer(
+    async def autocomplete(
         self,
-        transfer_id: int,
         db: AsyncSession,
-        user: User,
-    ) -> Transfer:
+        user: Principal,
+        q: str,
+        limit: int = 10,
+    ) -> TransferAutocompleteResponse:
+        """References and shot codes containing ``q``, prefix matches first."""
+        pattern = f"%{like_escape(q)}%"
+        prefix = f"{like_escape(q)}%"
+        vis = self._build_visibility_filter(user)
+        filters = [vis] if vis is not None else []
+
+        def ranked(col):
+            return case((col.ilike(prefix, escape="\\"), 0), else_=1), func.length(col), col
+
+        refs = await db.execute(
+            select(Transfer.id, Transfer.reference, Transfer.name)
+            .where(Transfer.reference.ilike(pattern, escape="\\"), *filters)
+            .order_by(*ranked(Transfer.reference))
+            .limit(limit)
+        )
+        shots = await db.execute(
+            select(Transfer.shotgrid_entity_name)
+            .where(Transfer.shotgrid_entity_name.ilike(pattern, escape="\\"), *filters)
+            .group_by(Transfer.shotgrid_entity_name)
+            .order_by(*ranked(Transfer.shotgrid_entity_name))
+            .limit(limit)
+        )
+        return TransferAutocompleteResponse(
+            references=[AutocompleteReference(**row._mapping) for row in refs.all()],
+            shots=list(shots.scalars().all()),
+        )
+
+    async def ensure_visible(self, transfer_id: int, db: AsyncSession, user: Principal) -> str:
+        """404 or 403 unless ``user`` can see the transfer, without loading it.
+        Returns its reference."""
+        vis = self._build_visibility_filter(user)
         result = await db.execute(
-            select(Transfer)
-            .options(
-                selectinload(Transfer.artist),
-                selectinload(Transfer.files),
-                selectinload(Transfer.approvals).selectinload(Approval.approver),
-            )
+            select(vis if vis is not None else true(), Transfer.reference)
             .where(Transfer.id == transfer_id)
         )
-        transfer = result.scalar_one_or_none()
-        if transfer is None:
+        row = result.first()
+        if row is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Transfer not found",
             )
-
-        vis = self._build_visibility_filter(user)
-        if vis is not None:
-            check = await db.execute(
-                select(Transfer.id).where(Transfer.id == transfer_id, vis)
+        if not row[0]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You do not have access to this transfer",
             )
-            if check.scalar_one_or_none() is None:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="You do not have access to this transfer",
-                )
-        return transfer
+        return row.reference
+
+    async def get_transfer(
+        self,
+        transfer_id: int,
+        db: AsyncSession,
+        user: Principal,
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> Transfer:
+        await self.ensure_visible(transfer_id, db, user)
+        result = await db.execute(
+            detail_select(fields).where(Transfer.id == transfer_id)
+        )
+        return result.scalar_one()
 
     async def update_transfer(
         self,
         transfer_id: int,
         data: TransferUpdate,
-        user: User,
+        user: Principal,
         db: AsyncSession,
     ) -> Transfer:
         transfer = await self.get_transfer(transfer_id, db, user)
@@ -290,82 +541,83 @@ class TransferService:
         await db.refresh(transfer)
         return transfer
 
+    def _stats_scopes(self, user: Principal) -> List[Tuple[str, Optional[int], Callable[[str], bool]]]:
+        """(cached scope, its artist, statuses taken from it) making up the
+        same set of transfers as ``_build_visibility_filter(user)``."""
+        role = user.role
+        mine = artist_scope(user.id)
+        if role == UserRole.ADMIN:
+            return [(ALL_SCOPE, None, lambda s: True)]
+        if role == UserRole.ARTIST:
+            return [(mine, user.id, lambda s: True)]
+        if role == UserRole.TEAM_LEAD:
+            pending = TransferStatus.PENDING_TEAM_LEAD.value
+            return [
+                (ALL_SCOPE, None, lambda s: s == pending),
+                (mine, user.id, lambda s: s != pending),
+            ]
+        if role in (UserRole.SUPERVISOR, UserRole.LINE_PRODUCER):
+            return [(ALL_SCOPE, None, lambda s: s != TransferStatus.UPLOADED.value)]
+        visible = _ROLE_VISIBLE_STATUSES.get(role)
+        if visible:
+            values = {v.value for v in visible}
+            return [(ALL_SCOPE, None, values.__contains__)]
+        return [(mine, user.id, lambda s: True)]
+
     async def get_stats(
         self,
         db: AsyncSession,
-        user: User,
+        user: Principal,
     ) -> TransferStatsResponse:
-        base = select(func.count()).select_from(Transfer)
-        vis = self._build_visibility_filter(user)
-        if vis is not None:
-            base = base.where(vis)
-
-        total = (await db.execute(base)).scalar() or 0
-
-        pending_statuses = [
-            TransferStatus.UPLOADED,
-            TransferStatus.PENDING_TEAM_LEAD,
-            TransferStatus.PENDING_SUPERVISOR,
-            TransferStatus.PENDING_LINE_PRODUCER,
-        ]
-        q_pending = base.where(Transfer.status.in_(pending_statuses))
-        pending = (await db.execute(q_pending)).scalar() or 0
-
-        approved = (await db.execute(
-            base.where(Transfer.status == TransferStatus.APPROVED)
-        )).scalar() or 0
-
-        scanning_statuses = [
-            TransferStatus.SCANNING,
-            TransferStatus.SCAN_PASSED,
-            TransferStatus.SCAN_FAILED,
-        ]
-        scanning = (await db.execute(
-            base.where(Transfer.status.in_(scanning_statuses))
-        )).scalar() or 0
-
-        transferred = (await db.execute(
-            base.where(Transfer.status == TransferStatus.TRANSFERRED)
-        )).scalar() or 0
-
-        rejected = (await db.execute(
-            base.where(Transfer.status == TransferStatus.REJECTED)
-        )).scalar() or 0
-
-        avg_time_hours: Optional[float] = None
-        try:
-            avg_q = select(
-                func.avg(
-                    extract(
-                        "epoch",
-                        Transfer.transfer_completed_at - Transfer.created_at,
-                    )
-                )
-            ).where(
-                Transfer.transfer_completed_at.isnot(None),
-            )
-            if vis is not None:
-                avg_q = avg_q.where(vis)
-            avg_sec = (await db.execute(avg_q)).scalar()
-            if avg_sec is not None:
-                avg_time_hours = round(float(avg_sec) / 3600.0, 2)
-        except Exception:
-            pass
+        scopes = self._stats_scopes(user)
+        buckets = await transfer_stats.get({scope for scope, _, _ in scopes})
+        missing = {scope: artist_id for scope, artist_id, _ in scopes if scope not in buckets}
+        if missing:
+            fresh = {}
+            for scope, artist_id in missing.items():
+                query = buckets_select()
+                if artist_id is not None:
+                    query = query.where(Transfer.artist_id == artist_id)
+                fresh[scope] = dict(bucket_row(*row) for row in (await db.execute(query)).all())
+            await transfer_stats.prime(fresh)
+            buckets.update(fresh)
+
+        counts: Dict[str, int] = defaultdict(int)
+        seconds = 0.0
+        completed = 0
+        for scope, _, include in scopes:
+            for status_value, (n, s, c) in buckets[scope].items():
+                if include(status_value):
+                    counts[status_value] += n
+                    seconds += s
+                    completed += c
+
+        def _sum(*statuses: TransferStatus) -> int:
+            return sum(counts[st.value] for st in statuses)
 
         return TransferStatsResponse(
-            total=total,
-            pending=pending,
-            approved=approved,
-            scanning=scanning,
-            transferred=transferred,
-            rejected=rejected,
-            avg_time_hours=avg_time_hours,
+            total=sum(counts.values()),
+            pending=_sum(
+                TransferStatus.UPLOADED,
+                TransferStatus.PENDING_TEAM_LEAD,
+                TransferStatus.PENDING_SUPERVISOR,
+                TransferStatus.PENDING_LINE_PRODUCER,
+            ),
+            approved=_sum(TransferStatus.APPROVED),
+            scanning=_sum(
+                TransferStatus.SCANNING,
+                TransferStatus.SCAN_PASSED,
+                TransferStatus.SCAN_FAILED,
+            ),
+            transferred=_sum(TransferStatus.TRANSFERRED),
+            rejected=_sum(TransferStatus.REJECTED),
+            avg_time_hours=round(seconds / completed / 3600.0, 2) if completed else None,
         )
 
     async def cancel_transfer(
         self,
         transfer_id: int,
-        user: User,
+        user: Principal,
         db: AsyncSession,
     ) -> None:
         result = await db.execute(
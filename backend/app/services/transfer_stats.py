@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import extract, func, select
+
+from backend.app.core.config import settings
+from backend.app.core.events import on_commit
+from backend.app.core.redis_client import (
+    async_redis_active,
+    async_redis_failed,
+    get_async_redis,
+    get_redis,
+    spawn,
+)
+from backend.app.models.transfer import Transfer
+
+logger = logging.getLogger("databridge.transfer_stats")
+
+# Per status: (transfers, summed completion seconds, completed transfers).
+StatusBuckets = Dict[str, Tuple[int, float, int]]
+
+ALL_SCOPE = "all"
+
+# Hash fields per status: n:<status> count, s:<status> / c:<status> summed
+# completion time and number of completed transfers. The sentinel field keeps
+# a loaded-but-empty scope distinguishable from a missing one.
+_SENTINEL = "_"
+
+# Moves one transfer between status buckets; like the notification counters,
+# a scope that isn't loaded is left for the next read to repopulate.
+_APPLY_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return 0 end
+local prev, new, prev_s, new_s = ARGV[1], ARGV[2], ARGV[3], ARGV[4]
+if prev ~= '' then
+  redis.call('HINCRBY', KEYS[1], 'n:' .. prev, -1)
+  if prev_s ~= '' then
+    redis.call('HINCRBYFLOAT', KEYS[1], 's:' .. prev, -tonumber(prev_s))
+    redis.call('HINCRBY', KEYS[1], 'c:' .. prev, -1)
+  end
+end
+redis.call('HINCRBY', KEYS[1], 'n:' .. new, 1)
+if new_s ~= '' then
+  redis.call('HINCRBYFLOAT', KEYS[1], 's:' .. new, new_s)
+  redis.call('HINCRBY', KEYS[1], 'c:' .. new, 1)
+end
+return 1
+"""
+
+
+def artist_scope(artist_id: int) -> str:
+    return f"artist:{artist_id}"
+
+
+def _key(scope: str) -> str:
+    return f"stats:transfers:{scope}"
+
+
+def buckets_select(*group_by):
+    """Per-status count and completion-time aggregates in a single pass."""
+    completed = Transfer.transfer_completed_at.isnot(None)
+    duration = extract("epoch", Transfer.transfer_completed_at - Transfer.created_at)
+    return (
+        select(
+            *group_by,
+            Transfer.status,
+            func.count(),
+            func.sum(duration).filter(completed),
+            func.count().filter(completed),
+        )
+        .group_by(*group_by, Transfer.status)
+    )
+
+
+def bucket_row(status, count, seconds, completed) -> Tuple[str, Tuple[int, float, int]]:
+    status = status.value if hasattr(status, "value") else status
+    return status, (int(count), float(seconds or 0), int(completed or 0))
+
+
+def _queue_prime(pipe, scope: str, buckets: StatusBuckets) -> None:
+    mapping = {_SENTINEL: 1}
+    for status, (count, seconds, completed) in buckets.items():
+        mapping.update({f"n:{status}": count, f"s:{status}": seconds, f"c:{status}": completed})
+    key = _key(scope)
+    pipe.delete(key)
+    pipe.hset(key, mapping=mapping)
+    pipe.expire(key, settings.TRANSFER_STATS_TTL_SECONDS)
+
+
+def _parse(raw: Dict[str, str]) -> StatusBuckets:
+    buckets: StatusBuckets = {}
+    for field, value in raw.items():
+        if field.startswith("n:"):
+            status = field[2:]
+            buckets[status] = (
+                int(value),
+                float(raw.get(f"s:{status}") or 0),
+                int(raw.get(f"c:{status}") or 0),
+            )
+    return buckets
+
+
+class TransferStatsCounters:
+    """Redis copies of per-status transfer counts for each visibility scope.
+
+    Scopes are ``all`` and ``artist:<id>``; every role's dashboard is
+    composed from those (see ``TransferService.get_stats``). Kept current from
+    committed ``transfer.status`` events and rebuilt by
+    ``rebuild_transfer_stats`` (Celery beat). Every method is a no-op, or
+    returns None, when Redis is unavailable so callers fall back to SQL.
+    """
+
+    async def get(self, scopes: Iterable[str]) -> Dict[str, StatusBuckets]:
+        """Cached buckets for whichever of ``scopes`` are loaded."""
+        scopes = list(scopes)
+        r = get_async_redis()
+        if r is None:
+            return {}
+        try:
+            pipe = r.pipeline(transaction=False)
+            for scope in scopes:
+                pipe.hgetall(_key(scope))
+            results = await pipe.execute()
+        except Exception as exc:
+            async_redis_failed(exc)
+            logger.warning("Failed to read transfer stats for %s", ", ".join(scopes))
+            return {}
+        return {scope: _parse(raw) for scope, raw in zip(scopes, results) if raw}
+
+    async def prime(self, buckets_by_scope: Dict[str, StatusBuckets]) -> None:
+        r = get_async_redis()
+        if r is None or not buckets_by_scope:
+            return
+        try:
+            pipe = r.pipeline()
+            for scope, buckets in buckets_by_scope.items():
+                _queue_prime(pipe, scope, buckets)
+            await pipe.execute()
+        except Exception as exc:
+            async_redis_failed(exc)
+            logger.warning("Failed to prime transfer stats for %s", ", ".join(buckets_by_scope))
+
+    def prime_sync(self, buckets_by_scope: Dict[str, StatusBuckets]) -> None:
+        r = get_redis()
+        if r is None or not buckets_by_scope:
+            return
+        try:
+            pipe = r.pipeline()
+            for scope, buckets in buckets_by_scope.items():
+                _queue_prime(pipe, scope, buckets)
+            pipe.execute()
+        except Exception:
+            logger.warning("Failed to prime transfer stats for %d scope(s)", len(buckets_by_scope))
+
+    def loaded_scopes_sync(self) -> List[str]:
+        r = get_redis()
+        if r is None:
+            return []
+        prefix = _key("")
+        return [key[len(prefix):] for key in r.scan_iter(f"{prefix}*", count=500)]
+
+    def apply(self, payloads: List[dict]) -> None:
+        ops = []
+        for p in payloads:
+            if p.get("type") != "transfer.status":
+                continue
+            args = (
+                p.get("previous_status") or "",
+                p["status"],
+                _seconds_arg(p.get("previous_completed_seconds")),
+                _seconds_arg(p.get("completed_seconds")),
+            )
+            ops.append((_key(ALL_SCOPE), args))
+            ops.append((_key(artist_scope(p["artist_id"])), args))
+        if not ops:
+            return
+
+        if async_redis_active():
+            r = get_async_redis()
+            if r is None or spawn(self._apply_async, r, ops):
+                return
+
+        r = get_redis()
+        if r is None:
+            return
+        try:
+            pipe = r.pipeline(transaction=False)
+            for key, args in ops:
+                pipe.eval(_APPLY_LUA, 1, key, *args)
+            pipe.execute()
+        except Exception:
+            logger.warning("Failed to apply %d transfer stats update(s)", len(ops))
+
+    async def _apply_async(self, r, ops) -> None:
+        pipe = r.pipeline(transaction=False)
+        for key, args in ops:
+            pipe.eval(_APPLY_LUA, 1, key, *args)
+        await pipe.execute()
+
+
+def _seconds_arg(seconds: Optional[float]) -> str:
+    return "" if seconds is None else repr(float(seconds))
+
+
+transfer_stats = TransferStatsCounters()
+on_commit(transfer_stats.apply)
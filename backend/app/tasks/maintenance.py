@@ -3,14 +3,24 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func
 from sqlalchemy.orm import Session, sessionmaker
 
 from backend.app.core.celery_app import celery_app
 from backend.app.core.config import settings
-from backend.app.models.notification import Notification, NotificationType
+from backend.app.core.redis_client import get_redis
+from backend.app.models.notification import Notification, NotificationReadCursor, NotificationType
 from backend.app.models.transfer import Transfer, TransferStatus
 from backend.app.models.user import User, UserRole
+from backend.app.services.analytics_service import rollup_history
+from backend.app.services.notification_counters import notification_counters
+from backend.app.services.transfer_stats import (
+    ALL_SCOPE,
+    artist_scope,
+    bucket_row,
+    buckets_select,
+    transfer_stats,
+)
 
 logger = logging.getLogger("databridge.tasks.maintenance")
 
@@ -39,24 +49,18 @@ def cleanup_stale_transfers() -> dict:
             logger.info("No stale transfers found")
             return {"stale_count": 0}
 
-        admins = db.query(User).filter(
-            User.role == UserRole.ADMIN,
-            User.is_active.is_(True),
-        ).all()
-
         refs = [t.reference for t in stale]
         msg = (
             f"{len(stale)} transfer(s) have been stuck for >24 hours: "
             f"{', '.join(refs[:10])}"
         )
 
-        for admin in admins:
-            db.add(Notification(
-                user_id=admin.id,
-                type=NotificationType.SYSTEM,
-                title="Stale transfers detected",
-                message=msg,
-            ))
+        db.add(Notification(
+            target_role=UserRole.ADMIN,
+            type=NotificationType.SYSTEM,
+            title="Stale transfers detected",
+            message=msg,
+        ))
 
         db.commit()
         logger.warning("Found %d stale transfers: %s", len(stale), ", ".join(refs))
@@ -103,3 +107,121 @@ def sync_shotgrid_users() -> dict:
         return {"error": "Failed"}
     finally:
         db.close()
+
+
+@celery_app.task(name="backend.app.tasks.maintenance.reconcile_notification_counters")
+def reconcile_notification_counters() -> dict:
+    r = get_redis()
+    if r is None:
+        logger.info("Redis unavailable — skipping notification counter reconciliation")
+        return {"checked": 0, "skipped": True}
+
+    db: Session = SyncSession()
+    try:
+        user_ids = sorted(
+            int(key.rsplit(":", 1)[1]) for key in r.scan_iter("notif:user:*", count=500)
+        )
+        repaired = 0
+        for start in range(0, len(user_ids), 500):
+            chunk = user_ids[start:start + 500]
+            # Snapshot Redis before reading Postgres: a notification committed
+            # in between bumps the hash, and the repair below then backs off
+            # rather than overwriting it with the older count.
+            pipe = r.pipeline(transaction=False)
+            for uid in chunk:
+                pipe.hmget(f"notif:user:{uid}", "total", "unread", "cursor")
+            snapshot = dict(zip(chunk, pipe.execute()))
+
+            truth = {uid: (0, 0, 0) for uid in chunk}
+            for uid, total, unread in db.query(
+                Notification.user_id,
+                func.count(),
+                func.count().filter(Notification.is_read.is_(False)),
+            ).filter(Notification.user_id.in_(chunk)).group_by(Notification.user_id):
+                truth[uid] = (total, unread, 0)
+            for uid, cursor in db.query(
+                NotificationReadCursor.user_id, NotificationReadCursor.last_read_id,
+            ).filter(NotificationReadCursor.user_id.in_(chunk)):
+                truth[uid] = truth[uid][:2] + (cursor,)
+
+            for uid, cached in snapshot.items():
+                if None in cached or tuple(int(v) for v in cached) == truth[uid]:
+                    continue
+                if notification_counters.repair_user_sync(uid, cached, *truth[uid]):
+                    repaired += 1
+
+        for role in UserRole:
+            seen = r.zrange(f"notif:role:{role.value}", 0, -1)
+            if not seen:
+                continue
+            ids = [i for (i,) in db.query(Notification.id).filter(Notification.target_role == role)]
+            if {m for m in seen if m != "-"} != {str(i) for i in ids}:
+                if notification_counters.repair_role_sync(role, seen, ids):
+                    repaired += 1
+
+        if repaired:
+            logger.warning("Repaired %d drifted notification counter(s)", repaired)
+        return {"checked": len(user_ids), "repaired": repaired}
+
+    except Exception:
+        logger.exception("Error in reconcile_notification_counters")
+        return {"error": "Failed"}
+    finally:
+        db.close()
+
+
+@celery_app.task(name="backend.app.tasks.maintenance.rebuild_transfer_stats")
+def rebuild_transfer_stats() -> dict:
+    """Recompute every loaded dashboard stats scope from PostgreSQL."""
+    if get_redis() is None:
+        logger.info("Redis unavailable — skipping transfer stats rebuild")
+        return {"rebuilt": 0, "skipped": True}
+
+    db: Session = SyncSession()
+    try:
+        scopes = set(transfer_stats.loaded_scopes_sync())
+        scopes.add(ALL_SCOPE)
+        artist_ids = sorted(int(s.split(":", 1)[1]) for s in scopes if s != ALL_SCOPE)
+
+        fresh = {scope: {} for scope in scopes}
+        for row in db.execute(buckets_select()):
+            status, values = bucket_row(*row)
+            fresh[ALL_SCOPE][status] = values
+        for start in range(0, len(artist_ids), 500):
+            chunk = artist_ids[start:start + 500]
+            for artist_id, *row in db.execute(
+                buckets_select(Transfer.artist_id).where(Transfer.artist_id.in_(chunk))
+            ):
+                status, values = bucket_row(*row)
+                fresh[artist_scope(artist_id)][status] = values
+
+        transfer_stats.prime_sync(fresh)
+        return {"rebuilt": len(fresh)}
+
+    except Exception:
+        logger.exception("Error in rebuild_transfer_stats")
+        return {"error": "Failed"}
+    finally:
+        db.close()
+
+
+@celery_app.task(name="backend.app.tasks.maintenance.rollup_transfer_history")
+def rollup_transfer_history(max_batches: int = 20) -> dict:
+    db: Session = SyncSession()
+    try:
+        consumed = 0
+        for _ in range(max_batches):
+            n = rollup_history(db)
+            consumed += n
+            if n < settings.ANALYTICS_ROLLUP_BATCH_SIZE:
+                break
+        if consumed:
+            logger.info("Rolled up %d transfer history row(s)", consumed)
+        return {"consumed": consumed}
+
+    except Exception:
+        logger.exception("Error in rollup_transfer_history")
+        db.rollback()
+        return {"error": "Failed"}
+    finally:
+        db.close()
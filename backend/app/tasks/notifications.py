@@ -4,14 +4,16 @@ import logging
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from typing import List
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session, sessionmaker
 
 from backend.app.core.celery_app import celery_app
 from backend.app.core.config import settings
 from backend.app.models.notification import Notification, NotificationType
 from backend.app.models.user import User, UserRole
+from backend.app.services.notification_dispatcher import notification_dispatcher
 
 logger = logging.getLogger("databridge.tasks.notifications")
 
@@ -59,6 +61,40 @@ def create_notification_task(
         db.close()
 
 
+@celery_app.task(name="backend.app.tasks.notifications.notify_users_task")
+def notify_users_task(
+    user_ids: List[int],
+    transfer_id: int,
+    notif_type: str,
+    title: str,
+    message: str,
+) -> dict:
+    db: Session = SyncSession()
+    try:
+        dispatched = notification_dispatcher.fan_out_sync(
+            db,
+            select(User.id).where(User.id.in_(user_ids)),
+            transfer_id=transfer_id if transfer_id else None,
+            ntype=NotificationType(notif_type),
+            title=title,
+            message=message,
+        )
+        db.commit()
+
+        emailed = notification_dispatcher.queue_emails(db, dispatched, title, message)
+        db.commit()
+
+        logger.info("Notified %d user(s), %d by email: %s", len(dispatched), emailed, title)
+        return {"notified": len(dispatched), "emailed": emailed}
+
+    except Exception:
+        logger.exception("Error in notify_users_task for %d user(s)", len(user_ids))
+        db.rollback()
+        return {"error": "Failed"}
+    finally:
+        db.close()
+
+
 @celery_app.task(name="backend.app.tasks.notifications.notify_role_task")
 def notify_role_task(
     role: str,
@@ -70,30 +106,31 @@ def notify_role_task(
     db: Session = SyncSession()
     try:
         role_enum = UserRole(role)
-        users = db.query(User).filter(User.role == role_enum, User.is_active.is_(True)).all()
-        created = 0
-        for user in users:
-            notif = Notification(
-                user_id=user.id,
-                transfer_id=transfer_id if transfer_id else None,
-                type=NotificationType(notif_type),
-                title=title,
-                message=message,
-            )
-            db.add(notif)
-            created += 1
+        notif = Notification(
+            target_role=role_enum,
+            transfer_id=transfer_id if transfer_id else None,
+            type=NotificationType(notif_type),
+            title=title,
+            message=message,
+        )
+        db.add(notif)
         db.commit()
 
+        emails = [
+            email for (email,) in db.query(User.email).filter(
+                User.role == role_enum, User.is_active.is_(True),
+            )
+        ]
         if settings.NOTIFICATION_ENABLED and settings.SMTP_HOST:
-            for user in users:
-                if user.email:
-                    try:
-                        send_email.delay(user.email, title, _build_email_html(title, message))
-                    except Exception:
-                        pass
+            recipients = [e for e in emails if e]
+            if recipients:
+                try:
+                    send_email_batch.delay(recipients, title, message)
+                except Exception:
+                    logger.warning("Failed to queue emails for role %s", role)
 
-        logger.info("Notified %d %s users: %s", created, role, title)
-        return {"notified": created, "role": role}
+        logger.info("Notified %d %s users: %s", len(emails), role, title)
+        return {"notified": len(emails), "role": role, "notification_id": notif.id}
 
     except Exception:
         logger.exception("Error in notify_role_task for role %s", role)
@@ -128,6 +165,38 @@ def send_email(to_email: str, subject: str, body_html: str) -> dict:
         return {"sent": False, "to": to_email, "error": "SMTP failure"}
 
 
+@celery_app.task(name="backend.app.tasks.notifications.send_email_batch")
+def send_email_batch(to_emails: List[str], subject: str, message: str) -> dict:
+    """Send the same notification to many recipients over one SMTP session."""
+    body_html = _build_email_html(subject, message)
+    sent, failed = 0, []
+    try:
+        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=30) as server:
+            server.ehlo()
+            if settings.SMTP_PORT == 587:
+                server.starttls()
+                server.ehlo()
+            for to_email in to_emails:
+                msg = MIMEMultipart("alternative")
+                msg["Subject"] = f"[DataBridge] {subject}"
+                msg["From"] = settings.SMTP_FROM_EMAIL
+                msg["To"] = to_email
+                msg.attach(MIMEText(body_html, "html"))
+                try:
+                    server.sendmail(settings.SMTP_FROM_EMAIL, [to_email], msg.as_string())
+                    sent += 1
+                except smtplib.SMTPException:
+                    failed.append(to_email)
+    except Exception:
+        logger.exception("SMTP session failed after %d of %d emails: %s", sent, len(to_emails), subject)
+        return {"sent": sent, "failed": len(to_emails) - sent, "error": "SMTP failure"}
+
+    if failed:
+        logger.warning("Failed to send %s to %s", subject, ", ".join(failed))
+    logger.info("Batch email sent to %d recipient(s): %s", sent, subject)
+    return {"sent": sent, "failed": len(failed)}
+
+
 def _build_email_html(title: str, message: str) -> str:
     return f"""\
 <!DOCTYPE html>
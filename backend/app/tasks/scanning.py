@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import logging
 import subprocess
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -12,6 +13,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from backend.app.core.celery_app import celery_app
 from backend.app.core.config import settings
 from backend.app.models.transfer import Transfer, TransferFile, TransferStatus
+from backend.app.services.progress_service import ProgressTracker
 
 logger = logging.getLogger("databridge.tasks.scanning")
 
@@ -24,6 +26,7 @@ CHUNK_SIZE = 1024 * 1024
 @celery_app.task(bind=True, name="backend.app.tasks.scanning.virus_scan_transfer")
 def virus_scan_transfer(self, transfer_id: int) -> dict:
     db: Session = SyncSession()
+    tracker = None
     try:
         transfer = db.query(Transfer).filter(Transfer.id == transfer_id).first()
         if not transfer:
@@ -31,6 +34,11 @@ def virus_scan_transfer(self, transfer_id: int) -> dict:
 
         files = db.query(TransferFile).filter(TransferFile.transfer_id == transfer_id).all()
         scan_results = {"total": len(files), "clean": 0, "infected": 0, "errors": 0, "skipped": 0}
+        tracker = ProgressTracker(
+            transfer_id, "scan",
+            total_bytes=sum(tf.size_bytes for tf in files),
+            total_files=len(files),
+        )
 
         if not settings.CLAMAV_ENABLED:
             logger.warning("ClamAV disabled — marking all %d files as clean", len(files))
@@ -40,6 +48,8 @@ def virus_scan_transfer(self, transfer_id: int) -> dict:
             scan_results["skipped"] = len(files)
             transfer.scan_result = scan_results
             db.commit()
+            tracker.update(bytes_done=tracker.total_bytes, files_done=len(files))
+            tracker.finish(detail="ClamAV disabled — scan skipped")
             return scan_results
 
         for tf in files:
@@ -48,6 +58,7 @@ def virus_scan_transfer(self, transfer_id: int) -> dict:
                 tf.virus_scan_status = "error"
                 tf.virus_scan_detail = "File not found on disk"
                 scan_results["errors"] += 1
+                tracker.update(advance_bytes=tf.size_bytes, advance_files=1, current_file=tf.filename)
                 continue
 
             try:
@@ -85,11 +96,14 @@ def virus_scan_transfer(self, transfer_id: int) -> dict:
                 tf.virus_scan_detail = str(exc)[:500]
                 scan_results["errors"] += 1
 
-            db.commit()
-            self.update_state(state="PROGRESS", meta=scan_results)
+            # Per-file results are committed in step with the throttled
+            # progress flush instead of once per file.
+            if tracker.update(advance_bytes=tf.size_bytes, advance_files=1, current_file=tf.filename):
+                db.commit()
 
         transfer.scan_result = scan_results
         db.commit()
+        tracker.finish()
 
         logger.info(
             "Virus scan complete for %s: %d clean, %d infected, %d errors, %d skipped",
@@ -100,6 +114,8 @@ def virus_scan_transfer(self, transfer_id: int) -> dict:
 
     except Exception:
         logger.exception("Fatal error in virus_scan_transfer for %d", transfer_id)
+        if tracker is not None:
+            tracker.finish("failed", "Scan aborted — see worker logs")
         raise
     finally:
         db.close()
@@ -108,6 +124,7 @@ def virus_scan_transfer(self, transfer_id: int) -> dict:
 @celery_app.task(bind=True, name="backend.app.tasks.scanning.checksum_verify_transfer")
 def checksum_verify_transfer(self, transfer_id: int) -> dict:
     db: Session = SyncSession()
+    tracker = None
     try:
         transfer = db.query(Transfer).filter(Transfer.id == transfer_id).first()
         if not transfer:
@@ -115,12 +132,28 @@ def checksum_verify_transfer(self, transfer_id: int) -> dict:
 
         files = db.query(TransferFile).filter(TransferFile.transfer_id == transfer_id).all()
         results = {"total": len(files), "verified": 0, "failed": 0, "missing": 0}
+        tracker = ProgressTracker(
+            transfer_id, "checksum",
+            total_bytes=sum(tf.size_bytes for tf in files),
+            total_files=len(files),
+        )
+        # Per-chunk progress updates use up the tracker's flush window, so
+        # results are committed on a clock of their own.
+        last_commit = time.monotonic()
+
+        def commit_periodically() -> None:
+            nonlocal last_commit
+            if time.monotonic() - last_commit >= tracker.interval:
+                db.commit()
+                last_commit = time.monotonic()
 
         for tf in files:
             file_path = Path(tf.original_path)
             if not file_path.exists():
                 tf.checksum_verified = False
                 results["missing"] += 1
+                tracker.update(advance_bytes=tf.size_bytes, advance_files=1, current_file=tf.filename)
+                commit_periodically()
                 continue
 
             sha = hashlib.sha256()
@@ -130,6 +163,7 @@ def checksum_verify_transfer(self, transfer_id: int) -> dict:
                     if not chunk:
                         break
                     sha.update(chunk)
+                    tracker.update(advance_bytes=len(chunk), current_file=tf.filename)
 
             computed = sha.hexdigest()
             if tf.checksum_sha256 and computed == tf.checksum_sha256:
@@ -143,13 +177,15 @@ def checksum_verify_transfer(self, transfer_id: int) -> dict:
                     tf.filename, tf.checksum_sha256, computed,
                 )
 
-            db.commit()
+            tracker.update(advance_files=1)
+            commit_periodically()
 
         all_ok = results["failed"] == 0 and results["missing"] == 0
         if not all_ok:
             transfer.scan_passed = False
 
         db.commit()
+        tracker.finish()
 
         logger.info(
             "Checksum verification for %s: %d ok, %d failed, %d missing",
@@ -159,6 +195,8 @@ def checksum_verify_transfer(self, transfer_id: int) -> dict:
 
     except Exception:
         logger.exception("Fatal error in checksum_verify_transfer for %d", transfer_id)
+        if tracker is not None:
+            tracker.finish("failed", "Checksum verification aborted — see worker logs")
         raise
     finally:
         db.close()
@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
+import re
 import shutil
 import subprocess
+import tempfile
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional, Tuple
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, literal, select
 from sqlalchemy.orm import Session, sessionmaker
 
 from backend.app.core.celery_app import celery_app
@@ -15,7 +20,12 @@ from backend.app.core.config import settings
 from backend.app.models.history import TransferHistory
 from backend.app.models.notification import Notification, NotificationType
 from backend.app.models.transfer import Transfer, TransferFile, TransferStatus
-from backend.app.models.user import User, UserRole
+from backend.app.models.user import UserRole
+from backend.app.services.notification_dispatcher import (
+    approver_recipients,
+    notification_dispatcher,
+)
+from backend.app.services.progress_service import ProgressTracker
 
 logger = logging.getLogger("databridge.tasks.transfer")
 
@@ -23,9 +33,16 @@ sync_engine = create_engine(settings.database_url_sync, pool_pre_ping=True)
 SyncSession = sessionmaker(bind=sync_engine)
 
 CHUNK_SIZE = 1024 * 1024
+RSYNC_TIMEOUT_SECONDS = 7200
 
+# rsync --info=progress2 line, e.g.
+#   "  1,234,567  45%   10.50MB/s    0:00:12 (xfr#3, to-chk=10/20)"
+_RSYNC_PROGRESS_RE = re.compile(
+    r"^\s*([\d,]+)\s+(\d+)%.*?(?:\(xfr#(\d+),\s*(?:to|ir)-chk=(\d+)/(\d+)\))?\s*$"
+)
 
-def _compute_checksum(filepath: str) -> str:
+
+def _compute_checksum(filepath: str, tracker: Optional[ProgressTracker] = None) -> str:
     sha = hashlib.sha256()
     with open(filepath, "rb") as f:
         while True:
@@ -33,19 +50,89 @@ def _compute_checksum(filepath: str) -> str:
             if not chunk:
                 break
             sha.update(chunk)
+            if tracker is not None:
+                tracker.update(advance_bytes=len(chunk))
     return sha.hexdigest()
 
 
+def _parse_rsync_progress(line: str) -> Optional[Tuple[int, Optional[int], Optional[int]]]:
+    """Return (bytes_done, files_done, files_total) from a progress2 line."""
+    match = _RSYNC_PROGRESS_RE.match(line)
+    if not match:
+        return None
+    bytes_done = int(match.group(1).replace(",", ""))
+    if match.group(4) is None:
+        return bytes_done, None, None
+    remaining, total = int(match.group(4)), int(match.group(5))
+    return bytes_done, total - remaining, total
+
+
+def _run_rsync(cmd: list, tracker: ProgressTracker, timeout: int) -> Tuple[int, str]:
+    """Run rsync, feeding its progress2 output into ``tracker``.
+
+    stderr goes to a temp file so a chatty failure can't fill the pipe while
+    we are blocked reading stdout. Raises TimeoutExpired like subprocess.run.
+    """
+    with tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err)
+        timed_out = threading.Event()
+
+        def _kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _kill)
+        timer.start()
+        try:
+            pending = b""
+            while True:
+                chunk = proc.stdout.read1(65536)
+                if not chunk:
+                    break
+                lines = re.split(rb"[\r\n]", pending + chunk)
+                pending = lines.pop()
+                for raw in lines:
+                    parsed = _parse_rsync_progress(raw.decode("utf-8", "replace"))
+                    if parsed is None:
+                        continue
+                    bytes_done, files_done, files_total = parsed
+                    if files_total:
+                        tracker.total_files = files_total
+                    tracker.update(bytes_done=bytes_done, files_done=files_done)
+            proc.wait()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        err.seek(0)
+        return proc.returncode, err.read().decode("utf-8", "replace")
+
+
+def _copy_tree(src: str, dst: str, tracker: ProgressTracker) -> None:
+    """shutil.copytree(dirs_exist_ok=True) equivalent that reports per file."""
+    for root, _dirs, names in os.walk(src):
+        target = Path(dst) / os.path.relpath(root, src)
+        target.mkdir(parents=True, exist_ok=True)
+        for name in names:
+            source = os.path.join(root, name)
+            shutil.copy2(source, target / name)
+            tracker.update(
+                advance_bytes=os.path.getsize(source),
+                advance_files=1,
+                current_file=name,
+            )
+
+
 def _notify_role(db: Session, role: UserRole, transfer: Transfer, ntype: NotificationType, title: str, message: str):
-    users = db.query(User).filter(User.role == role, User.is_active.is_(True)).all()
-    for u in users:
-        db.add(Notification(
-            user_id=u.id,
-            transfer_id=transfer.id,
-            type=ntype,
-            title=title,
-            message=message,
-        ))
+    db.add(Notification(
+        target_role=role,
+        transfer_id=transfer.id,
+        type=ntype,
+        title=title,
+        message=message,
+    ))
 
 
 @celery_app.task(bind=True, name="backend.app.tasks.transfer.prepare_for_transfer")
@@ -124,6 +211,7 @@ def prepare_for_transfer(self, transfer_id: int) -> dict:
 @celery_app.task(bind=True, name="backend.app.tasks.transfer.execute_transfer")
 def execute_transfer(self, transfer_id: int) -> dict:
     db: Session = SyncSession()
+    tracker = None
     try:
         transfer = db.query(Transfer).filter(Transfer.id == transfer_id).first()
         if not transfer:
@@ -136,6 +224,12 @@ def execute_transfer(self, transfer_id: int) -> dict:
 
         staging = transfer.staging_path
         production = transfer.production_path
+        tracker = ProgressTracker(
+            transfer_id, "transfer",
+            total_bytes=transfer.total_size_bytes,
+            total_files=transfer.total_files,
+        )
+        tracker.update(force=True)
 
         if not staging or not production:
             transfer.status = TransferStatus.SCAN_FAILED
@@ -145,26 +239,32 @@ def execute_transfer(self, transfer_id: int) -> dict:
                 description="Missing staging or production path",
             ))
             db.commit()
+            tracker.finish("failed", "Missing staging or production path")
             return {"error": "Missing staging or production path"}
 
         if settings.TRANSFER_METHOD == "rsync":
             src = staging.rstrip("/") + "/"
             dst = production.rstrip("/") + "/"
-            cmd = ["rsync", "-avz", "--checksum", src, dst]
+            cmd = [
+                "rsync", "-az", "--checksum",
+                "--info=progress2", "--no-inc-recursive",
+                src, dst,
+            ]
             logger.info("Running: %s", " ".join(cmd))
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=7200)
-            if result.returncode != 0:
-                logger.error("rsync failed: %s", result.stderr)
+            returncode, stderr = _run_rsync(cmd, tracker, RSYNC_TIMEOUT_SECONDS)
+            if returncode != 0:
+                logger.error("rsync failed: %s", stderr)
                 transfer.status = TransferStatus.SCAN_FAILED
                 db.add(TransferHistory(
                     transfer_id=transfer.id,
                     action="transfer_error",
-                    description=f"rsync failed (exit {result.returncode}): {result.stderr[:500]}",
+                    description=f"rsync failed (exit {returncode}): {stderr[:500]}",
                 ))
                 db.commit()
-                return {"error": f"rsync failed: {result.stderr[:200]}"}
+                tracker.finish("failed", f"rsync exited with {returncode}")
+                return {"error": f"rsync failed: {stderr[:200]}"}
         else:
-            shutil.copytree(staging, production, dirs_exist_ok=True)
+            _copy_tree(staging, production, tracker)
 
         transfer.status = TransferStatus.VERIFYING
         db.add(TransferHistory(
@@ -173,6 +273,7 @@ def execute_transfer(self, transfer_id: int) -> dict:
             description=f"Files transferred via {settings.TRANSFER_METHOD}, now verifying",
         ))
         db.commit()
+        tracker.finish()
 
         logger.info("Transfer %s files copied via %s, now verifying", transfer.reference, settings.TRANSFER_METHOD)
         return {"transfer_id": transfer_id, "status": "verifying"}
@@ -188,9 +289,13 @@ def execute_transfer(self, transfer_id: int) -> dict:
                 description="File transfer timed out after 2 hours",
             ))
             db.commit()
+        if tracker is not None:
+            tracker.finish("failed", "File transfer timed out after 2 hours")
         raise
     except Exception:
         logger.exception("Fatal error in execute_transfer for %d", transfer_id)
+        if tracker is not None:
+            tracker.finish("failed", "Transfer aborted — see worker logs")
         raise
     finally:
         db.close()
@@ -199,6 +304,7 @@ def execute_transfer(self, transfer_id: int) -> dict:
 @celery_app.task(bind=True, name="backend.app.tasks.transfer.verify_transfer")
 def verify_transfer(self, transfer_id: int) -> dict:
     db: Session = SyncSession()
+    tracker = None
     try:
         transfer = db.query(Transfer).filter(Transfer.id == transfer_id).first()
         if not transfer:
@@ -213,15 +319,23 @@ def verify_transfer(self, transfer_id: int) -> dict:
             db.commit()
             return {"error": "Production path missing"}
 
+        tracker = ProgressTracker(
+            transfer_id, "verify",
+            total_bytes=sum(tf.size_bytes for tf in files),
+            total_files=len(files),
+        )
         mismatches = []
         for tf in files:
             prod_file = production_path / tf.filename
             if not prod_file.exists():
                 mismatches.append(tf.filename)
                 tf.checksum_verified = False
+                tracker.update(advance_bytes=tf.size_bytes, advance_files=1, current_file=tf.filename)
                 continue
 
-            prod_checksum = _compute_checksum(str(prod_file))
+            tracker.update(current_file=tf.filename)
+            prod_checksum = _compute_checksum(str(prod_file), tracker)
+            tracker.update(advance_files=1)
             if tf.checksum_sha256 and prod_checksum == tf.checksum_sha256:
                 tf.checksum_verified = True
             else:
@@ -251,6 +365,7 @@ def verify_transfer(self, transfer_id: int) -> dict:
             _notify_role(db, UserRole.IT_TEAM, transfer, NotificationType.TRANSFER_FAILED, f"Verification failed: {transfer.reference}", msg)
 
             db.commit()
+            tracker.finish("failed", f"{len(mismatches)} mismatched file(s)")
             logger.error("Transfer %s verification FAILED: %d mismatches", transfer.reference, len(mismatches))
             return {"status": "failed", "mismatches": len(mismatches)}
 
@@ -264,6 +379,7 @@ def verify_transfer(self, transfer_id: int) -> dict:
             description=f"All {len(files)} files verified and delivered to production",
         ))
         db.commit()
+        tracker.finish()
 
         try:
             from backend.app.services.shotgrid_service import shotgrid_service
@@ -290,31 +406,14 @@ def verify_transfer(self, transfer_id: int) -> dict:
             f"delivered to production. {len(files)} files verified."
         )
 
-        db.add(Notification(
-            user_id=transfer.artist_id,
+        notification_dispatcher.fan_out_sync(
+            db,
+            approver_recipients(transfer_id).union(select(literal(transfer.artist_id))),
             transfer_id=transfer.id,
-            type=NotificationType.TRANSFER_COMPLETE,
+            ntype=NotificationType.TRANSFER_COMPLETE,
             title=f"Transfer complete: {transfer.reference}",
             message=success_msg,
-        ))
-
-        from backend.app.models.approval import Approval, ApprovalStatus
-        approvers = db.query(Approval).filter(
-            Approval.transfer_id == transfer_id,
-            Approval.status == ApprovalStatus.APPROVED,
-            Approval.approver_id.isnot(None),
-        ).all()
-        notified_ids = {transfer.artist_id}
-        for a in approvers:
-            if a.approver_id not in notified_ids:
-                db.add(Notification(
-                    user_id=a.approver_id,
-                    transfer_id=transfer.id,
-                    type=NotificationType.TRANSFER_COMPLETE,
-                    title=f"Transfer complete: {transfer.reference}",
-                    message=success_msg,
-                ))
-                notified_ids.add(a.approver_id)
+        )
 
         _notify_role(db, UserRole.DATA_TEAM, transfer, NotificationType.TRANSFER_COMPLETE, f"Transfer complete: {transfer.reference}", success_msg)
         _notify_role(db, UserRole.IT_TEAM, transfer, NotificationType.TRANSFER_COMPLETE, f"Transfer complete: {transfer.reference}", success_msg)
@@ -325,6 +424,8 @@ def verify_transfer(self, transfer_id: int) -> dict:
 
     except Exception:
         logger.exception("Fatal error in verify_transfer for %d", transfer_id)
+        if tracker is not None:
+            tracker.finish("failed", "Verification aborted — see worker logs")
         raise
     finally:
         db.close()
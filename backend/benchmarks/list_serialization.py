@@ -0,0 +1,128 @@
+"""
+Serialization cost of a 100-item ``GET /transfers/`` page.
+
+Compares the response-model path (TransferSummary models, FastAPI's
+``serialize_response`` and the stdlib JSONResponse) with the direct path the
+endpoint now takes (row dicts rendered by APIJSONResponse), then the
+compression applied on top. No database involved; run with
+
+    python -m backend.benchmarks.list_serialization [--items 100] [--rounds 500]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from backend.app.core.responses import APIJSONResponse
+from backend.app.middleware.compression import brotli
+from backend.app.models.approval import ApprovalStatus
+from backend.app.models.transfer import TransferCategory, TransferPriority, TransferStatus, format_size
+from backend.app.models.user import UserRole
+from backend.app.schemas.transfer import ApprovalStageSummary, TransferListResponse, TransferSummary
+
+CHAIN = [UserRole.TEAM_LEAD, UserRole.SUPERVISOR, UserRole.LINE_PRODUCER]
+RESPONSE_FIELD = create_response_field(name="Response_list_transfers", type_=TransferListResponse)
+LOOP = asyncio.new_event_loop()
+
+
+def rows(n: int) -> list:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": i,
+            "reference": f"TRF-{i:05d}",
+            "name": f"Episode 104 comp plates batch {i}",
+            "category": TransferCategory.VFX_ASSETS,
+            "status": TransferStatus.PENDING_SUPERVISOR,
+            "priority": TransferPriority.NORMAL,
+            "artist_id": 7,
+            "artist_name": "Test Artist",
+            "total_files": 240,
+            "total_size_bytes": 52_428_800 * i,
+            "shotgrid_entity_name": f"SH{i:03d}0",
+            "rejection_reason": None,
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now,
+        }
+        for i in range(n)
+    ]
+
+
+def model_path(raw: list) -> bytes:
+    items = [
+        TransferSummary(
+            **row,
+            size_display=format_size(row["total_size_bytes"]),
+            approval_chain=[
+                ApprovalStageSummary(role=role, status=ApprovalStatus.PENDING, approver_name=None)
+                for role in CHAIN
+            ],
+        )
+        for row in raw
+    ]
+    content = TransferListResponse(items=items, total=5000, page=1, per_page=len(raw), pages=50)
+    data = LOOP.run_until_complete(serialize_response(field=RESPONSE_FIELD, response_content=content))
+    return JSONResponse(data).body
+
+
+def direct_path(raw: list) -> bytes:
+    items = [
+        {
+            **row,
+            "size_display": format_size(row["total_size_bytes"]),
+            "approval_chain": [
+                {"role": role, "status": ApprovalStatus.PENDING, "approver_name": None} for role in CHAIN
+            ],
+        }
+        for row in raw
+    ]
+    return APIJSONResponse({
+        "items": items, "total": 5000, "total_estimated": False,
+        "page": 1, "per_page": len(raw), "pages": 50, "next_cursor": None,
+    }).body
+
+
+def timed(fn, arg, rounds: int):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        out = fn(arg)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return out, statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+    raw = rows(args.items)
+
+    print(f"{args.items}-item page, {args.rounds} rounds (ms)")
+    print(f"{'path':<28}{'p50':>8}{'p95':>8}{'bytes':>10}")
+    results = {}
+    for name, fn in (("response model + json", model_path), ("row dicts + orjson", direct_path)):
+        body, p50, p95 = timed(fn, raw, args.rounds)
+        results[name] = body
+        print(f"{name:<28}{p50:>8.2f}{p95:>8.2f}{len(body):>10}")
+
+    body = results["row dicts + orjson"]
+    codecs = [("gzip level 6", lambda b: gzip.compress(b, compresslevel=6))]
+    if brotli is not None:
+        codecs.append(("brotli quality 4", lambda b: brotli.compress(b, quality=4)))
+    for name, fn in codecs:
+        out, p50, p95 = timed(fn, body, args.rounds)
+        print(f"{'+ ' + name:<28}{p50:>8.2f}{p95:>8.2f}{len(out):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Response compression and the direct (model-free) list serialization."""
+from __future__ import annotations
+
+import gzip
+
+import pytest
+
+from backend.app.schemas.transfer import TransferListResponse
+
+
+@pytest.mark.asyncio
+async def test_large_list_is_gzipped_and_matches_the_schema(client, sample_user, sample_transfer, auth_headers):
+    artist = await sample_user("artist")
+    for i in range(30):
+        await sample_transfer(artist, reference=f"TRF-GZ{i:03d}")
+
+    resp = await client.get(
+        "/api/v1/transfers/", params={"per_page": 30}, headers={**auth_headers(artist), "Accept-Encoding": "gzip"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in resp.headers["vary"].lower()
+    page = TransferListResponse.model_validate(resp.json())
+    assert len(page.items) == 30
+    assert page.items[0].approval_chain
+
+
+@pytest.mark.asyncio
+async def test_small_or_unrequested_responses_are_not_compressed(client, sample_user, auth_headers):
+    user = await sample_user("artist")
+    resp = await client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in resp.headers
+
+    resp = await client.get("/api/v1/transfers/", headers={**auth_headers(user), "Accept-Encoding": "identity"})
+    assert "content-encoding" not in resp.headers
+
+
+@pytest.mark.asyncio
+async def test_streamed_export_is_compressed_incrementally(client, sample_user, sample_transfer, auth_headers, db_session, monkeypatch):
+    from backend.app.core.config import settings
+    from backend.app.models.history import TransferHistory
+
+    monkeypatch.setattr(settings, "DATABASE_STREAM_BATCH_SIZE", 10)
+    artist = await sample_user("artist")
+    transfer = await sample_transfer(artist)
+    for i in range(50):
+        db_session.add(TransferHistory(transfer_id=transfer.id, action="noted", description="x" * 40))
+    await db_session.flush()
+
+    async with client.stream(
+        "GET", "/api/v1/activity/export", params={"action": "noted"},
+        headers={**auth_headers(await sample_user("admin")), "Accept-Encoding": "gzip"},
+    ) as resp:
+        assert resp.headers["content-encoding"] == "gzip"
+        raw = b"".join([chunk async for chunk in resp.aiter_raw()])
+    assert len(gzip.decompress(raw).splitlines()) == 50
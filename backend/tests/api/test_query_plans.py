@@ -0,0 +1,59 @@
+"""
+Query-plan checks: EXPLAIN the SQL the hot endpoints actually issue and make
+sure each one is served by the index meant for it rather than a table scan.
+"""
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+
+
+async def query_plans(db_session, statements, table: str) -> List[str]:
+    conn = await db_session.connection()
+    plans = []
+    for statement, parameters in statements:
+        if f"FROM {table} " not in f"{statement} " and not statement.startswith(f"UPDATE {table} "):
+            continue
+        rows = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)).all()
+        plans.append(" | ".join(row[-1] for row in rows))
+    return plans
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "role,method,url,verb,table,index",
+    [
+        ("artist", "GET", "/api/v1/transfers/", "SELECT", "transfers",
+         "ix_transfers_artist_created_at_id"),
+        ("admin", "GET", "/api/v1/transfers/?status=pending_team_lead", "SELECT", "transfers",
+         "ix_transfers_status_created_at_id"),
+        ("team_lead", "GET", "/api/v1/approvals/pending/count", "SELECT", "transfers",
+         "ix_transfers_status_created_at_id"),
+        ("admin", "GET", "/api/v1/activity/?transfer_id={transfer_id}", "SELECT", "transfer_history",
+         "ix_transfer_history_transfer_created_at_id"),
+        ("artist", "GET", "/api/v1/transfers/{transfer_id}/files?scan_status=clean", "SELECT", "transfer_files",
+         "ix_transfer_files_transfer_uploaded_at_id"),
+        ("artist", "GET", "/api/v1/notifications/", "SELECT", "notifications",
+         "ix_notifications_user_created_at_id"),
+        ("artist", "PUT", "/api/v1/notifications/read-all", "UPDATE", "notifications",
+         "ix_notifications_user_unread"),
+    ],
+)
+async def test_hot_endpoints_use_their_indexes(
+    client, db_session, sample_user, sample_transfer, auth_headers, captured_sql,
+    role, method, url, verb, table, index,
+):
+    artist = await sample_user("artist")
+    user = artist if role == "artist" else await sample_user(role)
+    transfer = await sample_transfer(artist)
+
+    with captured_sql(verb) as statements:
+        resp = await client.request(method, url.format(transfer_id=transfer.id), headers=auth_headers(user))
+    assert resp.status_code == 200
+
+    plans = await query_plans(db_session, statements, table)
+    assert plans, f"no {verb} on {table} captured"
+    for plan in plans:
+        assert f"SCAN {table}" not in plan, plan
+    assert any(index in plan for plan in plans), plans
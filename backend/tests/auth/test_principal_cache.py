@@ -0,0 +1,32 @@
+"""Tests for the authenticated-user cache and its invalidation."""
+from __future__ import annotations
+
+import pytest
+
+from backend.app.core.events import event_hub
+from backend.app.core.principal import Principal, principal_cache
+from backend.app.models.user import UserRole
+
+
+def _principal(username: str, is_active: bool = True) -> Principal:
+    return Principal(id=1, username=username, display_name="Cached", role=UserRole.ARTIST, is_active=is_active)
+
+
+@pytest.mark.asyncio
+async def test_put_after_invalidation_is_dropped():
+    """A principal read before an invalidation isn't cached after it."""
+    generation = await principal_cache.generation("race")
+    principal_cache.invalidate("race")
+    await principal_cache.put(_principal("race"), generation)
+    assert await principal_cache.get("race") is None
+
+    await principal_cache.put(_principal("race"), await principal_cache.generation("race"))
+    assert await principal_cache.get("race") == _principal("race")
+
+
+@pytest.mark.asyncio
+async def test_remote_user_change_drops_local_entry():
+    """A user.changed event from another process clears this process's copy."""
+    await principal_cache.put(_principal("remote"), await principal_cache.generation("remote"))
+    event_hub.deliver({"type": "user.changed", "username": "remote", "previous_username": None})
+    assert await principal_cache.get("remote") is None
@@ -0,0 +1,42 @@
+"""Tests for jti-based token revocation."""
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from backend.app.core.revocation import BloomFilter
+from backend.app.core.security import create_access_token, decode_token
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """Every added id is reported present; unrelated ids rarely are."""
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [f"jti-{i}" for i in range(1000)]
+    for jti in added:
+        bloom.add(jti)
+
+    assert all(jti in bloom for jti in added)
+    false_hits = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_hits < 300
+
+
+def test_access_tokens_carry_unique_jti():
+    first = decode_token(create_access_token(subject="someone"))
+    second = decode_token(create_access_token(subject="someone"))
+    assert first["jti"] and first["jti"] != second["jti"]
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_only_that_token(client: AsyncClient, sample_user, auth_headers, db_session):
+    """After logout the token is rejected; the user's other sessions keep working."""
+    user = await sample_user("artist", username="revoker")
+    await db_session.commit()
+    session_a, session_b = auth_headers(user), auth_headers(user)
+
+    assert (await client.post("/api/v1/auth/logout", headers=session_a)).status_code == 200
+
+    resp = await client.get("/api/v1/notifications/unread/count", headers=session_a)
+    assert resp.status_code == 401
+    assert resp.json()["detail"] == "Token has been revoked"
+    resp = await client.get("/api/v1/notifications/unread/count", headers=session_b)
+    assert resp.status_code == 200
@@ -7,15 +7,18 @@ the real PostgreSQL instance.
 from __future__ import annotations
 
 import asyncio
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timezone
-from typing import AsyncGenerator, Callable
+from typing import AsyncGenerator, Callable, List, Tuple
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from backend.app.core.database import Base, get_db
+from backend.app.core.database import Base, get_db, get_read_db, get_read_sessions, get_stream_session
+from backend.app.core.principal import principal_cache
 from backend.app.core.security import create_access_token
 from backend.app.main import app
 from backend.app.models.approval import Approval, ApprovalStatus
@@ -47,6 +50,7 @@ async def setup_database():
     yield
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    principal_cache.clear()
 
 
 @pytest_asyncio.fixture
@@ -62,6 +66,15 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
+
+    @asynccontextmanager
+    async def _stream_session():
+        yield db_session
+
+    app.dependency_overrides[get_stream_session] = lambda: _stream_session
+    # Concurrent reads need sessions of their own, so they only see committed rows.
+    app.dependency_overrides[get_read_sessions] = lambda: TestSessionLocal
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
@@ -144,3 +157,26 @@ async def sample_transfer(db_session: AsyncSession) -> Callable:
         return transfer
 
     return _create
+
+
+@pytest.fixture
+def captured_sql(db_session: AsyncSession) -> Callable:
+    """Factory: ``with captured_sql("SELECT") as statements`` collects
+    (statement, parameters) for every statement of that verb executed."""
+
+    @contextmanager
+    def _capture_sql(verb: str):
+        statements: List[Tuple[str, object]] = []
+        engine = db_session.bind.sync_engine
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith(verb):
+                statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+
+    return _capture_sql
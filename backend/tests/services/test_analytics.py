@@ -0,0 +1,122 @@
+"""Tests for the transfer history rollups and analytics endpoints."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.models.analytics import StageDurationRollup, TransferDailyRollup
+from backend.app.models.history import TransferHistory
+from backend.app.models.transfer import TransferStatus
+from backend.app.services.analytics_service import rollup_history
+from backend.tests.conftest import TEST_DB_URL
+
+SyncSession = sessionmaker(bind=create_engine(TEST_DB_URL.replace("+aiosqlite", "")))
+
+
+def _rollup() -> int:
+    with SyncSession() as db:
+        return rollup_history(db)
+
+
+@pytest.mark.asyncio
+async def test_history_is_stamped_with_transfer_status(sample_user, sample_transfer, db_session):
+    """History written alongside a status change records the new status."""
+    artist = await sample_user("artist", username="stamp_artist")
+    transfer = await sample_transfer(artist, reference="TRF-STAMP1")
+    transfer.status = TransferStatus.PENDING_SUPERVISOR
+    db_session.add(TransferHistory(transfer_id=transfer.id, action="approved"))
+    await db_session.flush()
+
+    stamped = (await db_session.execute(select(TransferHistory.status))).scalar_one()
+    assert stamped == TransferStatus.PENDING_SUPERVISOR
+
+
+@pytest.mark.asyncio
+async def test_rollups_feed_analytics(client: AsyncClient, sample_user, sample_transfer, auth_headers, db_session):
+    """Stage durations carry across rollup batches; throughput counts delivered bytes."""
+    admin = await sample_user("admin", username="an_admin")
+    artist = await sample_user("artist", username="an_artist")
+    start = datetime(2026, 3, 2, 9, 0, tzinfo=timezone.utc)
+    steps = [
+        (0, TransferStatus.PENDING_TEAM_LEAD),
+        (2, TransferStatus.PENDING_SUPERVISOR),
+        (6, TransferStatus.APPROVED),
+    ]
+    for n in range(2):
+        transfer = await sample_transfer(artist, reference=f"TRF-AN{n:03d}")
+        transfer.total_size_bytes = 1000
+        for hours, st in steps:
+            db_session.add(TransferHistory(
+                transfer_id=transfer.id, action=st.value, status=st,
+                created_at=start + timedelta(hours=hours * (n + 1)),
+            ))
+    await db_session.commit()
+    assert _rollup() == 6
+
+    transfer.status = TransferStatus.TRANSFERRED
+    db_session.add(TransferHistory(
+        transfer_id=transfer.id, action="transferred", created_at=start + timedelta(days=2),
+    ))
+    await db_session.commit()
+    assert _rollup() == 1
+    assert _rollup() == 0
+
+    headers = auth_headers(admin)
+    resp = await client.get("/api/v1/analytics/stage-durations", params={
+        "since": "2026-03-01", "until": "2026-03-08", "period": "week", "stage": "pending_supervisor",
+    }, headers=headers)
+    assert resp.status_code == 200
+    [point] = resp.json()["items"]
+    assert point["period_start"] == "2026-03-02"
+    assert point["count"] == 2
+    assert point["avg_hours"] == 6.0
+    assert 3.6 <= point["p50_hours"] <= 4.4
+    assert 7.2 <= point["p95_hours"] <= 8.8
+
+    resp = await client.get("/api/v1/analytics/throughput", params={
+        "since": "2026-03-01", "until": "2026-03-08",
+    }, headers=headers)
+    days = {p["period_start"]: p for p in resp.json()["items"]}
+    assert days["2026-03-02"]["entered"]["pending_team_lead"] == 2
+    assert days["2026-03-04"]["transferred"] == 1
+    assert days["2026-03-04"]["bytes_delivered"] == 1000
+
+    resp = await client.get("/api/v1/analytics/throughput", headers=auth_headers(artist))
+    assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_stage_duration_measured_from_status_start(sample_user, sample_transfer, db_session):
+    """A stamped row that doesn't change status, rolled up in an earlier batch,
+    doesn't shorten the time measured for that status."""
+    artist = await sample_user("artist", username="an_split")
+    transfer = await sample_transfer(artist, reference="TRF-ANSPLIT")
+    start = datetime(2026, 3, 9, 9, 0, tzinfo=timezone.utc)
+    for hours, action in [(0, "uploaded"), (3, "comment_added")]:
+        db_session.add(TransferHistory(
+            transfer_id=transfer.id, action=action, status=TransferStatus.PENDING_TEAM_LEAD,
+            created_at=start + timedelta(hours=hours),
+        ))
+    await db_session.commit()
+    assert _rollup() == 2
+
+    db_session.add(TransferHistory(
+        transfer_id=transfer.id, action="approved", status=TransferStatus.PENDING_SUPERVISOR,
+        created_at=start + timedelta(hours=5),
+    ))
+    await db_session.commit()
+    assert _rollup() == 1
+
+    rows = (await db_session.execute(
+        select(StageDurationRollup.count, StageDurationRollup.total_seconds)
+        .where(StageDurationRollup.status == TransferStatus.PENDING_TEAM_LEAD)
+    )).all()
+    assert rows == [(1, 5 * 3600.0)]
+    entered = (await db_session.execute(
+        select(TransferDailyRollup.entered).where(TransferDailyRollup.status == TransferStatus.PENDING_TEAM_LEAD)
+    )).scalar_one()
+    assert entered == 1
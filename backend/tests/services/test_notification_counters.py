@@ -0,0 +1,135 @@
+"""Tests for the Redis notification counters and their reconciliation."""
+from __future__ import annotations
+
+import fakeredis
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.models.notification import Notification, NotificationType
+from backend.app.models.user import UserRole
+from backend.app.services import notification_counters as counters_module
+from backend.app.services.notification_counters import notification_counters
+from backend.app.tasks import maintenance
+from backend.tests.conftest import TEST_DB_URL
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Sync and async fake clients over one shared keyspace."""
+    server = fakeredis.FakeServer()
+    sync = fakeredis.FakeRedis(server=server, decode_responses=True)
+    async_ = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(counters_module, "get_redis", lambda: sync)
+    monkeypatch.setattr(counters_module, "get_async_redis", lambda: async_)
+    # Apply on the sync pipeline so updates land before the next read.
+    monkeypatch.setattr(counters_module, "async_redis_active", lambda: False)
+    monkeypatch.setattr(maintenance, "get_redis", lambda: sync)
+    return sync
+
+
+def _created(user_id=None, notification_id=1, is_read=False, target_role=None) -> dict:
+    return {
+        "type": "notification.created",
+        "user_id": user_id,
+        "target_role": target_role,
+        "notification": {"id": notification_id, "is_read": is_read},
+    }
+
+
+def _read(user_id, **fields) -> dict:
+    return {"type": "notification.read", "user_id": user_id, **fields}
+
+
+@pytest.mark.asyncio
+async def test_personal_events_move_total_and_unread(fake_redis):
+    await notification_counters.prime_user(1, total=2, unread=1, cursor=0)
+    await notification_counters.prime_role("artist", [])
+
+    notification_counters.apply([_created(user_id=1, notification_id=3)])
+    assert await notification_counters.get(1, "artist") == (3, 2)
+
+    notification_counters.apply([_read(1, ids=[3])])
+    assert await notification_counters.get(1, "artist") == (3, 1)
+
+    notification_counters.apply([_created(user_id=1, notification_id=4, is_read=True)])
+    assert await notification_counters.get(1, "artist") == (4, 1)
+
+    notification_counters.apply([_read(1, all=True)])
+    assert await notification_counters.get(1, "artist") == (4, 0)
+
+    # Over-counted reads never drive unread below zero.
+    notification_counters.apply([_read(1, ids=[1, 2])])
+    assert await notification_counters.get(1, "artist") == (4, 0)
+
+    # A user whose counters aren't loaded is left for the next read to prime.
+    notification_counters.apply([_created(user_id=2, notification_id=5)])
+    assert not fake_redis.exists("notif:user:2")
+
+
+@pytest.mark.asyncio
+async def test_broadcasts_count_unread_past_the_cursor(fake_redis):
+    await notification_counters.prime_user(1, total=1, unread=1, cursor=0)
+    await notification_counters.prime_role("artist", [5])
+    assert await notification_counters.get(1, "artist") == (2, 2)
+
+    notification_counters.apply([_created(target_role="artist", notification_id=7)])
+    assert await notification_counters.get(1, "artist") == (3, 3)
+
+    notification_counters.apply([_read(1, up_to=5)])
+    assert await notification_counters.get(1, "artist") == (3, 2)
+
+    notification_counters.apply([_read(1, up_to=7)])
+    assert await notification_counters.get(1, "artist") == (3, 1)
+
+    # The cursor only moves forward.
+    notification_counters.apply([_read(1, up_to=5)])
+    assert await notification_counters.get(1, "artist") == (3, 1)
+
+    # Without the role's broadcast set loaded there is nothing to report.
+    assert await notification_counters.get(1, "supervisor") is None
+
+
+async def _seed(db_session, sample_user):
+    user = await sample_user("artist", username="counter_artist")
+    db_session.add_all([
+        Notification(user_id=user.id, type=NotificationType.SYSTEM, title="one"),
+        Notification(user_id=user.id, type=NotificationType.SYSTEM, title="two", is_read=True),
+        Notification(target_role=UserRole.ARTIST, type=NotificationType.SYSTEM, title="all"),
+    ])
+    await db_session.commit()
+    return user
+
+
+@pytest.fixture
+def sync_db(monkeypatch):
+    monkeypatch.setattr(
+        maintenance, "SyncSession",
+        sessionmaker(bind=create_engine(TEST_DB_URL.replace("+aiosqlite", ""))),
+    )
+
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_corrupted_counters(fake_redis, sync_db, sample_user, db_session):
+    user = await _seed(db_session, sample_user)
+    await notification_counters.prime_user(user.id, total=9, unread=9, cursor=0)
+    # Right size, wrong member: only a membership check notices.
+    await notification_counters.prime_role("artist", [999])
+
+    assert maintenance.reconcile_notification_counters() == {"checked": 1, "repaired": 2}
+    assert await notification_counters.get(user.id, "artist") == (3, 2)
+    assert maintenance.reconcile_notification_counters() == {"checked": 1, "repaired": 0}
+
+
+def test_repair_backs_off_when_counters_move(fake_redis):
+    """A notification landing mid-reconcile isn't overwritten by the older count."""
+    fake_redis.hset("notif:user:1", mapping={"total": 9, "unread": 9, "cursor": 0})
+    snapshot = fake_redis.hmget("notif:user:1", "total", "unread", "cursor")
+    notification_counters.apply([_created(user_id=1, notification_id=42)])
+
+    assert not notification_counters.repair_user_sync(1, snapshot, 2, 1, 0)
+    assert fake_redis.hget("notif:user:1", "total") == "10"
+
+    snapshot = fake_redis.hmget("notif:user:1", "total", "unread", "cursor")
+    assert notification_counters.repair_user_sync(1, snapshot, 2, 1, 0)
+    assert fake_redis.hmget("notif:user:1", "total", "unread") == ["2", "1"]
@@ -0,0 +1,61 @@
+"""Tests for the INSERT ... SELECT notification dispatcher."""
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+
+from backend.app.models.approval import Approval, ApprovalStatus
+from backend.app.models.notification import Notification, NotificationType
+from backend.app.models.user import UserRole
+from backend.app.services.notification_dispatcher import (
+    approver_recipients,
+    notification_dispatcher,
+    role_recipients,
+)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_skips_inactive_and_excluded(sample_user, db_session):
+    """One statement creates a row per active recipient and returns their emails."""
+    a = await sample_user("data_team", username="fan_a")
+    b = await sample_user("data_team", username="fan_b")
+    off = await sample_user("data_team", username="fan_off")
+    await sample_user("artist", username="fan_artist")
+    off.is_active = False
+    await db_session.flush()
+
+    dispatched = await notification_dispatcher.fan_out(
+        db_session,
+        role_recipients(UserRole.DATA_TEAM),
+        exclude_user_ids=[b.id],
+        ntype=NotificationType.SYSTEM,
+        title="Heads up",
+    )
+    assert [(d.user_id, d.email) for d in dispatched] == [(a.id, "fan_a@test.local")]
+
+    rows = (await db_session.execute(select(Notification))).scalars().all()
+    assert [(n.user_id, n.title, n.is_read) for n in rows] == [(a.id, "Heads up", False)]
+
+
+@pytest.mark.asyncio
+async def test_approver_recipients_are_deduplicated(sample_user, sample_transfer, db_session):
+    """An approver who signed off on several stages gets a single notification."""
+    artist = await sample_user("artist", username="fan_owner")
+    admin = await sample_user("admin", username="fan_admin")
+    transfer = await sample_transfer(artist, reference="TRF-FAN01")
+    approvals = (await db_session.execute(
+        select(Approval).where(Approval.transfer_id == transfer.id)
+    )).scalars().all()
+    for approval in approvals[:2]:
+        approval.status = ApprovalStatus.APPROVED
+        approval.approver_id = admin.id
+    await db_session.flush()
+
+    dispatched = await notification_dispatcher.fan_out(
+        db_session,
+        approver_recipients(transfer.id),
+        transfer_id=transfer.id,
+        ntype=NotificationType.REJECTED,
+        title="Rejected",
+    )
+    assert [d.user_id for d in dispatched] == [admin.id]
@@ -0,0 +1,40 @@
+"""Tests for the grouped dashboard stats."""
+from __future__ import annotations
+
+import pytest
+
+from backend.app.core.principal import Principal
+from backend.app.services.transfer_service import transfer_service
+
+
+@pytest.mark.asyncio
+async def test_stats_match_each_roles_visible_transfers(sample_user, sample_transfer, db_session):
+    """Stats composed from the cached scopes cover exactly what each role can list."""
+    lead = await sample_user("team_lead", username="stats_lead")
+    artist = await sample_user("artist", username="stats_artist")
+    statuses = [
+        "uploaded", "pending_team_lead", "pending_supervisor", "approved",
+        "scanning", "scan_failed", "ready_for_transfer", "transferred", "rejected",
+    ]
+    for i, status in enumerate(statuses):
+        await sample_transfer(artist, status=status, reference=f"TRF-ST{i:03d}")
+    await sample_transfer(lead, status="approved", reference="TRF-STL01")
+    await db_session.flush()
+
+    users = [lead, artist]
+    for role in ("admin", "supervisor", "line_producer", "data_team", "it_team"):
+        users.append(await sample_user(role, username=f"stats_{role}"))
+
+    for user in users:
+        principal = Principal.from_user(user)
+        stats = await transfer_service.get_stats(db_session, principal)
+        _, total, _, _ = await transfer_service.list_transfers(db_session, principal, per_page=100)
+        assert stats.total == total, user.role
+        pending, _, _, _ = await transfer_service.list_transfers(
+            db_session, principal, transfer_status="pending_team_lead", per_page=100,
+        )
+        approved, _, _, _ = await transfer_service.list_transfers(
+            db_session, principal, transfer_status="approved", per_page=100,
+        )
+        assert stats.approved == len(approved), user.role
+        assert stats.pending >= len(pending), user.role
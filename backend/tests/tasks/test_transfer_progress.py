@@ -0,0 +1,28 @@
+"""Tests for worker-side transfer progress tracking."""
+from __future__ import annotations
+
+from backend.app.services.progress_service import ProgressTracker
+from backend.app.tasks.transfer import _parse_rsync_progress
+
+
+def test_parse_rsync_progress2_line():
+    """Bytes and file counts are read from an rsync --info=progress2 line."""
+    line = "  1,234,567  45%   10.50MB/s    0:00:12 (xfr#3, to-chk=10/20)"
+    assert _parse_rsync_progress(line) == (1234567, 10, 20)
+    assert _parse_rsync_progress("    32,768 100%   31.25MB/s    0:00:00") == (32768, None, None)
+    assert _parse_rsync_progress("sending incremental file list") is None
+
+
+def test_tracker_throttles_and_reports_eta():
+    """Updates inside the interval are not flushed; snapshot derives percent and ETA."""
+    tracker = ProgressTracker(1, "transfer", total_bytes=1000, total_files=4, interval=60)
+    assert tracker.update(advance_bytes=100, advance_files=1) is True
+    assert tracker.update(advance_bytes=100, advance_files=1) is False
+
+    tracker._rate = 100.0
+    snap = tracker.snapshot()
+    assert snap["bytes_done"] == 200
+    assert snap["files_done"] == 2
+    assert snap["percent"] == 20.0
+    assert snap["eta_seconds"] == 8.0
+    assert tracker.snapshot("completed")["eta_seconds"] == 0.0
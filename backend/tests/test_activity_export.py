@@ -0,0 +1,71 @@
+"""Tests for the streamed activity export."""
+from __future__ import annotations
+
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from backend.app.models.history import TransferHistory
+
+
+@pytest.mark.asyncio
+async def test_export_activity_ndjson_and_csv(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    artist = await sample_user("artist")
+    transfer = await sample_transfer(artist)
+    for i in range(3):
+        db_session.add(TransferHistory(
+            transfer_id=transfer.id, user_id=artist.id, action="exported",
+            description=f"step {i}", metadata_json={"step": i},
+        ))
+    await db_session.flush()
+    headers = auth_headers(await sample_user("supervisor"))
+    params = {"transfer_id": transfer.id, "action": "exported"}
+
+    # The trail spans every transfer, so artists can't export it.
+    resp = await client.get("/api/v1/activity/export", params=params, headers=auth_headers(artist))
+    assert resp.status_code == 403
+
+    resp = await client.get("/api/v1/activity/export", params=params, headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [line["description"] for line in lines] == ["step 0", "step 1", "step 2"]
+    assert lines[2]["metadata_json"] == {"step": 2}
+
+    resp = await client.get("/api/v1/activity/export", params={**params, "format": "csv"}, headers=headers)
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [row["description"] for row in rows] == ["step 0", "step 1", "step 2"]
+    assert json.loads(rows[0]["metadata_json"]) == {"step": 0}
+
+
+@pytest.mark.asyncio
+async def test_export_csv_neutralises_formulas(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    artist = await sample_user("artist")
+    transfer = await sample_transfer(artist)
+    texts = ['=HYPERLINK("http://evil.example","x")', "+1", "-2+3", "@SUM(A1)", "\tTab", "plain - text"]
+    for text in texts:
+        db_session.add(TransferHistory(transfer_id=transfer.id, action="commented", description=text))
+    await db_session.flush()
+
+    resp = await client.get(
+        "/api/v1/activity/export",
+        params={"format": "csv", "action": "commented"},
+        headers=auth_headers(await sample_user("admin")),
+    )
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [row["description"] for row in rows] == ["'" + t for t in texts[:-1]] + ["plain - text"]
+
+
+@pytest.mark.asyncio
+async def test_export_activity_csv_without_rows_has_header(client: AsyncClient, sample_user, auth_headers):
+    user = await sample_user("admin")
+    resp = await client.get(
+        "/api/v1/activity/export", params={"format": "csv", "action": "nothing"}, headers=auth_headers(user),
+    )
+    assert resp.status_code == 200
+    assert resp.text.splitlines() == [
+        "id,transfer_id,user_id,action,status,description,metadata_json,ip_address,user_agent,created_at"
+    ]
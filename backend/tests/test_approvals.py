@@ -112,3 +112,244 @@ async def test_full_chain(client: AsyncClient, sample_user, auth_headers, sample
     )
     assert resp.status_code == 200
     assert resp.json()["status"] == "approved"
+
+
+@pytest.mark.asyncio
+async def test_stale_approval_conflicts(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session, monkeypatch):
+    """A second approval of an already-approved stage is a 409 and changes nothing."""
+    from backend.app.core import events
+
+    published = []
+    monkeypatch.setattr(events, "publish_events", published.extend)
+
+    artist = await sample_user("artist", username="art_race")
+    tl = await sample_user("team_lead", username="tl_race")
+    tl2 = await sample_user("team_lead", username="tl_race2")
+    transfer = await sample_transfer(artist, reference="TRF-RACE")
+    await db_session.commit()
+
+    first = await client.post(
+        f"/api/v1/approvals/{transfer.id}/approve", json={"comment": None}, headers=auth_headers(tl),
+    )
+    second = await client.post(
+        f"/api/v1/approvals/{transfer.id}/approve", json={"comment": None}, headers=auth_headers(tl2),
+    )
+    assert first.status_code == 200
+    assert second.status_code == 409
+    assert "expected 'pending_team_lead'" in second.json()["detail"]
+
+    chain = first.json()["approval_chain"]
+    assert chain[0]["status"] == "approved"
+    assert chain[0]["approver_name"] == tl.display_name
+
+    history = await client.get(f"/api/v1/activity/?transfer_id={transfer.id}", headers=auth_headers(tl))
+    actions = [item["action"] for item in history.json()["items"]]
+    assert actions.count("approved") == 1
+
+    status_events = [p for p in published if p["type"] == "transfer.status" and p["previous_status"]]
+    assert [(p["previous_status"], p["status"]) for p in status_events] == [
+        ("pending_team_lead", "pending_supervisor"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_admin_approves_current_stage(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    """Admins act at whichever stage the transfer is in."""
+    artist = await sample_user("artist", username="art_adm")
+    admin = await sample_user("admin", username="adm_ap")
+    transfer = await sample_transfer(artist, reference="TRF-ADM1", status="pending_supervisor")
+    await db_session.commit()
+
+    resp = await client.post(
+        f"/api/v1/approvals/{transfer.id}/approve", json={"comment": None}, headers=auth_headers(admin),
+    )
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "pending_line_producer"
+
+    resp = await client.post(
+        "/api/v1/approvals/999999/approve", json={"comment": None}, headers=auth_headers(admin),
+    )
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_bulk_approve(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    """One call advances every transfer at the caller's stage and skips the rest."""
+    from sqlalchemy import select
+
+    from backend.app.models.history import TransferHistory
+    from backend.app.models.notification import Notification
+    from backend.app.models.transfer import TransferStatus
+
+    artist = await sample_user("artist", username="art_bulk")
+    tl = await sample_user("team_lead", username="tl_bulk")
+    ready = [await sample_transfer(artist, reference=f"TRF-BLK{i}") for i in range(3)]
+    later = await sample_transfer(artist, reference="TRF-BLK9", status="pending_supervisor")
+    await db_session.commit()
+
+    ids = [t.id for t in ready]
+    resp = await client.post(
+        "/api/v1/approvals/bulk/approve",
+        json={"transfer_ids": ids + [later.id, ids[0], 999999], "comment": "Dailies"},
+        headers=auth_headers(tl),
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["updated"] == ids
+    assert data["skipped"] == [
+        {"transfer_id": later.id, "detail": "Transfer status is 'pending_supervisor'"},
+        {"transfer_id": 999999, "detail": "Transfer not found"},
+    ]
+
+    chain = await client.get(f"/api/v1/approvals/{ids[1]}/chain", headers=auth_headers(tl))
+    assert chain.json()[0]["status"] == "approved"
+    assert chain.json()[0]["comment"] == "Dailies"
+
+    history = (await db_session.execute(
+        select(TransferHistory.transfer_id, TransferHistory.status)
+        .where(TransferHistory.action == "approved")
+    )).all()
+    assert sorted(history) == [(tid, TransferStatus.PENDING_SUPERVISOR) for tid in ids]
+
+    broadcasts = (await db_session.execute(
+        select(Notification).where(Notification.title == "Approval needed: 3 transfers")
+    )).scalars().all()
+    assert len(broadcasts) == 1
+    assert broadcasts[0].target_role.value == "supervisor"
+
+
+@pytest.mark.asyncio
+async def test_bulk_reject_notifies_each_artist_once(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    from sqlalchemy import select
+
+    from backend.app.models.notification import Notification
+
+    artist = await sample_user("artist", username="art_bulkrj")
+    admin = await sample_user("admin", username="adm_bulkrj")
+    first = await sample_transfer(artist, reference="TRF-BRJ1")
+    second = await sample_transfer(artist, reference="TRF-BRJ2", status="pending_line_producer")
+    await db_session.commit()
+
+    resp = await client.post(
+        "/api/v1/approvals/bulk/reject",
+        json={"transfer_ids": [first.id, second.id], "reason": "Wrong colour space on all plates"},
+        headers=auth_headers(admin),
+    )
+    assert resp.status_code == 200
+    assert sorted(resp.json()["updated"]) == sorted([first.id, second.id])
+
+    notes = (await db_session.execute(
+        select(Notification).where(Notification.user_id == artist.id)
+    )).scalars().all()
+    assert [n.title for n in notes] == ["2 transfers rejected"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_reject_tells_approvers_only_their_transfers(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    from sqlalchemy import select, update
+
+    from backend.app.models.approval import Approval, ApprovalStatus
+    from backend.app.models.notification import Notification
+    from backend.app.models.user import UserRole
+
+    artist = await sample_user("artist", username="art_rjapp")
+    admin = await sample_user("admin", username="adm_rjapp")
+    lead_a = await sample_user("team_lead", username="tl_rjapp_a")
+    lead_b = await sample_user("team_lead", username="tl_rjapp_b")
+    a = await sample_transfer(artist, reference="TRF-RJA", status="pending_supervisor")
+    b = await sample_transfer(artist, reference="TRF-RJB", status="pending_supervisor")
+    # lead_a's own transfer, which they also approved at their stage.
+    own = await sample_transfer(lead_a, reference="TRF-RJOWN", status="pending_supervisor")
+    for transfer, lead in ((a, lead_a), (b, lead_b), (own, lead_a)):
+        await db_session.execute(
+            update(Approval)
+            .where(Approval.transfer_id == transfer.id, Approval.required_role == UserRole.TEAM_LEAD)
+            .values(status=ApprovalStatus.APPROVED, approver_id=lead.id)
+        )
+    await db_session.commit()
+
+    resp = await client.post(
+        "/api/v1/approvals/bulk/reject",
+        json={"transfer_ids": [a.id, b.id, own.id], "reason": "Wrong plates"},
+        headers=auth_headers(admin),
+    )
+    assert sorted(resp.json()["updated"]) == sorted([a.id, b.id, own.id])
+
+    for lead, transfer, others in ((lead_a, a, (b, own)), (lead_b, b, (a, own))):
+        [note] = (await db_session.execute(
+            select(Notification).where(
+                Notification.user_id == lead.id, Notification.message.contains("previously approved"),
+            )
+        )).scalars().all()
+        assert note.title == f"Transfer rejected: {transfer.reference}"
+        assert note.transfer_id == transfer.id
+        assert all(other.reference not in note.message for other in others)
+
+    # Their own transfer reaches lead_a as its artist, not as an approver.
+    [artist_note] = (await db_session.execute(
+        select(Notification).where(Notification.user_id == lead_a.id, Notification.message.startswith("Your transfer"))
+    )).scalars().all()
+    assert artist_note.transfer_id == own.id
+
+
+@pytest.mark.asyncio
+async def test_bulk_approve_skips_transfers_without_pending_approval(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    from sqlalchemy import delete, select
+
+    from backend.app.models.approval import Approval
+    from backend.app.models.transfer import Transfer, TransferStatus
+    from backend.app.models.user import UserRole
+
+    artist = await sample_user("artist", username="art_noappr")
+    tl = await sample_user("team_lead", username="tl_noappr")
+    ok = await sample_transfer(artist, reference="TRF-NOA1")
+    orphan = await sample_transfer(artist, reference="TRF-NOA2")
+    await db_session.execute(
+        delete(Approval).where(Approval.transfer_id == orphan.id, Approval.required_role == UserRole.TEAM_LEAD)
+    )
+    await db_session.commit()
+
+    resp = await client.post(
+        "/api/v1/approvals/bulk/approve", json={"transfer_ids": [ok.id, orphan.id]}, headers=auth_headers(tl),
+    )
+    assert resp.json()["updated"] == [ok.id]
+    assert resp.json()["skipped"] == [
+        {"transfer_id": orphan.id, "detail": "No pending approval record found for this stage"},
+    ]
+    status = (await db_session.execute(select(Transfer.status).where(Transfer.id == orphan.id))).scalar_one()
+    assert status == TransferStatus.PENDING_TEAM_LEAD
+
+
+@pytest.mark.asyncio
+async def test_bulk_approve_wrong_role(client: AsyncClient, sample_user, auth_headers):
+    artist = await sample_user("artist", username="art_bulk403")
+    resp = await client.post(
+        "/api/v1/approvals/bulk/approve", json={"transfer_ids": [1]}, headers=auth_headers(artist),
+    )
+    assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_pending_count_matches_queue(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session, monkeypatch):
+    """The count agrees with the listed queue, from SQL and from the cached stats."""
+    from backend.app.services import approval_service as module
+
+    artist = await sample_user("artist", username="art_cnt")
+    for i, st in enumerate(["pending_team_lead", "pending_team_lead", "pending_supervisor", "approved", "scan_passed"]):
+        await sample_transfer(artist, reference=f"TRF-CNT{i}", status=st)
+    await db_session.commit()
+
+    expected = {"admin": 3, "team_lead": 2, "supervisor": 1, "data_team": 2, "it_team": 0, "artist": 0}
+    for role, count in expected.items():
+        user = await sample_user(role, username=f"cnt_{role}")
+        listed = await client.get("/api/v1/approvals/pending", headers=auth_headers(user))
+        resp = await client.get("/api/v1/approvals/pending/count", headers=auth_headers(user))
+        assert resp.json()["count"] == len(listed.json()) == count, role
+
+    async def _cached(scopes):
+        return {"all": {"pending_team_lead": (7, 0.0, 0), "pending_supervisor": (4, 0.0, 0)}}
+
+    monkeypatch.setattr(module.transfer_stats, "get", _cached)
+    admin = await sample_user("admin", username="cnt_admin_cached")
+    resp = await client.get("/api/v1/approvals/pending/count", headers=auth_headers(admin))
+    assert resp.json()["count"] == 11
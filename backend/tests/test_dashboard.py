@@ -0,0 +1,37 @@
+"""Tests for the composite dashboard endpoint."""
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from backend.app.models.notification import Notification, NotificationType
+
+
+@pytest.mark.asyncio
+async def test_dashboard_matches_the_separate_endpoints(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    artist = await sample_user("artist")
+    lead = await sample_user("team_lead")
+    await sample_transfer(artist, reference="TRF-D0001")
+    await sample_transfer(artist, reference="TRF-D0002", status="approved")
+    db_session.add(Notification(
+        user_id=lead.id, type=NotificationType.APPROVAL_REQUIRED, title="Review TRF-D0001",
+    ))
+    # Each part is read on its own connection, so the rows must be committed.
+    await db_session.commit()
+    headers = auth_headers(lead)
+
+    resp = await client.get("/api/v1/dashboard/", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["cache-control"] == "private, max-age=5"
+    data = resp.json()
+
+    stats = (await client.get("/api/v1/transfers/stats", headers=headers)).json()
+    pending = (await client.get("/api/v1/approvals/pending/count", headers=headers)).json()
+    unread = (await client.get("/api/v1/notifications/unread/count", headers=headers)).json()
+    recent = (await client.get("/api/v1/transfers/", params={"per_page": 15}, headers=headers)).json()
+
+    assert data["stats"] == stats
+    assert data["pending_approvals"] == pending["count"] == 1
+    assert data["unread_notifications"] == unread["count"] == 1
+    assert data["recent_transfers"] == recent["items"]
+    assert [t["reference"] for t in data["recent_transfers"]] == ["TRF-D0001"]
@@ -0,0 +1,79 @@
+"""Tests for the read-only session dependency and its replica fallback."""
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.app.core import database
+from backend.app.models.user import User
+from backend.tests.conftest import TEST_DB_URL
+
+
+@pytest.fixture
+def primary_reads(monkeypatch):
+    engine = create_async_engine(TEST_DB_URL, isolation_level="AUTOCOMMIT")
+    monkeypatch.setattr(
+        database, "primary_read_session_factory",
+        async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    return engine
+
+
+async def _read_session():
+    gen = database.get_read_db()
+    return gen, await gen.__anext__()
+
+
+def test_primary_read_sessions_are_autocommit():
+    bind = database.primary_read_session_factory.kw["bind"]
+    assert bind.get_execution_options()["isolation_level"] == "AUTOCOMMIT"
+    assert bind.sync_engine.pool is database.engine.sync_engine.pool
+
+
+@pytest.mark.asyncio
+async def test_read_session_sees_committed_rows(monkeypatch, primary_reads, sample_user, db_session):
+    await sample_user("artist", username="reader")
+    await db_session.commit()
+    monkeypatch.setattr(database, "replica_session_factory", None)
+
+    gen, session = await _read_session()
+    try:
+        names = (await session.execute(select(User.username))).scalars().all()
+        assert "reader" in names
+    finally:
+        await gen.aclose()
+        await primary_reads.dispose()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_falls_back_to_primary(monkeypatch, primary_reads):
+    replica = create_async_engine("sqlite+aiosqlite:////nonexistent/replica.db")
+    attempts = []
+
+    def _replica_session():
+        attempts.append(1)
+        return AsyncSession(replica, expire_on_commit=False)
+
+    monkeypatch.setattr(database, "replica_session_factory", _replica_session)
+    monkeypatch.setattr(database, "_replica_retry_after", 0.0)
+
+    gen, session = await _read_session()
+    try:
+        assert session.bind is primary_reads
+        assert (await session.execute(select(1))).scalar() == 1
+    finally:
+        await gen.aclose()
+
+    # The failed replica isn't retried on every request.
+    gen, session = await _read_session()
+    await gen.aclose()
+    assert len(attempts) == 1
+    await replica.dispose()
+    await primary_reads.dispose()
+
+
+def test_stream_sessions_hold_a_snapshot():
+    # Server-side cursors need a transaction; autocommit sessions can't stream.
+    bind = database.primary_stream_session_factory.kw["bind"]
+    assert bind.get_execution_options()["isolation_level"] == "REPEATABLE READ"
@@ -0,0 +1,131 @@
+"""Tests for commit-time event publishing and per-user fan-out."""
+from __future__ import annotations
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from httpx import AsyncClient
+
+from backend.app.core import events
+from backend.app.core.dependencies import get_stream_user
+from backend.app.core.events import event_hub
+from backend.app.models.notification import Notification, NotificationType
+from backend.app.models.transfer import TransferStatus
+
+
+@pytest_asyncio.fixture
+async def local_hub(monkeypatch):
+    """Route published events straight to the in-process hub."""
+    monkeypatch.setattr(events, "get_redis", lambda: None)
+    yield event_hub
+    await event_hub.close()
+
+
+def _drain(sub) -> list:
+    items = []
+    while not sub.queue.empty():
+        items.append(sub.queue.get_nowait())
+    return items
+
+
+@pytest.mark.asyncio
+async def test_notification_insert_reaches_owner_only(local_hub, sample_user, db_session):
+    """A committed notification is pushed to its recipient and nobody else."""
+    owner = await sample_user("artist", username="evt_owner")
+    other = await sample_user("artist", username="evt_other")
+    await db_session.commit()
+    owner_sub = local_hub.subscribe(owner.id, owner.role)
+    other_sub = local_hub.subscribe(other.id, other.role)
+
+    db_session.add(Notification(
+        user_id=owner.id, type=NotificationType.SYSTEM, title="Hello",
+    ))
+    await db_session.flush()
+    assert _drain(owner_sub) == []
+    await db_session.commit()
+
+    received = _drain(owner_sub)
+    assert [e["type"] for e in received] == ["notification.created"]
+    assert received[0]["notification"]["title"] == "Hello"
+    assert _drain(other_sub) == []
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_changes_are_not_published(local_hub, sample_user, db_session):
+    """Events queued in a transaction that rolls back are discarded."""
+    owner = await sample_user("artist", username="evt_rb")
+    await db_session.commit()
+    sub = local_hub.subscribe(owner.id, owner.role)
+
+    db_session.add(Notification(
+        user_id=owner.id, type=NotificationType.SYSTEM, title="Never",
+    ))
+    await db_session.flush()
+    await db_session.rollback()
+    assert _drain(sub) == []
+
+
+@pytest.mark.asyncio
+async def test_status_transition_respects_visibility(local_hub, sample_user, sample_transfer, db_session):
+    """Status events go to users who could see the transfer before or after."""
+    artist = await sample_user("artist", username="evt_artist")
+    lead = await sample_user("team_lead", username="evt_lead")
+    it = await sample_user("it_team", username="evt_it")
+    transfer = await sample_transfer(artist, reference="TRF-EVT01")
+    await db_session.commit()
+    subs = {u.username: local_hub.subscribe(u.id, u.role) for u in (artist, lead, it)}
+
+    transfer.status = TransferStatus.PENDING_SUPERVISOR
+    await db_session.commit()
+
+    for name in ("evt_artist", "evt_lead"):
+        received = _drain(subs[name])
+        assert len(received) == 1
+        assert received[0]["status"] == "pending_supervisor"
+        assert received[0]["previous_status"] == "pending_team_lead"
+    assert _drain(subs["evt_it"]) == []
+
+
+@pytest.mark.asyncio
+async def test_stream_requires_token(client: AsyncClient):
+    """The SSE endpoint rejects unauthenticated clients."""
+    resp = await client.get("/api/v1/events/stream")
+    assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_stream_accepts_only_tickets_in_query(client: AsyncClient, sample_user, auth_headers, db_session):
+    """Only a stream ticket is taken from the query string, never an access token."""
+    user = await sample_user("artist", username="evt_ticket")
+    headers = auth_headers(user)
+    access_token = headers["Authorization"].split()[1]
+
+    resp = await client.post("/api/v1/events/ticket", headers=headers)
+    assert resp.status_code == 200
+    ticket = resp.json()["ticket"]
+
+    assert (await get_stream_user(None, db_session, ticket=ticket)).id == user.id
+    with pytest.raises(HTTPException) as exc:
+        await get_stream_user(None, db_session, ticket=access_token)
+    assert exc.value.status_code == 401
+    # A ticket can't stand in for an access token elsewhere.
+    resp = await client.get("/api/v1/notifications/unread/count", headers={"Authorization": f"Bearer {ticket}"})
+    assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_broadcast_reaches_role_members(local_hub, sample_user, db_session):
+    """A role broadcast is pushed to every connected user holding that role."""
+    dt = await sample_user("data_team", username="evt_dt")
+    artist = await sample_user("artist", username="evt_bc_artist")
+    await db_session.commit()
+    dt_sub = local_hub.subscribe(dt.id, dt.role)
+    artist_sub = local_hub.subscribe(artist.id, artist.role)
+
+    db_session.add(Notification(
+        target_role=dt.role, type=NotificationType.SYSTEM, title="Team update",
+    ))
+    await db_session.commit()
+
+    assert [e["type"] for e in _drain(dt_sub)] == ["notification.created"]
+    assert _drain(artist_sub) == []
@@ -0,0 +1,74 @@
+"""Tests for personal and role-broadcast notifications."""
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from backend.app.models.notification import Notification, NotificationType
+from backend.app.models.user import UserRole
+
+
+async def _broadcast(db_session, role: UserRole, title: str) -> Notification:
+    notif = Notification(target_role=role, type=NotificationType.SYSTEM, title=title)
+    db_session.add(notif)
+    await db_session.flush()
+    return notif
+
+
+@pytest.mark.asyncio
+async def test_broadcast_is_one_row_read_per_user(client: AsyncClient, sample_user, auth_headers, db_session):
+    """A role broadcast shows up for every user in the role; reading it only affects the reader."""
+    dt1 = await sample_user("data_team", username="dt_one")
+    dt2 = await sample_user("data_team", username="dt_two")
+    artist = await sample_user("artist", username="bc_artist")
+    notif = await _broadcast(db_session, UserRole.DATA_TEAM, "Scan queue backed up")
+    await db_session.commit()
+
+    rows = (await db_session.execute(select(func.count()).select_from(Notification))).scalar()
+    assert rows == 1
+
+    for user in (dt1, dt2):
+        resp = await client.get("/api/v1/notifications/unread/count", headers=auth_headers(user))
+        assert resp.json()["count"] == 1
+    resp = await client.get("/api/v1/notifications/", headers=auth_headers(artist))
+    assert resp.json()["total"] == 0
+
+    resp = await client.put(f"/api/v1/notifications/{notif.id}/read", headers=auth_headers(dt1))
+    assert resp.status_code == 200
+    assert resp.json()["is_read"] is True
+
+    listing = (await client.get("/api/v1/notifications/", headers=auth_headers(dt1))).json()
+    assert listing["unread_count"] == 0
+    assert listing["items"][0]["is_read"] is True
+    assert listing["items"][0]["target_role"] == "data_team"
+    resp = await client.get("/api/v1/notifications/unread/count", headers=auth_headers(dt2))
+    assert resp.json()["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_new_user_starts_with_broadcasts_read(client: AsyncClient, sample_user, auth_headers, db_session):
+    """Users created after a broadcast don't inherit it as unread, but see later ones."""
+    await _broadcast(db_session, UserRole.IT_TEAM, "Old news")
+    newcomer = await sample_user("it_team", username="it_new")
+    await _broadcast(db_session, UserRole.IT_TEAM, "Fresh news")
+    await db_session.commit()
+
+    listing = (await client.get("/api/v1/notifications/", headers=auth_headers(newcomer))).json()
+    assert listing["total"] == 2
+    assert listing["unread_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_read_all_covers_personal_and_broadcast(client: AsyncClient, sample_user, auth_headers, db_session):
+    """read-all clears personal rows and advances the broadcast cursor."""
+    lead = await sample_user("team_lead", username="lead_all")
+    db_session.add(Notification(user_id=lead.id, type=NotificationType.SYSTEM, title="Personal"))
+    await _broadcast(db_session, UserRole.TEAM_LEAD, "Broadcast")
+    await db_session.commit()
+
+    headers = auth_headers(lead)
+    assert (await client.get("/api/v1/notifications/unread/count", headers=headers)).json()["count"] == 2
+    resp = await client.put("/api/v1/notifications/read-all", headers=headers)
+    assert resp.status_code == 200
+    assert (await client.get("/api/v1/notifications/unread/count", headers=headers)).json()["count"] == 0
@@ -1,9 +1,14 @@
 """Tests for transfer CRUD endpoints."""
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 
+from backend.app.models.approval import Approval, ApprovalStatus
+from backend.app.models.transfer import TransferFile
 from backend.app.models.user import User
 
 
@@ -27,6 +32,22 @@ async def test_create_transfer(client: AsyncClient, sample_user, auth_headers, d
     assert data["artist_name"] == user.display_name
 
 
+@pytest.mark.asyncio
+async def test_created_references_are_unique(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    """References don't depend on the latest row's reference, so odd ones can't derail numbering."""
+    user = await sample_user("artist")
+    await sample_transfer(user, reference="TRF-LEGACY")
+    await db_session.commit()
+
+    refs = []
+    for i in range(3):
+        resp = await client.post("/api/v1/transfers/", json={"name": f"Package {i}"}, headers=auth_headers(user))
+        assert resp.status_code == 201
+        refs.append(resp.json()["reference"])
+    assert len(set(refs)) == 3
+    assert all(ref.startswith("TRF-") and ref[4:].isdigit() for ref in refs)
+
+
 @pytest.mark.asyncio
 async def test_list_own_transfers(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
     """Artist only sees their own transfers."""
@@ -80,3 +101,257 @@ async def test_unauthorized_create(client: AsyncClient):
         "name": "Should fail",
     })
     assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_list_returns_summaries(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    """List rows carry the compact approval chain but no file records."""
+    artist = await sample_user("artist", username="art_sum")
+    lead = await sample_user("team_lead", username="lead_sum")
+    transfer = await sample_transfer(artist, reference="TRF-S001", status="pending_supervisor")
+    db_session.add(TransferFile(
+        transfer_id=transfer.id, filename="a.exr", original_path="a.exr", size_bytes=2048,
+    ))
+    first = (await db_session.execute(
+        select(Approval).where(Approval.transfer_id == transfer.id).order_by(Approval.id)
+    )).scalars().first()
+    first.status = ApprovalStatus.APPROVED
+    first.approver_id = lead.id
+    await db_session.commit()
+
+    resp = await client.get("/api/v1/transfers/", headers=auth_headers(artist))
+    item = resp.json()["items"][0]
+    assert "files" not in item
+    assert item["artist_name"] == artist.display_name
+    assert [s["role"] for s in item["approval_chain"]][:2] == ["team_lead", "supervisor"]
+    assert item["approval_chain"][0] == {
+        "role": "team_lead", "status": "approved", "approver_name": lead.display_name,
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_cursor_pagination(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    """Cursor pages walk (created_at, id) newest-first with no gaps or repeats, ties included."""
+    admin = await sample_user("admin", username="page_admin")
+    artist = await sample_user("artist", username="page_artist")
+    same_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    transfers = []
+    for i in range(5):
+        t = await sample_transfer(artist, reference=f"TRF-PG{i:03d}")
+        t.created_at = same_time if i < 3 else same_time + timedelta(minutes=i)
+        transfers.append(t)
+    await db_session.commit()
+    headers = auth_headers(admin)
+
+    expected = [t.id for t in sorted(transfers, key=lambda t: (t.created_at, t.id), reverse=True)]
+    seen, cursor = [], None
+    while True:
+        params = {"per_page": 2, "count": "none"}
+        if cursor:
+            params["cursor"] = cursor
+        data = (await client.get("/api/v1/transfers/", params=params, headers=headers)).json()
+        assert data["total"] is None
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected
+
+    resp = await client.get("/api/v1/transfers/", params={"count": "estimated"}, headers=headers)
+    assert resp.json()["total"] == 5
+    # No planner here, so the count is exact and says so.
+    assert resp.json()["total_estimated"] is False
+
+    resp = await client.get("/api/v1/transfers/", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_and_autocomplete(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    """Search covers descriptive text; autocomplete suggests visible references and shot codes."""
+    artist = await sample_user("artist", username="ac_artist")
+    other = await sample_user("artist", username="ac_other")
+    mine = await sample_transfer(artist, reference="TRF-AC010", name="Hero plate")
+    mine.shotgrid_entity_name = "SH_010"
+    mine.notes = "needs denoise pass"
+    theirs = await sample_transfer(other, reference="TRF-AC011", name="Other plate")
+    theirs.shotgrid_entity_name = "SH_011"
+    lookalike = await sample_transfer(other, reference="TRF-AC012")
+    lookalike.shotgrid_entity_name = "SHA012"
+    await db_session.commit()
+    headers = auth_headers(artist)
+
+    data = (await client.get("/api/v1/transfers/", params={"search": "denoise"}, headers=headers)).json()
+    assert [t["reference"] for t in data["items"]] == ["TRF-AC010"]
+
+    resp = await client.get("/api/v1/transfers/autocomplete", params={"q": "ac01"}, headers=headers)
+    assert resp.status_code == 200
+    assert [r["reference"] for r in resp.json()["references"]] == ["TRF-AC010"]
+
+    # "_" is matched literally rather than as a LIKE wildcard.
+    resp = await client.get("/api/v1/transfers/autocomplete", params={"q": "SH_0"}, headers=auth_headers(other))
+    assert resp.json()["shots"] == ["SH_011"]
+
+
+async def _add_files(db_session, transfer, specs):
+    from datetime import datetime, timedelta, timezone
+
+    from backend.app.models.transfer import TransferFile
+
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i, (name, scan, verified) in enumerate(specs):
+        db_session.add(TransferFile(
+            transfer_id=transfer.id, filename=name, original_path=f"/staging/{name}",
+            size_bytes=100, virus_scan_status=scan, checksum_verified=verified,
+            uploaded_at=start + timedelta(seconds=i),
+        ))
+    await db_session.flush()
+
+
+@pytest.mark.asyncio
+async def test_list_files_pages_and_filters(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    artist = await sample_user("artist")
+    transfer = await sample_transfer(artist)
+    await _add_files(db_session, transfer, [
+        (f"plate_{i:03d}.exr", "clean" if i % 2 else "pending", True if i < 3 else None) for i in range(7)
+    ] + [("ref_100%.mov", "infected", False)])
+    headers = auth_headers(artist)
+    url = f"/api/v1/transfers/{transfer.id}/files"
+
+    names, cursor = [], None
+    while True:
+        params = {"per_page": 3, **({"cursor": cursor} if cursor else {})}
+        page = (await client.get(url, params=params, headers=headers)).json()
+        names += [f["filename"] for f in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert names == ["ref_100%.mov"] + [f"plate_{i:03d}.exr" for i in reversed(range(7))]
+
+    async def filtered(**params):
+        resp = await client.get(url, params=params, headers=headers)
+        return [f["filename"] for f in resp.json()["items"]]
+
+    assert await filtered(scan_status="infected") == ["ref_100%.mov"]
+    assert await filtered(checksum="verified", scan_status="clean") == ["plate_001.exr"]
+    assert len(await filtered(checksum="unchecked")) == 4
+    assert await filtered(name_prefix="ref_100%") == ["ref_100%.mov"]
+    assert await filtered(name_prefix="ref_1000") == []
+
+    other = await sample_user("artist", username="not_the_owner")
+    resp = await client.get(url, headers=auth_headers(other))
+    assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_stream_files_ndjson(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session, monkeypatch):
+    import json
+
+    from backend.app.core.config import settings
+
+    monkeypatch.setattr(settings, "DATABASE_STREAM_BATCH_SIZE", 2)
+    artist = await sample_user("artist")
+    transfer = await sample_transfer(artist)
+    await _add_files(db_session, transfer, [(f"f{i}.exr", "clean", None) for i in range(5)])
+
+    resp = await client.get(
+        f"/api/v1/transfers/{transfer.id}/files/stream",
+        params={"name_prefix": "f"},
+        headers=auth_headers(artist),
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [f["filename"] for f in lines] == [f"f{i}.exr" for i in reversed(range(5))]
+
+
+@pytest.mark.asyncio
+async def test_export_manifest_csv(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    import csv
+    import io
+
+    artist = await sample_user("artist")
+    transfer = await sample_transfer(artist, reference="TRF-MAN01")
+    await _add_files(db_session, transfer, [("a.exr", "clean", True), ("b, final.exr", "pending", None)])
+
+    resp = await client.get(f"/api/v1/transfers/{transfer.id}/manifest", headers=auth_headers(artist))
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert 'filename="TRF-MAN01-manifest.csv"' in resp.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [r["filename"] for r in rows] == ["a.exr", "b, final.exr"]
+    assert rows[0]["checksum_verified"] == "True"
+    assert rows[1]["checksum_verified"] == ""
+
+
+@pytest.mark.asyncio
+async def test_sparse_fieldsets(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session, captured_sql):
+    """``fields=`` narrows the payload and skips the joins and loads it doesn't need."""
+    artist = await sample_user("artist")
+    transfer = await sample_transfer(artist, reference="TRF-FS001")
+    await _add_files(db_session, transfer, [("a.exr", "clean", True)])
+    headers = auth_headers(artist)
+
+    with captured_sql("SELECT") as statements:
+        resp = await client.get("/api/v1/transfers/", params={"fields": "reference,status,priority"}, headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["items"] == [
+        {"id": transfer.id, "reference": "TRF-FS001", "status": "pending_team_lead", "priority": "normal"}
+    ]
+    assert not any("approvals" in sql or "JOIN users" in sql for sql, _ in statements)
+
+    with captured_sql("SELECT") as statements:
+        resp = await client.get(f"/api/v1/transfers/{transfer.id}", params={"fields": "reference,size_display"}, headers=headers)
+    assert resp.json() == {"id": transfer.id, "reference": "TRF-FS001", "size_display": "0.0 B"}
+    assert not any("FROM transfer_files" in sql or "FROM approvals" in sql for sql, _ in statements)
+
+    resp = await client.get(f"/api/v1/transfers/{transfer.id}", params={"fields": "files,artist_name"}, headers=headers)
+    assert [f["filename"] for f in resp.json()["files"]] == ["a.exr"]
+    assert resp.json()["artist_name"] == artist.display_name
+
+    resp = await client.get("/api/v1/transfers/", params={"fields": "reference,secret"}, headers=headers)
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Unknown field(s): secret"
+
+
+@pytest.mark.asyncio
+async def test_batch_fetch_applies_visibility_once(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session, captured_sql):
+    artist = await sample_user("artist")
+    other = await sample_user("artist", username="batch_other")
+    mine = [await sample_transfer(artist, reference=f"TRF-BT{i}") for i in range(3)]
+    theirs = await sample_transfer(other, reference="TRF-BTX")
+    ids = [t.id for t in mine] + [theirs.id, 999999]
+
+    with captured_sql("SELECT") as statements:
+        resp = await client.get(
+            "/api/v1/transfers/batch",
+            params={"ids": ",".join(map(str, ids + [mine[0].id])), "fields": "reference,status"},
+            headers=auth_headers(artist),
+        )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["items"] == {
+        str(t.id): {"id": t.id, "reference": t.reference, "status": "pending_team_lead"} for t in mine
+    }
+    assert data["missing"] == [theirs.id, 999999]
+    assert len([sql for sql, _ in statements if "FROM transfers" in sql]) == 1
+
+    resp = await client.get("/api/v1/transfers/batch", params={"ids": "1,x"}, headers=auth_headers(artist))
+    assert resp.status_code == 400
+    resp = await client.get(
+        "/api/v1/transfers/batch", params={"ids": ",".join(map(str, range(1, 202)))}, headers=auth_headers(artist),
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_progress_requires_visibility(client: AsyncClient, sample_user, auth_headers, sample_transfer, db_session):
+    artist = await sample_user("artist")
+    other = await sample_user("artist", username="progress_other")
+    transfer = await sample_transfer(artist)
+
+    resp = await client.get(f"/api/v1/transfer-ops/{transfer.id}/progress", headers=auth_headers(other))
+    assert resp.status_code == 403
+    resp = await client.get(f"/api/v1/transfer-ops/{transfer.id}/progress", headers=auth_headers(artist))
+    assert resp.status_code == 200
+    assert resp.json()["transfer_id"] == transfer.id
@@ -0,0 +1,10 @@
+import apiClient from "./client";
+import type { DashboardSummary } from "@/types";
+
+export const dashboardApi = {
+  /** Stats, pending approvals, unread notifications and recent transfers in one request. */
+  get: async (): Promise<DashboardSummary> => {
+    const { data } = await apiClient.get<DashboardSummary>("/dashboard/");
+    return data;
+  },
+};
@@ -1,5 +1,5 @@
 import apiClient from "./client";
-import type { Transfer, TransferListResponse, TransferStats } from "@/types";
+import type { Transfer, TransferBatchResponse, TransferListResponse, TransferStats } from "@/types";
 
 interface TransferCreatePayload {
   name: string;
@@ -17,6 +17,8 @@ interface TransferListParams {
   search?: string;
   page?: number;
   per_page?: number;
+  /** Comma-separated TransferSummary fields; omit for all of them. */
+  fields?: string;
 }
 
 export const transfersApi = {
@@ -30,6 +32,14 @@ export const transfersApi = {
     return data;
   },
 
+  /** Summaries for up to 200 ids in one request; hidden or unknown ids come back in `missing`. */
+  batch: async (ids: number[], fields?: string): Promise<TransferBatchResponse> => {
+    const { data } = await apiClient.get<TransferBatchResponse>("/transfers/batch", {
+      params: { ids: ids.join(","), fields },
+    });
+    return data;
+  },
+
   create: async (payload: TransferCreatePayload): Promise<Transfer> => {
     const { data } = await apiClient.post<Transfer>("/transfers/", payload);
     return data;
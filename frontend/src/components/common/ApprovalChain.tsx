@@ -1,9 +1,9 @@
 import { Check, X } from "lucide-react";
 import { clsx } from "clsx";
-import type { ApprovalChainItem } from "@/types";
+import type { ApprovalStageSummary } from "@/types";
 
 interface Props {
-  approvals: ApprovalChainItem[];
+  approvals: ApprovalStageSummary[];
   compact?: boolean;
 }
 
@@ -23,7 +23,7 @@ const ROLE_LABELS: Record<string, string> = {
   it_team: "IT Team",
 };
 
-function isCurrentStage(item: ApprovalChainItem, allItems: ApprovalChainItem[]): boolean {
+function isCurrentStage(item: ApprovalStageSummary, allItems: ApprovalStageSummary[]): boolean {
   if (item.status !== "pending") return false;
   const idx = allItems.indexOf(item);
   return idx === 0 || allItems[idx - 1]?.status === "approved" || allItems[idx - 1]?.status === "skipped";
@@ -3,6 +3,7 @@ import { Navigate, Outlet } from "react-router-dom";
 import { useAuthStore } from "@/store/authStore";
 import { useNotificationStore } from "@/store/notificationStore";
 import { useApprovalStore } from "@/store/approvalStore";
+import { useEventStream } from "@/hooks/useEventStream";
 import LoadingSpinner from "@/components/common/LoadingSpinner";
 import Sidebar from "./Sidebar";
 
@@ -10,19 +11,21 @@ export default function AppLayout() {
   const { isAuthenticated, isLoading, user } = useAuthStore();
   const { fetchUnreadCount } = useNotificationStore();
   const { fetchPendingCount } = useApprovalStore();
+  const streaming = useEventStream(!!user);
 
   useEffect(() => {
-    if (!user) return;
+    if (!user || streaming) return;
     fetchUnreadCount();
     fetchPendingCount();
 
+    // Only poll while the event stream is down.
     const interval = setInterval(() => {
       fetchUnreadCount();
       fetchPendingCount();
     }, 30_000);
 
     return () => clearInterval(interval);
-  }, [user, fetchUnreadCount, fetchPendingCount]);
+  }, [user, streaming, fetchUnreadCount, fetchPendingCount]);
 
   if (isLoading && !user) {
     return (
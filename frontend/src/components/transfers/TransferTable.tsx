@@ -7,10 +7,10 @@ import ApprovalChain from "@/components/common/ApprovalChain";
 import EmptyState from "@/components/common/EmptyState";
 import { formatFileSize, formatRelativeTime } from "@/utils/formatters";
 import { useRole } from "@/hooks/useAuth";
-import type { Transfer } from "@/types";
+import type { TransferSummary } from "@/types";
 
 interface Props {
-  transfers: Transfer[];
+  transfers: TransferSummary[];
   showCategory?: boolean;
   showApprovalActions?: boolean;
   onApprove?: (id: number) => void;
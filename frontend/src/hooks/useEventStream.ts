@@ -0,0 +1,91 @@
+import { useEffect, useState } from "react";
+import apiClient from "@/api/client";
+import { useApprovalStore } from "@/store/approvalStore";
+import { useNotificationStore } from "@/store/notificationStore";
+import { useTransferStore } from "@/store/transferStore";
+import type { Notification, TransferStatus } from "@/types";
+
+const RECONNECT_MS = 5000;
+
+/**
+ * Subscribes to /events/stream while `enabled` and applies the pushed deltas
+ * to the stores. Returns whether the stream is currently connected so callers
+ * can fall back to polling.
+ */
+export function useEventStream(enabled: boolean) {
+  const [connected, setConnected] = useState(false);
+
+  useEffect(() => {
+    if (!enabled || !localStorage.getItem("access_token")) return;
+
+    let source: EventSource | null = null;
+    let retry: ReturnType<typeof setTimeout> | undefined;
+    let closed = false;
+
+    // The stream takes a short-lived ticket rather than the access token, so
+    // a reconnect after the ticket expires needs a fresh one.
+    const connect = async () => {
+      let ticket: string;
+      try {
+        ({ data: { ticket } } = await apiClient.post<{ ticket: string }>("/events/ticket"));
+      } catch {
+        if (!closed) retry = setTimeout(connect, RECONNECT_MS);
+        return;
+      }
+      if (closed) return;
+      source = new EventSource(`/api/v1/events/stream?ticket=${encodeURIComponent(ticket)}`);
+      listen(source);
+    };
+
+    const listen = (source: EventSource) => {
+      const notifications = useNotificationStore.getState();
+      const parse = (e: Event) => JSON.parse((e as MessageEvent).data);
+
+      source.addEventListener("ready", (e) => {
+        setConnected(true);
+        notifications.setUnreadCount(parse(e).unread_count);
+        useApprovalStore.getState().fetchPendingCount();
+      });
+      source.addEventListener("notification.created", (e) => {
+        notifications.pushNotification(parse(e).notification as Notification);
+      });
+      source.addEventListener("notification.read", (e) => {
+        const data = parse(e);
+        if (data.all) {
+          notifications.applyRead("all");
+        } else if (data.up_to !== undefined) {
+          notifications.applyBroadcastRead(data.up_to);
+          notifications.fetchUnreadCount();
+        } else {
+          notifications.applyRead(data.ids as number[]);
+        }
+      });
+      source.addEventListener("transfer.status", (e) => {
+        const data = parse(e);
+        useTransferStore.getState().applyStatus(data.transfer_id, data.status as TransferStatus);
+        useApprovalStore.getState().fetchPendingCount();
+      });
+      source.addEventListener("resync", () => {
+        notifications.fetchUnreadCount();
+        useApprovalStore.getState().fetchPendingCount();
+      });
+      source.onerror = () => {
+        setConnected(false);
+        if (source.readyState === EventSource.CLOSED && !closed) {
+          retry = setTimeout(connect, RECONNECT_MS);
+        }
+      };
+    };
+
+    connect();
+
+    return () => {
+      closed = true;
+      clearTimeout(retry);
+      source?.close();
+      setConnected(false);
+    };
+  }, [enabled]);
+
+  return connected;
+}
@@ -10,21 +10,21 @@ import LoadingSpinner from "@/components/common/LoadingSpinner";
 import ApprovalModal from "@/components/approvals/ApprovalModal";
 import { useApprovalStore } from "@/store/approvalStore";
 import { formatRelativeTime } from "@/utils/formatters";
-import type { Transfer } from "@/types";
+import type { TransferSummary } from "@/types";
 
 export default function ApprovalsPage() {
   const navigate = useNavigate();
   const { pendingApprovals, pendingCount, isLoading, fetchPending, approve, reject } =
     useApprovalStore();
 
-  const [modalTransfer, setModalTransfer] = useState<Transfer | null>(null);
+  const [modalTransfer, setModalTransfer] = useState<TransferSummary | null>(null);
   const [modalMode, setModalMode] = useState<"approve" | "reject">("approve");
 
   useEffect(() => {
     fetchPending();
   }, [fetchPending]);
 
-  const openModal = (transfer: Transfer, mode: "approve" | "reject") => {
+  const openModal = (transfer: TransferSummary, mode: "approve" | "reject") => {
     setModalTransfer(transfer);
     setModalMode(mode);
   };
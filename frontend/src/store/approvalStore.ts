@@ -1,9 +1,9 @@
 import { create } from "zustand";
 import apiClient from "@/api/client";
-import type { Transfer } from "@/types";
+import type { BulkApprovalResult, Transfer, TransferSummary } from "@/types";
 
 interface ApprovalState {
-  pendingApprovals: Transfer[];
+  pendingApprovals: TransferSummary[];
   pendingCount: number;
   isLoading: boolean;
 
@@ -11,6 +11,8 @@ interface ApprovalState {
   fetchPendingCount: () => Promise<void>;
   approve: (transferId: number, comment?: string) => Promise<Transfer>;
   reject: (transferId: number, reason: string) => Promise<Transfer>;
+  bulkApprove: (transferIds: number[], comment?: string) => Promise<BulkApprovalResult>;
+  bulkReject: (transferIds: number[], reason: string) => Promise<BulkApprovalResult>;
 }
 
 export const useApprovalStore = create<ApprovalState>((set, get) => ({
@@ -21,7 +23,7 @@ export const useApprovalStore = create<ApprovalState>((set, get) => ({
   fetchPending: async () => {
     set({ isLoading: true });
     try {
-      const { data } = await apiClient.get<Transfer[]>("/approvals/pending");
+      const { data } = await apiClient.get<TransferSummary[]>("/approvals/pending");
       set({ pendingApprovals: data, pendingCount: data.length, isLoading: false });
     } catch {
       set({ isLoading: false });
@@ -54,4 +56,22 @@ export const useApprovalStore = create<ApprovalState>((set, get) => ({
     await get().fetchPending();
     return data;
   },
+
+  bulkApprove: async (transferIds, comment) => {
+    const { data } = await apiClient.post<BulkApprovalResult>(
+      "/approvals/bulk/approve",
+      { transfer_ids: transferIds, comment: comment ?? null },
+    );
+    await get().fetchPending();
+    return data;
+  },
+
+  bulkReject: async (transferIds, reason) => {
+    const { data } = await apiClient.post<BulkApprovalResult>(
+      "/approvals/bulk/reject",
+      { transfer_ids: transferIds, reason },
+    );
+    await get().fetchPending();
+    return data;
+  },
 }));
@@ -11,9 +11,13 @@ interface NotificationState {
   fetchUnreadCount: () => Promise<void>;
   markAsRead: (id: number) => Promise<void>;
   markAllRead: () => Promise<void>;
+  setUnreadCount: (count: number) => void;
+  pushNotification: (notification: Notification) => void;
+  applyRead: (ids: number[] | "all") => void;
+  applyBroadcastRead: (upTo: number) => void;
 }
 
-export const useNotificationStore = create<NotificationState>((set) => ({
+export const useNotificationStore = create<NotificationState>((set, get) => ({
   notifications: [],
   unreadCount: 0,
   isLoading: false,
@@ -49,6 +53,12 @@ export const useNotificationStore = create<NotificationState>((set) => ({
   markAsRead: async (id) => {
     try {
       await apiClient.put(`/notifications/${id}/read`);
+      const target = get().notifications.find((n) => n.id === id);
+      if (target?.target_role) {
+        // Reading a broadcast also marks every older broadcast as read.
+        get().applyBroadcastRead(id);
+        return;
+      }
       set((state) => ({
         notifications: state.notifications.map((n) =>
           n.id === id ? { ...n, is_read: true } : n,
@@ -71,4 +81,44 @@ export const useNotificationStore = create<NotificationState>((set) => ({
       // Retry silently
     }
   },
+
+  setUnreadCount: (count) => set({ unreadCount: count }),
+
+  pushNotification: (notification) =>
+    set((state) => ({
+      notifications: [notification, ...state.notifications],
+      unreadCount: state.unreadCount + (notification.is_read ? 0 : 1),
+    })),
+
+  applyRead: (ids) =>
+    set((state) => {
+      if (ids === "all") {
+        return {
+          notifications: state.notifications.map((n) => ({ ...n, is_read: true })),
+          unreadCount: 0,
+        };
+      }
+      const newlyRead = state.notifications.filter(
+        (n) => ids.includes(n.id) && !n.is_read,
+      ).length;
+      return {
+        notifications: state.notifications.map((n) =>
+          ids.includes(n.id) ? { ...n, is_read: true } : n,
+        ),
+        unreadCount: Math.max(0, state.unreadCount - (newlyRead || ids.length)),
+      };
+    }),
+
+  applyBroadcastRead: (upTo) =>
+    set((state) => {
+      const newlyRead = state.notifications.filter(
+        (n) => n.target_role !== null && n.id <= upTo && !n.is_read,
+      ).length;
+      return {
+        notifications: state.notifications.map((n) =>
+          n.target_role !== null && n.id <= upTo ? { ...n, is_read: true } : n,
+        ),
+        unreadCount: Math.max(0, state.unreadCount - newlyRead),
+      };
+    }),
 }));
@@ -1,6 +1,6 @@
 import { create } from "zustand";
 import { transfersApi } from "@/api/transfers";
-import type { Transfer, TransferStats } from "@/types";
+import type { Transfer, TransferStats, TransferStatus, TransferSummary } from "@/types";
 
 interface Pagination {
   page: number;
@@ -10,7 +10,7 @@ interface Pagination {
 }
 
 interface TransferState {
-  transfers: Transfer[];
+  transfers: TransferSummary[];
   currentTransfer: Transfer | null;
   stats: TransferStats | null;
   isLoading: boolean;
@@ -35,6 +35,7 @@ interface TransferState {
     shotgrid_entity_type?: string;
     shotgrid_entity_id?: number;
   }) => Promise<Transfer>;
+  applyStatus: (transferId: number, status: TransferStatus) => void;
 }
 
 export const useTransferStore = create<TransferState>((set, get) => ({
@@ -94,4 +95,15 @@ export const useTransferStore = create<TransferState>((set, get) => ({
     await get().fetchTransfers();
     return transfer;
   },
+
+  applyStatus: (transferId, status) =>
+    set((state) => ({
+      transfers: state.transfers.map((t) =>
+        t.id === transferId ? { ...t, status } : t,
+      ),
+      currentTransfer:
+        state.currentTransfer?.id === transferId
+          ? { ...state.currentTransfer, status }
+          : state.currentTransfer,
+    })),
 }));
@@ -121,12 +121,53 @@ export interface Transfer {
   size_display: string;
 }
 
+export interface BulkApprovalResult {
+  updated: number[];
+  skipped: { transfer_id: number; detail: string }[];
+}
+
+export type ApprovalStageSummary = Pick<ApprovalChainItem, "role" | "status" | "approver_name">;
+
+export interface TransferSummary
+  extends Pick<
+    Transfer,
+    | "id"
+    | "reference"
+    | "name"
+    | "category"
+    | "status"
+    | "priority"
+    | "artist_id"
+    | "artist_name"
+    | "total_files"
+    | "total_size_bytes"
+    | "size_display"
+    | "shotgrid_entity_name"
+    | "rejection_reason"
+    | "created_at"
+    | "updated_at"
+  > {
+  approval_chain: ApprovalStageSummary[];
+}
+
 export interface TransferListResponse {
-  items: Transfer[];
+  items: TransferSummary[];
   total: number;
+  total_estimated: boolean;
   page: number;
   per_page: number;
   pages: number;
+  next_cursor: string | null;
+}
+
+export interface TransferBatchResponse {
+  items: Record<number, TransferSummary>;
+  missing: number[];
+}
+
+export interface TransferAutocomplete {
+  references: Pick<TransferSummary, 'id' | 'reference' | 'name'>[];
+  shots: string[];
 }
 
 export interface TransferStats {
@@ -139,9 +180,17 @@ export interface TransferStats {
   avg_time_hours: number | null;
 }
 
+export interface DashboardSummary {
+  stats: TransferStats;
+  pending_approvals: number;
+  unread_notifications: number;
+  recent_transfers: TransferSummary[];
+}
+
 export interface Notification {
   id: number;
   transfer_id: number | null;
+  target_role: UserRole | null;
   type: string;
   title: string;
   message: string | null;
@@ -153,6 +202,7 @@ export interface NotificationListResponse {
   items: Notification[];
   total: number;
   unread_count: number;
+  next_cursor: string | null;
 }
 
 export interface HistoryEntry {
@@ -160,6 +210,7 @@ export interface HistoryEntry {
   transfer_id: number;
   user_id: number | null;
   action: string;
+  status: TransferStatus | null;
   description: string | null;
   metadata_json: Record<string, unknown> | null;
   ip_address: string | null;
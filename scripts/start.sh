@@ -10,11 +10,13 @@ fi
 # Activate venv
 source backend/.venv/bin/activate
 
-# Start Celery worker in background
+# Start Celery worker and the (single) beat scheduler in background
 echo "Starting Celery worker..."
 cd backend
-celery -A app.core.celery_app worker -l info -Q scanning,transfer,notifications &
+celery -A app.core.celery_app worker -l info -Q default,scanning,transfer,notifications &
 CELERY_PID=$!
+celery -A app.core.celery_app beat -l info &
+BEAT_PID=$!
 cd ..
 
 # Start FastAPI server
@@ -24,4 +26,4 @@ uvicorn app.main:app --host ${HOST:-0.0.0.0} --port ${PORT:-8000} --workers 4
 cd ..
 
 # Cleanup on exit
-trap "kill $CELERY_PID 2>/dev/null" EXIT
+trap "kill $CELERY_PID $BEAT_PID 2>/dev/null" EXIT
@@ -1,4 +1,4 @@
 #!/bin/bash
 source backend/.venv/bin/activate
 cd backend
-celery -A app.core.celery_app worker -l info -Q scanning,transfer,notifications --concurrency=4
+celery -A app.core.celery_app worker -l info -Q default,scanning,transfer,notifications --concurrency=4
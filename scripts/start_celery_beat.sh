@@ -0,0 +1,5 @@
+#!/bin/bash
+# The periodic task scheduler. Run exactly one, separately from the workers.
+source backend/.venv/bin/activate
+cd backend
+celery -A app.core.celery_app beat -l info